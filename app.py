@@ -1,9 +1,55 @@
 import os
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify, request
+
+from src.loja_online.main import carregar_catalogo, carregar_loja
+from src.loja_online.serializacao import PEDIDO, PRODUTO, CacheRespostas
 
 # Expor um app WSGI chamado `app` para gunicorn/render
 app = Flask(__name__)
 
+# Partida a quente: com LOJA_SNAPSHOT definido, a loja é carregada do snapshot
+loja = carregar_loja()
+
+# Catálogo somente leitura mapeado em memória (LOJA_CATALOGO): as páginas do
+# arquivo são compartilhadas entre os workers do gunicorn em vez de copiadas.
+# Quando configurado, as consultas de produtos (GET) são servidas por ele;
+# pedidos continuam reservando o estoque da `loja`.
+catalogo = carregar_catalogo()
+
+# Corpos JSON já codificados, reaproveitados enquanto o objeto não muda
+respostas = CacheRespostas()
+
+
+def _responder(corpo, marca, status=200):
+    if status == 200 and marca in request.if_none_match:
+        resposta = Response(status=304)
+    else:
+        resposta = Response(corpo, status=status, mimetype="application/json")
+    resposta.set_etag(marca)
+    return resposta
+
+
+def _erro(mensagem, status):
+    return jsonify({"erro": mensagem}), status
+
+
+def _buscar_produto(produto_id):
+    if catalogo is not None:
+        return catalogo.get(produto_id)
+    return loja.buscar_produto(produto_id)
+
+
+def _buscar_por_nome(termo, limite=None):
+    if catalogo is not None:
+        return catalogo.buscar_por_nome(termo, limite=limite)
+    return loja.buscar_produtos(termo, limite=limite)
+
+
+def _buscar_por_preco(minimo, maximo, limite):
+    if catalogo is not None:
+        return catalogo.buscar_por_preco(minimo, maximo, limite=limite)
+    return loja.buscar_produtos_por_preco(minimo, maximo, limite=limite)
+
 
 @app.route("/health")
 def health():
@@ -11,6 +57,73 @@ def health():
     return jsonify({"status": "ok"}), 200
 
 
+@app.route("/produtos/<int:produto_id>")
+def buscar_produto(produto_id):
+    """Retorna um produto por id, com ETag para GET condicional."""
+    produto = _buscar_produto(produto_id)
+    if produto is None:
+        return _erro("Produto não encontrado", 404)
+    return _responder(*respostas.obter(("produto", produto_id), PRODUTO, produto))
+
+
+@app.route("/produtos")
+def buscar_produtos():
+    """Busca produtos por nome (?busca=) e/ou faixa de preço (?preco_min=&preco_max=)."""
+    termo = request.args.get("busca")
+    minimo = request.args.get("preco_min", type=float)
+    maximo = request.args.get("preco_max", type=float)
+    limite = request.args.get("limite", 100, type=int)
+
+    if termo and minimo is None and maximo is None:
+        produtos = _buscar_por_nome(termo, limite=limite)
+    elif termo:
+        produtos = [p for p in _buscar_por_nome(termo)
+                    if (minimo is None or p.preco >= minimo) and (maximo is None or p.preco <= maximo)]
+        produtos = produtos[:limite]
+    else:
+        produtos = _buscar_por_preco(minimo, maximo, limite)
+    return _responder(*respostas.obter_lista("produto", PRODUTO, produtos))
+
+
+@app.route("/pedidos/<int:pedido_id>")
+def buscar_pedido(pedido_id):
+    """Retorna um pedido com seus itens, com ETag para GET condicional."""
+    pedido = loja.buscar_pedido(pedido_id)
+    if pedido is None:
+        return _erro("Pedido não encontrado", 404)
+    return _responder(*respostas.obter(("pedido", pedido_id), PEDIDO, pedido))
+
+
+@app.route("/pedidos", methods=["POST"])
+def criar_pedido():
+    """Cria e confirma um pedido: {"cliente_id": 1, "itens": [{"produto_id": 1, "quantidade": 2}]}."""
+    dados = request.get_json(silent=True) or {}
+    try:
+        itens = [(int(item["produto_id"]), int(item["quantidade"])) for item in dados["itens"]]
+        cliente = loja.buscar_cliente(int(dados["cliente_id"]))
+    except (KeyError, TypeError, ValueError):
+        return _erro("Corpo inválido", 400)
+    if not itens or any(quantidade <= 0 for _, quantidade in itens):
+        return _erro("Corpo inválido", 400)
+    if cliente is None:
+        return _erro("Cliente não encontrado", 404)
+    produtos = [loja.buscar_produto(produto_id) for produto_id, _ in itens]
+    if any(produto is None for produto in produtos):
+        return _erro("Produto não encontrado", 404)
+    if not loja.estoque.reservar_itens(itens):
+        return _erro("Estoque insuficiente", 409)
+
+    pedido = loja.criar_pedido(cliente.id)
+    for produto, (_, quantidade) in zip(produtos, itens):
+        pedido.adicionar_item(produto, quantidade)
+    pedido.confirmar_pedido()
+    cliente.adicionar_compra(pedido)
+
+    resposta = _responder(*respostas.obter(("pedido", pedido.id), PEDIDO, pedido), status=201)
+    resposta.headers["Location"] = f"/pedidos/{pedido.id}"
+    return resposta
+
+
 def create_app():
     """Factory caso a aplicação precise ser criada programaticamente."""
     return app
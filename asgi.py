@@ -0,0 +1,75 @@
+import json
+import os
+
+from src.loja_online.carrinho import Carrinho
+from src.loja_online.gateway_pagamento import FalhaGateway, GatewaySimulado
+from src.loja_online.loja_assincrona import LojaAssincrona
+from src.loja_online.main import carregar_loja
+
+# Entrada ASGI (uvicorn/hypercorn: `uvicorn asgi:app`) ao lado do app WSGI
+# do Flask. O checkout aguarda o gateway sem ocupar uma thread por pedido.
+loja = carregar_loja()
+loja_assincrona = LojaAssincrona(
+    loja, GatewaySimulado(latencia=float(os.environ.get("LOJA_GATEWAY_LATENCIA", 0))))
+
+
+async def _ler_corpo(receive):
+    corpo = b""
+    while True:
+        mensagem = await receive()
+        corpo += mensagem.get("body", b"")
+        if not mensagem.get("more_body"):
+            return corpo
+
+
+async def _responder(send, status, dados):
+    corpo = json.dumps(dados, ensure_ascii=False).encode("utf-8")
+    await send({"type": "http.response.start", "status": status,
+                "headers": [(b"content-type", b"application/json"),
+                            (b"content-length", str(len(corpo)).encode())]})
+    await send({"type": "http.response.body", "body": corpo})
+
+
+async def _checkout(receive, send):
+    try:
+        dados = json.loads(await _ler_corpo(receive))
+        cliente_id = int(dados["cliente_id"])
+        endereco = dados["endereco"]
+        if loja.buscar_cliente(cliente_id) is None:
+            return await _responder(send, 404, {"erro": "Cliente não encontrado"})
+        carrinho = Carrinho()
+        for item in dados["itens"]:
+            produto = loja.buscar_produto(int(item["produto_id"]))
+            if produto is None:
+                return await _responder(send, 404, {"erro": "Produto não encontrado"})
+            carrinho.adicionar_produto(produto, int(item["quantidade"]))
+        resultado = await loja_assincrona.finalizar_compra(cliente_id, carrinho, endereco)
+    except (KeyError, TypeError, ValueError):
+        return await _responder(send, 400, {"erro": "Corpo inválido"})
+    except FalhaGateway:
+        # O checkout já devolveu o estoque e cancelou o pedido
+        return await _responder(send, 502, {"erro": "Gateway de pagamento indisponível"})
+
+    if resultado is None:
+        return await _responder(send, 409, {"erro": "Estoque insuficiente"})
+    pedido, pagamento, _ = resultado
+    status = 201 if pagamento.status == "processado" else 402
+    await _responder(send, status, {"pedido_id": pedido.id, "status": pedido.status,
+                                    "total": pedido.total, "pagamento": pagamento.status})
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while True:
+            mensagem = await receive()
+            if mensagem["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif mensagem["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    if scope["path"] == "/health" and scope["method"] == "GET":
+        return await _responder(send, 200, {"status": "ok"})
+    if scope["path"] == "/checkout" and scope["method"] == "POST":
+        return await _checkout(receive, send)
+    await _responder(send, 404, {"erro": "Rota não encontrada"})
@@ -10,6 +10,9 @@ setup(
     packages=find_packages(where="src"),
     python_requires=">=3.8",
     install_requires=[],
+    extras_require={
+        "colunar": ["numpy>=1.21"],
+    },
     entry_points={
         "console_scripts": [
             "loja-online=loja_online.main:main",
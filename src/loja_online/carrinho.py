@@ -1,15 +1,43 @@
+from .pedido import ItemPedido
+
+
 class Carrinho:
     def __init__(self):
-        self.itens = []
+        self._itens = {}
+        self._total = 0
+
+    @property
+    def itens(self):
+        return list(self._itens.values())
 
     def adicionar_produto(self, produto, quantidade):
-        self.itens.append({"produto": produto, "quantidade": quantidade})
+        item = self._itens.get(produto.id)
+        if item is None:
+            self._itens[produto.id] = ItemPedido(produto, quantidade)
+        else:
+            item.quantidade += quantidade
+        self._total = None
+
+    def atualizar_quantidade(self, produto_id, quantidade):
+        item = self._itens.get(produto_id)
+        if item is None:
+            return False
+        if quantidade <= 0:
+            del self._itens[produto_id]
+        else:
+            item.quantidade = quantidade
+        self._total = None
+        return True
 
     def remover_produto(self, produto_id):
-        self.itens = [item for item in self.itens if item["produto"].id != produto_id]
+        if self._itens.pop(produto_id, None) is not None:
+            self._total = None
 
     def calcular_total(self):
-        return sum(item["produto"].preco * item["quantidade"] for item in self.itens)
+        if self._total is None:
+            self._total = sum(item.produto.preco * item.quantidade for item in self._itens.values())
+        return self._total
 
     def limpar_carrinho(self):
-        self.itens = []
\ No newline at end of file
+        self._itens = {}
+        self._total = 0
@@ -0,0 +1,20 @@
+from .produto import Produto
+
+
+class Catalogo(dict):
+    def adicionar(self, produto):
+        self[produto.id] = produto
+        return produto
+
+    def adicionar_linhas(self, linhas):
+        produtos = [Produto(id, nome, preco, estoque) for id, nome, preco, estoque in linhas]
+        novos = {produto.id: produto for produto in produtos}
+        if len(novos) != len(produtos) or not self.keys().isdisjoint(novos):
+            raise ValueError("Ids de produto repetidos no cadastro em lote")
+        self.update(novos)
+        return produtos
+
+    def reajustar_precos(self, porcentagem):
+        fator = 1 + porcentagem / 100
+        for produto in self.values():
+            produto.preco *= fator
@@ -0,0 +1,157 @@
+import operator
+import threading
+from array import array
+from collections.abc import MutableMapping
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional; sem ele as operações usam laços em Python
+    np = None
+
+from .produto import Produto
+
+
+class ProdutoColunar(Produto):
+    __slots__ = ("_catalogo", "_indice")
+
+    def __init__(self, catalogo, indice):
+        self._catalogo = catalogo
+        self._indice = indice
+
+    @property
+    def id(self):
+        return self._catalogo._ids[self._indice]
+
+    @property
+    def nome(self):
+        return self._catalogo._nomes[self._indice]
+
+    @nome.setter
+    def nome(self, valor):
+        self._catalogo._nomes[self._indice] = valor
+
+    @property
+    def preco(self):
+        return self._catalogo._precos[self._indice]
+
+    @preco.setter
+    def preco(self, valor):
+        self._catalogo._precos[self._indice] = valor
+
+    @property
+    def estoque(self):
+        return self._catalogo._estoques[self._indice]
+
+    @estoque.setter
+    def estoque(self, valor):
+        self._catalogo._estoques[self._indice] = valor
+
+    def __eq__(self, outro):
+        if not isinstance(outro, ProdutoColunar):
+            return NotImplemented
+        return self._catalogo is outro._catalogo and self._indice == outro._indice
+
+    def __hash__(self):
+        return hash((id(self._catalogo), self._indice))
+
+
+class CatalogoColunar(MutableMapping):
+    def __init__(self):
+        self._posicoes = {}
+        self._ids = array("q")
+        self._nomes = []
+        self._precos = array("d")
+        self._estoques = array("q")
+        self._ativos = array("b")
+        self._trava = threading.Lock()
+
+    def __getitem__(self, produto_id):
+        return ProdutoColunar(self, self._posicoes[produto_id])
+
+    def __setitem__(self, produto_id, produto):
+        with self._trava:
+            indice = self._posicoes.get(produto_id)
+            if indice is None:
+                self._posicoes[produto_id] = len(self._ids)
+                self._ids.append(produto_id)
+                self._nomes.append(produto.nome)
+                self._precos.append(produto.preco)
+                self._estoques.append(produto.estoque)
+                self._ativos.append(1)
+            else:
+                self._nomes[indice] = produto.nome
+                self._precos[indice] = produto.preco
+                self._estoques[indice] = produto.estoque
+
+    def __delitem__(self, produto_id):
+        with self._trava:
+            indice = self._posicoes.pop(produto_id)
+            self._estoques[indice] = 0
+            self._ativos[indice] = 0
+
+    def __contains__(self, produto_id):
+        return produto_id in self._posicoes
+
+    def __iter__(self):
+        return iter(self._posicoes)
+
+    def __len__(self):
+        return len(self._posicoes)
+
+    def get(self, produto_id, padrao=None):
+        indice = self._posicoes.get(produto_id)
+        if indice is None:
+            return padrao
+        return ProdutoColunar(self, indice)
+
+    def adicionar(self, produto):
+        self[produto.id] = produto
+        return self[produto.id]
+
+    def adicionar_linhas(self, linhas):
+        colunas = list(zip(*linhas))
+        ids, nomes, precos, estoques = colunas if colunas else ((), (), (), ())
+        with self._trava:
+            inicio = len(self._ids)
+            posicoes = dict(zip(ids, range(inicio, inicio + len(ids))))
+            if len(posicoes) != len(ids) or not self._posicoes.keys().isdisjoint(posicoes):
+                raise ValueError("Ids de produto repetidos no cadastro em lote")
+            self._ids.extend(ids)
+            self._nomes.extend(nomes)
+            self._precos.extend(precos)
+            self._estoques.extend(estoques)
+            self._ativos.frombytes(b"\x01" * len(ids))
+            self._posicoes.update(posicoes)
+        return [ProdutoColunar(self, indice) for indice in range(inicio, inicio + len(ids))]
+
+    def reajustar_precos(self, porcentagem):
+        fator = 1 + porcentagem / 100
+        with self._trava:
+            if np is not None:
+                np.frombuffer(self._precos, dtype=np.float64)[:] *= fator
+            else:
+                self._precos[:] = array("d", [preco * fator for preco in self._precos])
+
+    def valor_total_inventario(self):
+        with self._trava:
+            if np is not None:
+                precos = np.frombuffer(self._precos, dtype=np.float64)
+                estoques = np.frombuffer(self._estoques, dtype=np.int64)
+                return float(np.dot(precos, estoques))
+            return sum(map(operator.mul, self._precos, self._estoques))
+
+    def mascara_disponibilidade(self, quantidade=1):
+        with self._trava:
+            if np is not None:
+                estoques = np.frombuffer(self._estoques, dtype=np.int64)
+                ativos = np.frombuffer(self._ativos, dtype=np.int8).astype(bool)
+                return (estoques >= quantidade) & ativos
+            return [ativo == 1 and estoque >= quantidade
+                    for ativo, estoque in zip(self._ativos, self._estoques)]
+
+    def ids_disponiveis(self, quantidade=1):
+        mascara = self.mascara_disponibilidade(quantidade)
+        with self._trava:
+            if np is not None:
+                return np.frombuffer(self._ids, dtype=np.int64)[mascara].tolist()
+            return [produto_id for produto_id, disponivel in zip(self._ids, mascara) if disponivel]
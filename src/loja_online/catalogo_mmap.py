@@ -0,0 +1,238 @@
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from itertools import accumulate
+
+from .indice_busca import IndiceInvertido
+from .produto import Produto
+
+# Cabeçalho: assinatura, versão do formato, ordem dos bytes, versão do
+# catálogo, quantidade de produtos e tamanho do blob de nomes. Seguem as
+# colunas alinhadas em 8 bytes: ids (ordenados), preços, estoques, fim de
+# cada nome no blob, posições ordenadas por (preço, id) e o blob UTF-8. O
+# arquivo é lido direto do mapeamento, sem cópia, e as páginas são
+# compartilhadas por todos os processos.
+ASSINATURA = b"LOJACATM"
+VERSAO = 2
+_CABECALHO = struct.Struct("=8sIB3xQQQ")
+_ORDEM_BYTES = {"little": 0, "big": 1}
+
+
+def publicar(produtos, caminho, versao=None):
+    produtos = sorted(produtos, key=lambda produto: produto.id)
+    if versao is None:
+        versao = ler_versao(caminho) + 1 if os.path.exists(caminho) else 1
+    nomes = [produto.nome.encode("utf-8") for produto in produtos]
+    precos = array("d", [produto.preco for produto in produtos])
+    colunas = [
+        array("q", [produto.id for produto in produtos]),
+        precos,
+        array("q", [produto.estoque for produto in produtos]),
+        array("Q", accumulate(map(len, nomes))),
+        # sorted() é estável: empates de preço ficam na ordem dos ids
+        array("q", sorted(range(len(produtos)), key=precos.__getitem__)),
+    ]
+    blob = b"".join(nomes)
+
+    # Escrita em arquivo temporário + rename: quem já mapeou a versão
+    # anterior continua lendo-a até reabrir o catálogo.
+    temporario = f"{caminho}.tmp"
+    with open(temporario, "wb") as arquivo:
+        arquivo.write(_CABECALHO.pack(ASSINATURA, VERSAO, _ORDEM_BYTES[sys.byteorder],
+                                      versao, len(produtos), len(blob)))
+        for coluna in colunas:
+            arquivo.write(coluna)
+        arquivo.write(blob)
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+    os.replace(temporario, caminho)
+    return versao
+
+
+def ler_versao(caminho):
+    with open(caminho, "rb") as arquivo:
+        return _validar_cabecalho(arquivo.read(_CABECALHO.size), caminho)[0]
+
+
+def _validar_cabecalho(dados, caminho):
+    if len(dados) < _CABECALHO.size:
+        raise ValueError(f"Catálogo inválido: {caminho}")
+    assinatura, formato, ordem, versao, quantidade, tamanho_nomes = _CABECALHO.unpack(dados)
+    if assinatura != ASSINATURA or formato != VERSAO:
+        raise ValueError(f"Catálogo inválido: {caminho}")
+    if ordem != _ORDEM_BYTES[sys.byteorder]:
+        raise ValueError(f"Catálogo gravado com outra ordem de bytes: {caminho}")
+    return versao, quantidade, tamanho_nomes
+
+
+class _Mapeamento:
+    __slots__ = ("versao", "identidade", "ids", "precos", "estoques", "fins_nomes", "ordem_precos",
+                 "nomes", "_indice_nomes", "_trava")
+
+    def __init__(self, caminho):
+        with open(caminho, "rb") as arquivo:
+            estado = os.fstat(arquivo.fileno())
+            dados = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        self.identidade = (estado.st_dev, estado.st_ino)
+        self.versao, quantidade, tamanho_nomes = _validar_cabecalho(dados[:_CABECALHO.size], caminho)
+
+        # As views mantêm o mapeamento vivo enquanto houver leitores da versão
+        visao = memoryview(dados)
+        inicio = _CABECALHO.size
+        colunas = []
+        for tipo in ("q", "d", "q", "Q", "q"):
+            fim = inicio + quantidade * 8
+            colunas.append(visao[inicio:fim].cast(tipo))
+            inicio = fim
+        self.ids, self.precos, self.estoques, self.fins_nomes, self.ordem_precos = colunas
+        self.nomes = visao[inicio:inicio + tamanho_nomes]
+        self._indice_nomes = None
+        self._trava = threading.Lock()
+
+    def posicao(self, produto_id):
+        # Ids sequenciais (o caso comum) são localizados direto pela posição
+        if self.ids:
+            indice = produto_id - self.ids[0]
+            if 0 <= indice < len(self.ids) and self.ids[indice] == produto_id:
+                return indice
+        indice = bisect_left(self.ids, produto_id)
+        if indice < len(self.ids) and self.ids[indice] == produto_id:
+            return indice
+        return -1
+
+    def nome(self, indice):
+        inicio = self.fins_nomes[indice - 1] if indice else 0
+        return str(self.nomes[inicio:self.fins_nomes[indice]], "utf-8")
+
+    def buscar_por_nome(self, termo, modo, limite):
+        # O índice invertido não cabe no arquivo: cada processo monta o seu
+        # na primeira busca, guardando só as posições de cada produto
+        with self._trava:
+            if self._indice_nomes is None:
+                indice = IndiceInvertido()
+                indice.adicionar_varios((i, self.nome(i)) for i in range(len(self.ids)))
+                self._indice_nomes = indice
+        return self._indice_nomes.buscar(termo, modo, limite)
+
+    def faixa_precos(self, minimo, maximo, inicio, limite):
+        ordem, precos = self.ordem_precos, self.precos
+        baixo, alto = 0, len(ordem)
+        if minimo is not None:
+            while baixo < alto:
+                meio = (baixo + alto) // 2
+                if precos[ordem[meio]] < minimo:
+                    baixo = meio + 1
+                else:
+                    alto = meio
+        fim = len(ordem) if limite is None else min(len(ordem), baixo + inicio + limite)
+        resultado = []
+        for indice in ordem[baixo + inicio:fim]:
+            if maximo is not None and precos[indice] > maximo:
+                break
+            resultado.append(indice)
+        return resultado
+
+
+class ProdutoMmap(Produto):
+    __slots__ = ("_mapeamento", "_indice")
+
+    def __init__(self, mapeamento, indice):
+        self._mapeamento = mapeamento
+        self._indice = indice
+
+    @property
+    def id(self):
+        return self._mapeamento.ids[self._indice]
+
+    @property
+    def nome(self):
+        return self._mapeamento.nome(self._indice)
+
+    @property
+    def preco(self):
+        return self._mapeamento.precos[self._indice]
+
+    @property
+    def estoque(self):
+        return self._mapeamento.estoques[self._indice]
+
+    def __eq__(self, outro):
+        if not isinstance(outro, ProdutoMmap):
+            return NotImplemented
+        return self._mapeamento is outro._mapeamento and self._indice == outro._indice
+
+    def __hash__(self):
+        return hash((id(self._mapeamento), self._indice))
+
+
+class CatalogoMmap(Mapping):
+    def __init__(self, caminho, intervalo_verificacao=1.0):
+        self.caminho = caminho
+        self.intervalo_verificacao = intervalo_verificacao
+        self._mapeamento = _Mapeamento(caminho)
+        self._proxima_verificacao = time.monotonic() + intervalo_verificacao
+
+    @property
+    def versao(self):
+        return self._atual().versao
+
+    def atualizar(self):
+        # Troca atômica: leitores em andamento seguem com o mapeamento que
+        # já obtiveram; os próximos acessos enxergam a nova versão.
+        self._proxima_verificacao = time.monotonic() + self.intervalo_verificacao
+        estado = os.stat(self.caminho)
+        if (estado.st_dev, estado.st_ino) == self._mapeamento.identidade:
+            return False
+        self._mapeamento = _Mapeamento(self.caminho)
+        return True
+
+    def colunas(self):
+        mapeamento = self._atual()
+        return mapeamento.ids, mapeamento.precos, mapeamento.estoques
+
+    def preco(self, produto_id):
+        mapeamento = self._atual()
+        indice = mapeamento.posicao(produto_id)
+        return mapeamento.precos[indice] if indice >= 0 else None
+
+    def estoque(self, produto_id):
+        mapeamento = self._atual()
+        indice = mapeamento.posicao(produto_id)
+        return mapeamento.estoques[indice] if indice >= 0 else None
+
+    def buscar_por_nome(self, termo, modo="e", limite=None):
+        mapeamento = self._atual()
+        return [ProdutoMmap(mapeamento, indice)
+                for indice in mapeamento.buscar_por_nome(termo, modo, limite)]
+
+    def buscar_por_preco(self, minimo=None, maximo=None, inicio=0, limite=None):
+        mapeamento = self._atual()
+        return [ProdutoMmap(mapeamento, indice)
+                for indice in mapeamento.faixa_precos(minimo, maximo, inicio, limite)]
+
+    def __getitem__(self, produto_id):
+        mapeamento = self._atual()
+        indice = mapeamento.posicao(produto_id)
+        if indice < 0:
+            raise KeyError(produto_id)
+        return ProdutoMmap(mapeamento, indice)
+
+    def __contains__(self, produto_id):
+        return self._atual().posicao(produto_id) >= 0
+
+    def __iter__(self):
+        return iter(self._atual().ids)
+
+    def __len__(self):
+        return len(self._atual().ids)
+
+    def _atual(self):
+        if time.monotonic() >= self._proxima_verificacao:
+            self.atualizar()
+        return self._mapeamento
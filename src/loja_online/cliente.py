@@ -1,15 +1,49 @@
 class Cliente:
+    __slots__ = ("id", "nome", "email", "historico", "total_gasto", "quantidade_compras", "ultima_compra",
+                 "_valores_compras", "_diario")
+
     def __init__(self, id, nome, email):
         self.id = id
         self.nome = nome
         self.email = email
         self.historico = []
+        self.total_gasto = 0
+        self.quantidade_compras = 0
+        self.ultima_compra = None
+        # Valor somado ao total_gasto por compra: o pedido pode mudar depois
+        self._valores_compras = {}
+        self._diario = None
 
     def adicionar_compra(self, compra):
+        if self._diario is None:
+            return self._adicionar_compra(compra)
+        with self._diario.mutacao():
+            self._adicionar_compra(compra)
+            sequencia = self._diario.anexar("adicionar_compra", self.id, compra.id)
+        self._diario.aguardar(sequencia)
+
+    def _adicionar_compra(self, compra):
         self.historico.append(compra)
+        if compra.status == "cancelado":
+            return
+        self.total_gasto += compra.total
+        self._valores_compras[compra.id] = compra.total
+        self.quantidade_compras += 1
+        self.ultima_compra = compra
+        compra._cliente = self
+
+    def estornar_compra(self, compra):
+        valor = self._valores_compras.pop(compra.id, None)
+        if valor is None:
+            return
+        self.total_gasto = self.total_gasto - valor if self.quantidade_compras > 1 else 0
+        self.quantidade_compras -= 1
+        if self.ultima_compra is compra:
+            self.ultima_compra = next(
+                (c for c in reversed(self.historico) if c is not compra and c.status != "cancelado"), None)
 
     def obter_historico(self):
         return self.historico
 
     def obter_total_gasto(self):
-        return sum(compra.total for compra in self.historico)
\ No newline at end of file
+        return self.total_gasto
@@ -0,0 +1,157 @@
+import re
+import threading
+import time
+
+from .registro_entregas import RegistroEntregas
+
+_CEP = re.compile(r"\b(\d{5})-?(\d{3})\b")
+
+
+def regiao_cep(endereco, digitos=3):
+    # Os primeiros dígitos do CEP identificam a região; endereços sem CEP
+    # ficam todos na região None
+    encontrado = _CEP.search(endereco)
+    if encontrado is None:
+        return None
+    return (encontrado.group(1) + encontrado.group(2))[:digitos]
+
+
+class DespachoEntregas:
+    # Entregas em "preparando" são agrupadas por região e cada grupo sai em
+    # uma única chamada à transportadora, seguida de uma única transição em
+    # lote no registro. Um grupo sai ao atingir `tamanho_lote` entregas ou
+    # quando a mais antiga espera `intervalo` segundos. Quem despacha é uma
+    # thread própria: adicionar() só agrupa e nunca espera a transportadora.
+    # Se ela falha, o grupo volta para a fila e sai de novo após `intervalo`.
+    def __init__(self, transportadora, registro=None, tamanho_lote=50, intervalo=1.0,
+                 regiao=regiao_cep):
+        self.transportadora = transportadora
+        self.registro = RegistroEntregas() if registro is None else registro
+        self.tamanho_lote = tamanho_lote
+        self.intervalo = intervalo
+        self.regiao = regiao
+        self.despachadas = 0
+        self.falhas = 0
+        self.ultimo_erro = None
+        self._grupos = {}
+        self._prazos = {}
+        self._prontos = []
+        self._em_andamento = 0
+        self._fechado = False
+        self._condicao = threading.Condition()
+        self._trabalhador = threading.Thread(target=self._trabalhar, daemon=True)
+        self._trabalhador.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def __len__(self):
+        with self._condicao:
+            return sum(map(len, self._grupos.values())) + sum(len(grupo) for _, grupo in self._prontos)
+
+    def adicionar(self, entrega):
+        if entrega.status != "preparando":
+            raise ValueError(f"Entrega {entrega.id} não está em preparação")
+        regiao = self.regiao(entrega.endereco)
+        with self._condicao:
+            if self._fechado:
+                raise RuntimeError("Despacho de entregas encerrado")
+            if entrega not in self.registro:
+                self.registro.adicionar(entrega)
+            grupo = self._grupos.get(regiao)
+            if grupo is None:
+                grupo = self._grupos[regiao] = []
+                self._prazos[regiao] = time.monotonic() + self.intervalo
+                self._condicao.notify_all()
+            grupo.append(entrega)
+            if len(grupo) >= self.tamanho_lote:
+                self._prontos.append(self._retirar(regiao))
+                self._condicao.notify_all()
+
+    def adicionar_varias(self, entregas):
+        for entrega in entregas:
+            self.adicionar(entrega)
+
+    async def adicionar_async(self, entrega):
+        # Para LojaAssincrona: adicionar() não bloqueia, então basta envolvê-lo
+        self.adicionar(entrega)
+
+    def despachar_todos(self):
+        # Antecipa todos os grupos pendentes e espera a thread despachá-los
+        with self._condicao:
+            self._prontos.extend(self._retirar(regiao) for regiao in list(self._grupos))
+            self._condicao.notify_all()
+            while self._prontos or self._em_andamento:
+                self._condicao.wait()
+
+    def fechar(self):
+        with self._condicao:
+            self._fechado = True
+            self._condicao.notify_all()
+        self._trabalhador.join()
+
+    def _trabalhar(self):
+        while True:
+            with self._condicao:
+                while True:
+                    agora = time.monotonic()
+                    self._prontos.extend(self._retirar_vencidos(agora))
+                    if self._fechado:
+                        self._prontos.extend(self._retirar(regiao) for regiao in list(self._grupos))
+                    if self._prontos or self._fechado:
+                        break
+                    proximo = next(iter(self._prazos.values()), None)
+                    self._condicao.wait(None if proximo is None else proximo - agora)
+                if not self._prontos:
+                    return
+                prontos, self._prontos = self._prontos, []
+                self._em_andamento = len(prontos)
+            try:
+                self._despachar(prontos)
+            finally:
+                with self._condicao:
+                    self._em_andamento = 0
+                    self._condicao.notify_all()
+
+    def _retirar_vencidos(self, agora):
+        # Os grupos ficam na ordem em que foram criados, que é também a ordem
+        # dos prazos: basta percorrer até o primeiro que ainda não venceu
+        vencidas = []
+        for regiao, prazo in self._prazos.items():
+            if prazo > agora:
+                break
+            vencidas.append(regiao)
+        return [self._retirar(regiao) for regiao in vencidas]
+
+    def _retirar(self, regiao):
+        del self._prazos[regiao]
+        return regiao, self._grupos.pop(regiao)
+
+    def _despachar(self, prontos):
+        for regiao, grupo in prontos:
+            try:
+                self.transportadora.despachar(regiao, grupo)
+            except Exception as erro:
+                with self._condicao:
+                    self.falhas += 1
+                    self.ultimo_erro = erro
+                    self._devolver(regiao, grupo)
+                continue
+            movidas = self.registro.iniciar_entregas(grupo)
+            with self._condicao:
+                self.despachadas += movidas
+
+    def _devolver(self, regiao, grupo):
+        # O grupo que não saiu volta para o fim da fila com um novo prazo, à
+        # frente das entregas que chegaram depois para a mesma região. Depois
+        # de fechar() não há nova tentativa: as entregas seguem em
+        # "preparando" no registro.
+        if self._fechado:
+            return
+        if regiao in self._grupos:
+            grupo.extend(self._retirar(regiao)[1])
+        self._grupos[regiao] = grupo
+        self._prazos[regiao] = time.monotonic() + self.intervalo
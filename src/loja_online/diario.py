@@ -0,0 +1,253 @@
+import json
+import os
+import struct
+import threading
+import zlib
+from contextlib import contextmanager
+
+from .pedido import Pedido
+from .produto import Produto
+
+# Arquivo: assinatura + geração, seguido de registros "<II tamanho crc32" +
+# JSON [operação, *argumentos]. A geração liga o diário ao snapshot: um
+# snapshot marcado com a geração g já contém todos os registros dela.
+ASSINATURA = b"LOJADIAR"
+POLITICAS = ("sempre", "intervalo", "nunca")
+_CABECALHO = struct.Struct("<8sQ")
+_REGISTRO = struct.Struct("<II")
+
+
+class Diario:
+    def __init__(self, caminho, politica="sempre", intervalo=0.01, geracao_minima=1):
+        if politica not in POLITICAS:
+            raise ValueError(f"Política de fsync inválida: {politica}")
+        self.caminho = caminho
+        self.politica = politica
+        self.intervalo = intervalo
+        self._trava = threading.Lock()
+        self._trava_escrita = threading.Lock()
+        self._mutacoes = _Mutacoes()
+        self._pendentes = []
+        self._sequencia = 0
+        self._gravado = 0
+
+        geracao, tamanho_valido = _validar(caminho) if os.path.exists(caminho) else (0, 0)
+        if geracao < geracao_minima:
+            self.geracao = geracao_minima
+            self._arquivo = _criar(caminho, geracao_minima)
+        else:
+            self.geracao = geracao
+            self._arquivo = open(caminho, "r+b")
+            # Descarta um registro final incompleto deixado por uma queda
+            self._arquivo.truncate(tamanho_valido)
+            self._arquivo.seek(tamanho_valido)
+
+        self._parar = threading.Event()
+        self._sincronizador = None
+        if politica == "intervalo":
+            self._sincronizador = threading.Thread(target=self._sincronizar_periodicamente, daemon=True)
+            self._sincronizador.start()
+
+    def registrar(self, operacao, *argumentos):
+        self.aguardar(self.anexar(operacao, *argumentos))
+
+    def anexar(self, operacao, *argumentos):
+        dados = json.dumps([operacao, *argumentos], separators=(",", ":")).encode("utf-8")
+        registro = _REGISTRO.pack(len(dados), zlib.crc32(dados)) + dados
+        with self._trava:
+            self._pendentes.append(registro)
+            self._sequencia += 1
+            return self._sequencia
+
+    def aguardar(self, sequencia):
+        # Commit em grupo: quem chega primeiro grava todos os registros
+        # pendentes; os demais encontram a sequência já gravada. "nunca" só
+        # dispensa o fsync: o registro chega ao sistema operacional e
+        # sobrevive à queda do processo. "intervalo" fica com o sincronizador.
+        if self.politica != "intervalo" and self._gravado < sequencia:
+            self._gravar(fsync=self.politica == "sempre", ate=sequencia)
+
+    def mutacao(self):
+        # Envolve a alteração em memória e o anexar do registro, para que o
+        # checkpoint nunca veja um sem o outro
+        return self._mutacoes
+
+    def sincronizar(self):
+        self._gravar(fsync=True)
+
+    def checkpoint(self, salvar_snapshot):
+        # O snapshot marcado com a geração atual substitui todos os registros
+        # gravados até aqui; mutações ficam bloqueadas até a nova geração.
+        with self._mutacoes.exclusiva(), self._trava_escrita:
+            self._gravar_pendentes(fsync=True)
+            salvar_snapshot(self.geracao)
+            self._arquivo.close()
+            self.geracao += 1
+            self._arquivo = _criar(self.caminho, self.geracao)
+
+    def fechar(self):
+        self._parar.set()
+        if self._sincronizador is not None:
+            self._sincronizador.join()
+        self.sincronizar()
+        self._arquivo.close()
+
+    def _gravar(self, fsync, ate=None):
+        with self._trava_escrita:
+            if ate is None or self._gravado < ate:
+                self._gravar_pendentes(fsync)
+
+    def _gravar_pendentes(self, fsync):
+        with self._trava:
+            pendentes, self._pendentes = self._pendentes, []
+            sequencia = self._sequencia
+        if pendentes:
+            self._arquivo.write(b"".join(pendentes))
+            self._arquivo.flush()
+        if fsync:
+            os.fsync(self._arquivo.fileno())
+        self._gravado = sequencia
+
+    def _sincronizar_periodicamente(self):
+        while not self._parar.wait(self.intervalo):
+            self._gravar(fsync=True)
+
+
+class _Mutacoes:
+    # Seção compartilhada entre mutações e exclusiva para o checkpoint, que
+    # tem preferência. Reentrante por thread: uma mutação que chama outra
+    # não espera por um checkpoint que aguarda a ela mesma.
+    def __init__(self):
+        self._condicao = threading.Condition()
+        self._ativas = 0
+        self._aguardando = 0
+        self._exclusiva = False
+        self._local = threading.local()
+
+    def __enter__(self):
+        profundidade = getattr(self._local, "profundidade", 0)
+        if profundidade == 0:
+            with self._condicao:
+                while self._exclusiva or self._aguardando:
+                    self._condicao.wait()
+                self._ativas += 1
+        self._local.profundidade = profundidade + 1
+
+    def __exit__(self, *excecao):
+        self._local.profundidade -= 1
+        if self._local.profundidade == 0:
+            with self._condicao:
+                self._ativas -= 1
+                if self._ativas == 0:
+                    self._condicao.notify_all()
+
+    @contextmanager
+    def exclusiva(self):
+        with self._condicao:
+            self._aguardando += 1
+            try:
+                while self._exclusiva or self._ativas:
+                    self._condicao.wait()
+            finally:
+                self._aguardando -= 1
+            self._exclusiva = True
+        try:
+            yield
+        finally:
+            with self._condicao:
+                self._exclusiva = False
+                self._condicao.notify_all()
+
+
+def ler(caminho):
+    with open(caminho, "rb") as arquivo:
+        geracao = _ler_cabecalho(arquivo, caminho)
+        return geracao, [json.loads(dados) for dados in _registros(arquivo)]
+
+
+def reproduzir(loja, caminho, marca_snapshot=0):
+    if not os.path.exists(caminho):
+        return 0
+    geracao, registros = ler(caminho)
+    if geracao <= marca_snapshot:
+        return 0
+    for operacao, *argumentos in registros:
+        OPERACOES[operacao](loja, *argumentos)
+    return len(registros)
+
+
+def _criar_pedido(loja, pedido_id, cliente_id):
+    loja.pedidos[pedido_id] = Pedido(pedido_id, cliente_id)
+
+
+def _adicionar_item(loja, pedido_id, produto_id, quantidade, preco):
+    produto = loja.buscar_produto(produto_id) or Produto(produto_id, "", preco)
+    loja.pedidos[pedido_id].adicionar_item(produto, quantidade)
+
+
+def _adicionar_compra(loja, cliente_id, pedido_id):
+    loja.clientes[cliente_id].adicionar_compra(loja.pedidos[pedido_id])
+
+
+OPERACOES = {
+    "adicionar_produto": lambda loja, *campos: loja.estoque.adicionar_produto(Produto(*campos)),
+    "adicionar_linhas": lambda loja, linhas: loja.estoque.adicionar_linhas(linhas),
+    "remover_produto": lambda loja, produto_id: loja.estoque.remover_produto(produto_id),
+    "alterar_preco": lambda loja, produto_id, preco: loja.estoque.alterar_preco(produto_id, preco),
+    "reajustar_precos": lambda loja, porcentagem: loja.estoque.reajustar_precos(porcentagem),
+    "definir_estoque": lambda loja, produto_id, quantidade: loja.estoque.definir_estoque(produto_id, quantidade),
+    "reservar": lambda loja, produto_id, quantidade: loja.estoque.reservar(produto_id, quantidade),
+    "liberar": lambda loja, produto_id, quantidade: loja.estoque.liberar(produto_id, quantidade),
+    "reservar_itens": lambda loja, itens: loja.estoque.reservar_itens(itens),
+    "cadastrar_cliente": lambda loja, *campos: loja.cadastrar_cliente(*campos),
+    "criar_pedido": _criar_pedido,
+    "adicionar_item": _adicionar_item,
+    "remover_item": lambda loja, pedido_id, *argumentos: loja.pedidos[pedido_id].remover_item(*argumentos),
+    "confirmar_pedido": lambda loja, pedido_id: loja.pedidos[pedido_id].confirmar_pedido(),
+    "cancelar_pedido": lambda loja, pedido_id: loja.pedidos[pedido_id].cancelar_pedido(),
+    "adicionar_compra": _adicionar_compra,
+}
+
+
+def _ler_cabecalho(arquivo, caminho):
+    cabecalho = arquivo.read(_CABECALHO.size)
+    if len(cabecalho) < _CABECALHO.size:
+        return 0
+    assinatura, geracao = _CABECALHO.unpack(cabecalho)
+    if assinatura != ASSINATURA:
+        raise ValueError(f"Diário inválido: {caminho}")
+    return geracao
+
+
+def _registros(arquivo):
+    # Para no primeiro registro incompleto ou corrompido (queda durante a escrita)
+    while True:
+        cabecalho = arquivo.read(_REGISTRO.size)
+        if len(cabecalho) < _REGISTRO.size:
+            return
+        tamanho, crc = _REGISTRO.unpack(cabecalho)
+        dados = arquivo.read(tamanho)
+        if len(dados) < tamanho or zlib.crc32(dados) != crc:
+            return
+        yield dados
+
+
+def _validar(caminho):
+    with open(caminho, "rb") as arquivo:
+        geracao = _ler_cabecalho(arquivo, caminho)
+        posicao = arquivo.tell()
+        for _ in _registros(arquivo):
+            posicao = arquivo.tell()
+        return geracao, posicao
+
+
+def _criar(caminho, geracao):
+    temporario = f"{caminho}.tmp"
+    with open(temporario, "wb") as arquivo:
+        arquivo.write(_CABECALHO.pack(ASSINATURA, geracao))
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+    os.replace(temporario, caminho)
+    arquivo = open(caminho, "r+b")
+    arquivo.seek(0, os.SEEK_END)
+    return arquivo
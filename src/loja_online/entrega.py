@@ -1,15 +1,25 @@
 class Entrega:
+    __slots__ = ("id", "pedido_id", "endereco", "status", "_registro")
+
     def __init__(self, id, pedido_id, endereco):
         self.id = id
         self.pedido_id = pedido_id
         self.endereco = endereco
         self.status = "preparando"
+        self._registro = None
 
     def iniciar_entrega(self):
-        self.status = "em_transito"
+        self._mudar_status("em_transito")
 
     def confirmar_entrega(self):
-        self.status = "entregue"
+        self._mudar_status("entregue")
 
     def obter_status(self):
-        return self.status
\ No newline at end of file
+        return self.status
+
+    def _mudar_status(self, status):
+        # Entregas registradas mudam de status pelo registro, que mantém os índices
+        if self._registro is not None:
+            self._registro._mover(self, status)
+        else:
+            self.status = status
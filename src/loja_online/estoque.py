@@ -1,16 +1,75 @@
+import threading
+from contextlib import nullcontext
+
+from .catalogo import Catalogo
+from .indice_busca import IndiceInvertido
+from .indice_precos import IndicePrecos
 from .produto import Produto
+from .travas import TRAVAS_ESTOQUE
 
 
 class Estoque:
-    def __init__(self):
-        self.produtos = {}
+    def __init__(self, produtos=None):
+        self.produtos = produtos if produtos is not None else Catalogo()
+        # Catálogos compartilhados entre processos trazem as próprias travas
+        self.travas = getattr(self.produtos, "travas", TRAVAS_ESTOQUE)
+        self._trava_catalogo = threading.Lock()
+        self.indice_nomes = None
+        self.indice_precos = None
+        self.diario = None
 
     def adicionar_produto(self, produto):
-        self.produtos[produto.id] = produto
+        with self._mutacao(), self._trava_catalogo:
+            produto = self.produtos.adicionar(produto)
+            if self.indice_nomes is not None:
+                self.indice_nomes.adicionar(produto.id, produto.nome)
+            if self.indice_precos is not None:
+                self.indice_precos.adicionar(produto.id, produto.preco)
+            sequencia = self._anexar("adicionar_produto", produto.id, produto.nome,
+                                     produto.preco, produto.estoque)
+        self._aguardar(sequencia)
+        return produto
+
+    def adicionar_produtos(self, produtos):
+        novos = {produto.id: produto for produto in produtos}
+        with self._mutacao(), self._trava_catalogo:
+            self.produtos.update(novos)
+            if self.indice_nomes is not None:
+                self.indice_nomes.adicionar_varios(
+                    (produto_id, produto.nome) for produto_id, produto in novos.items())
+            if self.indice_precos is not None:
+                self.indice_precos.adicionar_varios(
+                    (produto_id, produto.preco) for produto_id, produto in novos.items())
+            # Pode substituir ids existentes, o que "adicionar_linhas" recusa na reprodução
+            sequencia = None
+            for produto in novos.values():
+                sequencia = self._anexar("adicionar_produto", produto.id, produto.nome,
+                                         produto.preco, produto.estoque)
+        self._aguardar(sequencia)
+
+    def adicionar_linhas(self, linhas):
+        with self._mutacao(), self._trava_catalogo:
+            produtos = self.produtos.adicionar_linhas(linhas)
+            if self.indice_nomes is not None:
+                self.indice_nomes.adicionar_varios(
+                    (produto.id, produto.nome) for produto in produtos)
+            if self.indice_precos is not None:
+                self.indice_precos.adicionar_varios(
+                    (produto.id, produto.preco) for produto in produtos)
+            sequencia = self._anexar_linhas(produtos)
+        self._aguardar(sequencia)
+        return produtos
 
     def remover_produto(self, produto_id):
-        if produto_id in self.produtos:
-            del self.produtos[produto_id]
+        with self._mutacao(), self._trava_catalogo:
+            if produto_id in self.produtos:
+                del self.produtos[produto_id]
+            if self.indice_nomes is not None:
+                self.indice_nomes.remover(produto_id)
+            if self.indice_precos is not None:
+                self.indice_precos.remover(produto_id)
+            sequencia = self._anexar("remover_produto", produto_id)
+        self._aguardar(sequencia)
 
     def buscar_produto(self, produto_id):
         return self.produtos.get(produto_id)
@@ -18,8 +77,173 @@ class Estoque:
     def listar_produtos(self):
         return list(self.produtos.values())
 
+    def indexar_nomes(self):
+        with self._trava_catalogo:
+            if self.indice_nomes is None:
+                indice = IndiceInvertido()
+                indice.adicionar_varios(
+                    (produto.id, produto.nome) for produto in self.produtos.values())
+                self.indice_nomes = indice
+            return self.indice_nomes
+
+    def buscar_por_nome(self, termo, modo="e", limite=None):
+        indice = self.indice_nomes
+        if indice is None:
+            indice = self.indexar_nomes()
+        return self._produtos_por_id(indice.buscar(termo, modo, limite))
+
+    def indexar_precos(self):
+        with self._trava_catalogo:
+            if self.indice_precos is None:
+                indice = IndicePrecos()
+                indice.adicionar_varios(
+                    (produto.id, produto.preco) for produto in self.produtos.values())
+                self.indice_precos = indice
+            return self.indice_precos
+
+    def alterar_preco(self, produto_id, preco):
+        with self._mutacao(), self._trava_catalogo:
+            produto = self.produtos.get(produto_id)
+            if produto is None:
+                return False
+            produto.preco = preco
+            if self.indice_precos is not None:
+                self.indice_precos.adicionar(produto_id, preco)
+            sequencia = self._anexar("alterar_preco", produto_id, preco)
+        self._aguardar(sequencia)
+        return True
+
+    def reajustar_precos(self, porcentagem):
+        with self._mutacao(), self._trava_catalogo:
+            self.produtos.reajustar_precos(porcentagem)
+            self.indice_precos = None
+            sequencia = self._anexar("reajustar_precos", porcentagem)
+        self._aguardar(sequencia)
+
+    def buscar_por_preco(self, minimo=None, maximo=None, inicio=0, limite=None):
+        indice = self.indice_precos
+        if indice is None:
+            indice = self.indexar_precos()
+        return self._produtos_por_id(indice.faixa(minimo, maximo, inicio, limite))
+
+    def mais_baratos(self, quantidade):
+        return self.buscar_por_preco(limite=quantidade)
+
+    def mais_caros(self, quantidade):
+        indice = self.indice_precos
+        if indice is None:
+            indice = self.indexar_precos()
+        return self._produtos_por_id(indice.mais_caros(quantidade))
+
+    def _produtos_por_id(self, produto_ids):
+        produtos = (self.produtos.get(produto_id) for produto_id in produto_ids)
+        return [produto for produto in produtos if produto is not None]
+
     def verificar_disponibilidade(self, produto_id, quantidade):
         produto = self.buscar_produto(produto_id)
         if produto is None:
             return False
         return produto.estoque >= quantidade
+
+    def definir_estoque(self, produto_id, quantidade):
+        produto = self.buscar_produto(produto_id)
+        if produto is None:
+            return False
+        with self._mutacao(), self.travas.trava(produto_id):
+            produto.definir_estoque(quantidade)
+            sequencia = self._anexar("definir_estoque", produto_id, quantidade)
+        self._aguardar(sequencia)
+        return True
+
+    def reservar(self, produto_id, quantidade):
+        _validar_quantidade(produto_id, quantidade)
+        produto = self.buscar_produto(produto_id)
+        if produto is None:
+            return False
+        if self.diario is None:
+            return produto.reduzir_estoque(quantidade)
+        # Registra sob a mesma trava para que o diário preserve a ordem real
+        with self._mutacao(), self.travas.trava(produto_id):
+            if not produto.reduzir_estoque(quantidade):
+                return False
+            sequencia = self._anexar("reservar", produto_id, quantidade)
+        self._aguardar(sequencia)
+        return True
+
+    def liberar(self, produto_id, quantidade):
+        produto = self.buscar_produto(produto_id)
+        if produto is not None:
+            with self._mutacao(), self.travas.trava(produto_id):
+                produto.aumentar_estoque(quantidade)
+                sequencia = self._anexar("liberar", produto_id, quantidade)
+            self._aguardar(sequencia)
+
+    def reservar_itens(self, itens):
+        quantidades = {}
+        for produto_id, quantidade in itens:
+            _validar_quantidade(produto_id, quantidade)
+            quantidades[produto_id] = quantidades.get(produto_id, 0) + quantidade
+
+        produtos = []
+        for produto_id, quantidade in quantidades.items():
+            produto = self.buscar_produto(produto_id)
+            if produto is None:
+                return False
+            produtos.append((produto, quantidade))
+
+        # Catálogos persistidos reservam todas as linhas de uma vez no próprio
+        # armazenamento, que é a fonte da verdade entre conexões e processos
+        reservar_itens = getattr(self.produtos, "reservar_itens", None)
+        if reservar_itens is not None:
+            with self._mutacao():
+                if not reservar_itens(list(quantidades.items())):
+                    return False
+                sequencia = self._anexar("reservar_itens", list(quantidades.items()))
+            self._aguardar(sequencia)
+            return True
+
+        with self._mutacao():
+            adquiridas = []
+            try:
+                for trava in self.travas.travas_ordenadas(quantidades):
+                    trava.acquire()
+                    adquiridas.append(trava)
+                for produto, quantidade in produtos:
+                    if produto.estoque < quantidade:
+                        return False
+                for produto, quantidade in produtos:
+                    produto.estoque -= quantidade
+                sequencia = self._anexar("reservar_itens", list(quantidades.items()))
+            finally:
+                for trava in reversed(adquiridas):
+                    trava.release()
+        self._aguardar(sequencia)
+        return True
+
+    def liberar_itens(self, itens):
+        for produto_id, quantidade in itens:
+            self.liberar(produto_id, quantidade)
+
+    def _mutacao(self):
+        return nullcontext() if self.diario is None else self.diario.mutacao()
+
+    def _anexar(self, operacao, *argumentos):
+        if self.diario is None:
+            return None
+        return self.diario.anexar(operacao, *argumentos)
+
+    def _anexar_linhas(self, produtos):
+        if self.diario is None:
+            return None
+        return self.diario.anexar(
+            "adicionar_linhas", [(p.id, p.nome, p.preco, p.estoque) for p in produtos])
+
+    def _aguardar(self, sequencia):
+        if sequencia is not None:
+            self.diario.aguardar(sequencia)
+
+
+def _validar_quantidade(produto_id, quantidade):
+    # Uma quantidade negativa faria a reserva aumentar o estoque
+    if quantidade <= 0:
+        raise ValueError(f"Quantidade inválida para o produto {produto_id}: {quantidade}")
@@ -0,0 +1,184 @@
+import os
+import struct
+import tempfile
+from multiprocessing import resource_tracker, shared_memory
+
+from .catalogo import Catalogo
+from .produto import Produto
+from .travas import TravasEntreProcessos
+
+# Segmento: "<Q quantidade" seguido de pares (id, estoque) em int64. Cada
+# processo mantém só o mapa id -> posição; os contadores ficam no segmento
+# e são alterados sob travas listradas compartilhadas entre os processos.
+# Um produto removido fica marcado no segmento, para que um novo cadastro
+# volte a definir o estoque em vez de herdar o contador zerado.
+_QUANTIDADE = struct.Struct("<Q")
+_REMOVIDO = -1
+
+
+class MemoriaEstoque:
+    def __init__(self, nome, capacidade=None, caminho_travas=None):
+        self.nome = nome
+        if capacidade is None:
+            self._memoria = _abrir(nome)
+        else:
+            try:
+                self._memoria = _abrir(nome, create=True, size=_QUANTIDADE.size + capacidade * 16)
+            except FileExistsError:
+                self._memoria = _abrir(nome)
+        self.capacidade = (self._memoria.size - _QUANTIDADE.size) // 16
+        fim = _QUANTIDADE.size + self.capacidade * 16
+        self._pares = self._memoria.buf[_QUANTIDADE.size:fim].cast("q")
+        self._posicoes = {}
+        self._sincronizados = 0
+
+        if caminho_travas is None:
+            caminho_travas = os.path.join(tempfile.gettempdir(), f"{nome}.travas")
+        self.travas = TravasEntreProcessos(caminho_travas)
+
+    def __len__(self):
+        return _QUANTIDADE.unpack_from(self._memoria.buf)[0]
+
+    def posicao(self, produto_id):
+        posicao = self._posicoes.get(produto_id)
+        if posicao is None:
+            self._sincronizar()
+            posicao = self._posicoes.get(produto_id)
+        return posicao
+
+    def registrar(self, produto_id, estoque):
+        return self.registrar_varios([(produto_id, estoque)])[0]
+
+    def registrar_varios(self, pares):
+        # O primeiro processo a registrar um id define o estoque inicial; os
+        # demais apenas passam a usar o contador que já existe, salvo se o
+        # produto tiver sido removido.
+        with self.travas.trava_global:
+            self._sincronizar()
+            quantidade = len(self._posicoes)
+            posicoes = []
+            for produto_id, estoque in pares:
+                posicao = self._posicoes.get(produto_id)
+                if posicao is None:
+                    if quantidade >= self.capacidade:
+                        raise ValueError("Memória de estoque sem capacidade para novos produtos")
+                    posicao = quantidade
+                    self._pares[2 * posicao] = produto_id
+                    self._pares[2 * posicao + 1] = estoque
+                    self._posicoes[produto_id] = posicao
+                    quantidade += 1
+                elif self._pares[2 * posicao + 1] == _REMOVIDO:
+                    self._pares[2 * posicao + 1] = estoque
+                posicoes.append(posicao)
+            _QUANTIDADE.pack_into(self._memoria.buf, 0, quantidade)
+            self._sincronizados = quantidade
+        return posicoes
+
+    def valor(self, posicao):
+        return max(self._pares[2 * posicao + 1], 0)
+
+    def definir(self, posicao, valor):
+        self._pares[2 * posicao + 1] = valor
+
+    def marcar_removido(self, posicao):
+        self._pares[2 * posicao + 1] = _REMOVIDO
+
+    def fechar(self):
+        self._pares.release()
+        self._memoria.close()
+        self.travas.fechar()
+
+    def remover(self):
+        self.fechar()
+        # unlink() desfaz o registro no resource_tracker; registra antes
+        # para que a contabilidade dele continue equilibrada
+        resource_tracker.register(self._memoria._name, "shared_memory")
+        self._memoria.unlink()
+        if os.path.exists(self.travas.caminho):
+            os.remove(self.travas.caminho)
+
+    def _sincronizar(self):
+        quantidade = len(self)
+        for posicao in range(self._sincronizados, quantidade):
+            self._posicoes[self._pares[2 * posicao]] = posicao
+        self._sincronizados = quantidade
+
+
+def _abrir(nome, **opcoes):
+    memoria = shared_memory.SharedMemory(nome, **opcoes)
+    # O segmento vive além de qualquer processo e só sai com remover(); sem
+    # isso o resource_tracker o apagaria quando um worker terminasse.
+    resource_tracker.unregister(memoria._name, "shared_memory")
+    return memoria
+
+
+class ProdutoCompartilhado(Produto):
+    __slots__ = ("_memoria_estoque", "_posicao")
+
+    def __init__(self, memoria, posicao, id, nome, preco):
+        self.id = id
+        self.nome = nome
+        self.preco = preco
+        self._memoria_estoque = memoria
+        self._posicao = posicao
+
+    @property
+    def estoque(self):
+        return self._memoria_estoque.valor(self._posicao)
+
+    @estoque.setter
+    def estoque(self, valor):
+        self._memoria_estoque.definir(self._posicao, valor)
+
+    def reduzir_estoque(self, quantidade):
+        with self._memoria_estoque.travas.trava(self.id):
+            estoque = self.estoque
+            if estoque >= quantidade:
+                self.estoque = estoque - quantidade
+                return True
+            return False
+
+    def aumentar_estoque(self, quantidade):
+        with self._memoria_estoque.travas.trava(self.id):
+            self.estoque += quantidade
+
+
+class CatalogoCompartilhado(Catalogo):
+    def __init__(self, memoria):
+        super().__init__()
+        self.memoria = memoria
+        self.travas = memoria.travas
+
+    def __delitem__(self, produto_id):
+        # O contador continua no segmento: marcado como removido, outros
+        # processos o veem zerado e não vendem o produto.
+        produto = self.pop(produto_id)
+        with self.travas.trava(produto_id):
+            self.memoria.marcar_removido(produto._posicao)
+
+    def adicionar(self, produto):
+        return self._compartilhar([(produto.id, produto.nome, produto.preco, produto.estoque)])[0]
+
+    def adicionar_linhas(self, linhas):
+        linhas = list(linhas)
+        ids = {linha[0] for linha in linhas}
+        if len(ids) != len(linhas) or not self.keys().isdisjoint(ids):
+            raise ValueError("Ids de produto repetidos no cadastro em lote")
+        return self._compartilhar(linhas)
+
+    def update(self, outro=(), **kwargs):
+        produtos = dict(outro, **kwargs).values()
+        self._compartilhar([(p.id, p.nome, p.preco, p.estoque) for p in produtos])
+
+    def _compartilhar(self, linhas):
+        # Ids já cadastrados neste processo são substituídos com o estoque
+        # informado; os demais entram ou se ligam ao contador do segmento.
+        substituidos = [linha for linha in linhas if linha[0] in self]
+        posicoes = self.memoria.registrar_varios((linha[0], linha[3]) for linha in linhas)
+        for produto_id, _, _, estoque in substituidos:
+            with self.travas.trava(produto_id):
+                self.memoria.definir(self.memoria.posicao(produto_id), estoque)
+        produtos = [ProdutoCompartilhado(self.memoria, posicao, id, nome, preco)
+                    for posicao, (id, nome, preco, _) in zip(posicoes, linhas)]
+        dict.update(self, ((produto.id, produto) for produto in produtos))
+        return produtos
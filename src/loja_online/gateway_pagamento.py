@@ -0,0 +1,66 @@
+import asyncio
+import random
+import threading
+import time
+
+
+class FalhaGateway(Exception):
+    # Falha transitória (rede, timeout): a cobrança pode ser repetida
+    pass
+
+
+class GatewayPagamento:
+    # Interface dos gateways: basta implementar cobrar(); lotes e a versão
+    # assíncrona têm implementações padrão em cima dela.
+    def cobrar(self, pagamento):
+        raise NotImplementedError
+
+    def cobrar_lote(self, pagamentos):
+        return [self.cobrar(pagamento) for pagamento in pagamentos]
+
+    async def cobrar_async(self, pagamento):
+        return await asyncio.get_running_loop().run_in_executor(None, self.cobrar, pagamento)
+
+
+class GatewaySimulado(GatewayPagamento):
+    # Gateway local para testes e benchmarks: cada chamada custa `latencia`
+    # segundos (mais `latencia_por_item` por pagamento do lote), uma fração
+    # `taxa_falhas` das chamadas falha e `taxa_recusa` das cobranças é recusada.
+    def __init__(self, latencia=0.0, taxa_recusa=0.0, semente=None, taxa_falhas=0.0,
+                 latencia_por_item=0.0):
+        self.latencia = latencia
+        self.latencia_por_item = latencia_por_item
+        self.taxa_recusa = taxa_recusa
+        self.taxa_falhas = taxa_falhas
+        self.chamadas = 0
+        self._aleatorio = random.Random(semente)
+        self._trava = threading.Lock()
+
+    def cobrar(self, pagamento):
+        return self.cobrar_lote([pagamento])[0]
+
+    def cobrar_lote(self, pagamentos):
+        latencia = self.latencia + self.latencia_por_item * len(pagamentos)
+        if latencia:
+            time.sleep(latencia)
+        self._chamar()
+        return [self._aprovar(pagamento) for pagamento in pagamentos]
+
+    async def cobrar_async(self, pagamento):
+        await asyncio.sleep(self.latencia + self.latencia_por_item)
+        self._chamar()
+        return self._aprovar(pagamento)
+
+    def _chamar(self):
+        with self._trava:
+            self.chamadas += 1
+            if self.taxa_falhas and self._aleatorio.random() < self.taxa_falhas:
+                raise FalhaGateway("Falha simulada no gateway")
+
+    def _aprovar(self, pagamento):
+        if pagamento.valor <= 0:
+            return False
+        if not self.taxa_recusa:
+            return True
+        with self._trava:
+            return self._aleatorio.random() >= self.taxa_recusa
@@ -0,0 +1,78 @@
+import os
+import threading
+import time
+import weakref
+
+# Layout de 76 bits: milissegundos desde a época (42) | pid (22) | sequência (12).
+# O pid garante unicidade entre processos do mesmo host (pid_max do Linux
+# cabe em 22 bits) e o texto hexadecimal de largura fixa preserva a ordem.
+EPOCA_MS = 1_704_067_200_000  # 2024-01-01T00:00:00Z
+BITS_PID = 22
+BITS_SEQUENCIA = 12
+_MAXIMO_SEQUENCIA = (1 << BITS_SEQUENCIA) - 1
+_MASCARA_PID = (1 << BITS_PID) - 1
+_FORMATO = "{:019x}".format
+
+
+class GeradorIds:
+    _instancias = weakref.WeakSet()
+
+    def __init__(self):
+        self._reiniciar()
+        GeradorIds._instancias.add(self)
+
+    def gerar_id(self):
+        with self._trava:
+            agora = time.time_ns() // 1_000_000 - EPOCA_MS
+            if agora > self._ultimo_ms:
+                self._ultimo_ms = agora
+                self._sequencia = 0
+            elif self._sequencia < _MAXIMO_SEQUENCIA:
+                self._sequencia += 1
+            else:
+                # Sequência esgotada no milissegundo: avança o relógio lógico
+                self._ultimo_ms += 1
+                self._sequencia = 0
+            valor = self._ultimo_ms << self._deslocamento_ms | self._pid | self._sequencia
+        return _FORMATO(valor)
+
+    def gerar_ids(self, quantidade):
+        faixas = []
+        with self._trava:
+            agora = time.time_ns() // 1_000_000 - EPOCA_MS
+            if agora > self._ultimo_ms:
+                self._ultimo_ms = agora
+                proxima = 0
+            else:
+                proxima = self._sequencia + 1
+            restantes = quantidade
+            while restantes > 0:
+                if proxima > _MAXIMO_SEQUENCIA:
+                    self._ultimo_ms += 1
+                    proxima = 0
+                fim = min(proxima + restantes, _MAXIMO_SEQUENCIA + 1)
+                faixas.append((self._ultimo_ms << self._deslocamento_ms | self._pid, proxima, fim))
+                restantes -= fim - proxima
+                proxima = fim
+            self._sequencia = proxima - 1
+        return [_FORMATO(base | sequencia)
+                for base, inicio, fim in faixas
+                for sequencia in range(inicio, fim)]
+
+    def _reiniciar(self):
+        self._trava = threading.Lock()
+        self._deslocamento_ms = BITS_PID + BITS_SEQUENCIA
+        self._pid = (os.getpid() & _MASCARA_PID) << BITS_SEQUENCIA
+        self._ultimo_ms = -1
+        self._sequencia = 0
+
+
+def _reiniciar_apos_fork():
+    for gerador in list(GeradorIds._instancias):
+        gerador._reiniciar()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reiniciar_apos_fork)
+
+GERADOR_IDS = GeradorIds()
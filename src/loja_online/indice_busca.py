@@ -0,0 +1,115 @@
+import heapq
+import itertools
+import math
+import re
+import threading
+import unicodedata
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenizar(texto):
+    texto = str(texto).lower()
+    if not texto.isascii():
+        texto = unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode("ascii")
+    return _TOKEN.findall(texto)
+
+
+class IndiceInvertido:
+    def __init__(self):
+        self._postagens = {}
+        self._tokens = {}
+        self._trava = threading.Lock()
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def adicionar(self, chave, texto):
+        with self._trava:
+            self._adicionar(chave, texto)
+
+    def adicionar_varios(self, pares):
+        with self._trava:
+            for chave, texto in pares:
+                self._adicionar(chave, texto)
+
+    def _adicionar(self, chave, texto):
+        if chave in self._tokens:
+            self._remover(chave)
+        tokens = tuple(set(tokenizar(texto)))
+        self._tokens[chave] = tokens
+        for token in tokens:
+            postagem = self._postagens.get(token)
+            if postagem is None:
+                self._postagens[token] = {chave}
+            else:
+                postagem.add(chave)
+
+    def remover(self, chave):
+        with self._trava:
+            self._remover(chave)
+
+    def _remover(self, chave):
+        for token in self._tokens.pop(chave, ()):
+            postagem = self._postagens[token]
+            postagem.discard(chave)
+            if not postagem:
+                del self._postagens[token]
+
+    def buscar(self, termo, modo="e", limite=None):
+        if modo not in ("e", "ou"):
+            raise ValueError(f"Modo de busca inválido: {modo}")
+        tokens = set(tokenizar(termo))
+        if not tokens:
+            return []
+
+        with self._trava:
+            postagens = [self._postagens.get(token, set()) for token in tokens]
+            if modo == "e":
+                postagens.sort(key=len)
+                return self._ordenar(set.intersection(*postagens), limite)
+
+            # Modo "ou": a relevância é a soma do idf dos termos encontrados.
+            # Uma passada por termo separa os documentos em grupos pelo conjunto
+            # de termos presentes, com operações de conjunto em vez de pontuar
+            # documento a documento; só existem os grupos que têm documentos.
+            total = len(self._tokens)
+            grupos = []
+            vistos = set()
+            for postagem in postagens:
+                if not postagem:
+                    continue
+                peso = math.log(1 + total / len(postagem))
+                divididos = []
+                for pontuacao, grupo in grupos:
+                    dentro = grupo & postagem
+                    if dentro:
+                        grupo -= dentro
+                        divididos.append((pontuacao + peso, dentro))
+                    if grupo:
+                        divididos.append((pontuacao, grupo))
+                novos = postagem - vistos
+                if novos:
+                    vistos |= novos
+                    divididos.append((peso, novos))
+                grupos = divididos
+
+        # Da maior relevância para a menor; grupos de mesma pontuação formam
+        # uma faixa, ordenada pela chave
+        def faixa(item):
+            return round(item[0], 9)
+
+        grupos.sort(key=faixa, reverse=True)
+        resultado = []
+        for _, grupo in itertools.groupby(grupos, key=faixa):
+            restante = None if limite is None else limite - len(resultado)
+            if restante is not None and restante <= 0:
+                break
+            resultado.extend(self._ordenar(set().union(*(chaves for _, chaves in grupo)), restante))
+        return resultado
+
+    @staticmethod
+    def _ordenar(chaves, limite):
+        if limite is not None:
+            return heapq.nsmallest(limite, chaves)
+        return sorted(chaves)
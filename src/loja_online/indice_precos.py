@@ -0,0 +1,113 @@
+import threading
+from bisect import bisect_left, insort
+
+# Tamanho de referência de cada bloco da lista ordenada; blocos com o dobro
+# disso são divididos, mantendo inserções e remoções baratas mesmo com
+# milhões de produtos.
+_CARGA = 1000
+
+
+class IndicePrecos:
+    def __init__(self):
+        self._blocos = []
+        self._maximos = []
+        self._precos = {}
+        self._trava = threading.Lock()
+
+    def __len__(self):
+        return len(self._precos)
+
+    def adicionar(self, produto_id, preco):
+        with self._trava:
+            self._remover(produto_id)
+            self._inserir((preco, produto_id))
+            self._precos[produto_id] = preco
+
+    def adicionar_varios(self, pares):
+        # O índice é remontado a partir de _precos; ids repetidos no lote
+        # ficam com o último preço, como em adicionar()
+        with self._trava:
+            self._precos.update(pares)
+            chaves = sorted((preco, produto_id) for produto_id, preco in self._precos.items())
+            self._blocos = [chaves[i:i + _CARGA] for i in range(0, len(chaves), _CARGA)]
+            self._maximos = [bloco[-1] for bloco in self._blocos]
+
+    def remover(self, produto_id):
+        with self._trava:
+            self._remover(produto_id)
+
+    def faixa(self, minimo=None, maximo=None, inicio=0, limite=None):
+        with self._trava:
+            if minimo is None:
+                bloco, posicao = 0, 0
+            else:
+                bloco, posicao = self._localizar((minimo,))
+            bloco, posicao = self._avancar(bloco, posicao, inicio)
+
+            resultado = []
+            while bloco < len(self._blocos):
+                for preco, produto_id in self._blocos[bloco][posicao:]:
+                    if maximo is not None and preco > maximo:
+                        return resultado
+                    if limite is not None and len(resultado) >= limite:
+                        return resultado
+                    resultado.append(produto_id)
+                bloco, posicao = bloco + 1, 0
+            return resultado
+
+    def mais_baratos(self, quantidade):
+        return self.faixa(limite=quantidade)
+
+    def mais_caros(self, quantidade):
+        with self._trava:
+            resultado = []
+            for bloco in reversed(self._blocos):
+                for _, produto_id in reversed(bloco):
+                    if len(resultado) >= quantidade:
+                        return resultado
+                    resultado.append(produto_id)
+            return resultado
+
+    def _inserir(self, chave):
+        if not self._blocos:
+            self._blocos.append([chave])
+            self._maximos.append(chave)
+            return
+        indice = bisect_left(self._maximos, chave)
+        if indice == len(self._blocos):
+            indice -= 1
+        bloco = self._blocos[indice]
+        insort(bloco, chave)
+        self._maximos[indice] = bloco[-1]
+        if len(bloco) > 2 * _CARGA:
+            self._blocos[indice:indice + 1] = [bloco[:_CARGA], bloco[_CARGA:]]
+            self._maximos[indice:indice + 1] = [bloco[_CARGA - 1], bloco[-1]]
+
+    def _remover(self, produto_id):
+        preco = self._precos.pop(produto_id, None)
+        if preco is None:
+            return
+        chave = (preco, produto_id)
+        indice = bisect_left(self._maximos, chave)
+        bloco = self._blocos[indice]
+        del bloco[bisect_left(bloco, chave)]
+        if bloco:
+            self._maximos[indice] = bloco[-1]
+        else:
+            del self._blocos[indice]
+            del self._maximos[indice]
+
+    def _localizar(self, chave):
+        indice = bisect_left(self._maximos, chave)
+        if indice == len(self._blocos):
+            return indice, 0
+        return indice, bisect_left(self._blocos[indice], chave)
+
+    def _avancar(self, bloco, posicao, deslocamento):
+        while deslocamento and bloco < len(self._blocos):
+            disponiveis = len(self._blocos[bloco]) - posicao
+            if deslocamento < disponiveis:
+                return bloco, posicao + deslocamento
+            deslocamento -= disponiveis
+            bloco, posicao = bloco + 1, 0
+        return bloco, posicao
@@ -1,3 +1,5 @@
+import os
+
 from .cliente import Cliente
 from .produto import Produto
 from .pedido import Pedido
@@ -5,33 +7,150 @@ from .carrinho import Carrinho
 from .estoque import Estoque
 from .pagamento import Pagamento
 from .entrega import Entrega
+from .registro_entregas import RegistroEntregas
+from .sequencia import Sequencia
+from .promocoes import MotorPromocoes
+from .diario import Diario, reproduzir
+from . import catalogo_mmap, snapshot
 
 class Loja:
-    def __init__(self):
+    def __init__(self, catalogo=None):
         self.clientes = {}
-        self.produtos = {}
         self.pedidos = {}
-        self.estoque = Estoque()
+        self._ids_pedidos = Sequencia()
+        self.estoque = Estoque(catalogo)
+        self.promocoes = MotorPromocoes()
+        self.entregas = RegistroEntregas()
+        self.diario = None
+
+    @property
+    def produtos(self):
+        return self.estoque.produtos
 
     def cadastrar_cliente(self, id, nome, email):
         cliente = Cliente(id, nome, email)
-        self.clientes[id] = cliente
+        if self.diario is None:
+            self.clientes[id] = cliente
+            return cliente
+        with self.diario.mutacao():
+            self.clientes[id] = cliente
+            cliente._diario = self.diario
+            sequencia = self.diario.anexar("cadastrar_cliente", id, nome, email)
+        self.diario.aguardar(sequencia)
         return cliente
 
-    def cadastrar_produto(self, id, nome, preco):
-        produto = Produto(id, nome, preco)
-        self.produtos[id] = produto
-        self.estoque.adicionar_produto(produto)
-        return produto
+    def cadastrar_produto(self, id, nome, preco, estoque=0):
+        return self.estoque.adicionar_produto(Produto(id, nome, preco, estoque))
+
+    def cadastrar_produtos_em_lote(self, linhas=None, colunas=None):
+        if colunas is not None:
+            linhas = zip(*colunas)
+        return self.estoque.adicionar_linhas(linhas)
 
     def criar_pedido(self, cliente_id):
-        pedido_id = len(self.pedidos) + 1
+        pedido_id = self._ids_pedidos.proximo()
         pedido = Pedido(pedido_id, cliente_id)
-        self.pedidos[pedido_id] = pedido
+        if self.diario is None:
+            self.pedidos[pedido_id] = pedido
+            return pedido
+        with self.diario.mutacao():
+            self.pedidos[pedido_id] = pedido
+            pedido._diario = self.diario
+            sequencia = self.diario.anexar("criar_pedido", pedido_id, cliente_id)
+        self.diario.aguardar(sequencia)
         return pedido
 
     def buscar_cliente(self, cliente_id):
         return self.clientes.get(cliente_id)
 
+    def buscar_pedido(self, pedido_id):
+        return self.pedidos.get(pedido_id)
+
     def buscar_produto(self, produto_id):
-        return self.produtos.get(produto_id)
\ No newline at end of file
+        return self.estoque.buscar_produto(produto_id)
+
+    def buscar_produtos(self, termo, modo="e", limite=None):
+        return self.estoque.buscar_por_nome(termo, modo, limite)
+
+    def buscar_produtos_por_preco(self, minimo=None, maximo=None, inicio=0, limite=None):
+        return self.estoque.buscar_por_preco(minimo, maximo, inicio, limite)
+
+    def calcular_total_com_promocoes(self, compra):
+        return self.promocoes.calcular_total(compra)
+
+    def finalizar_compra(self, cliente_id, carrinho, endereco, gateway=None, metodo="cartao",
+                         agendar_entrega=None):
+        pedido, pagamento = self._iniciar_checkout(cliente_id, carrinho, metodo)
+        if pedido is None:
+            return None
+        try:
+            pagamento.processar_pagamento(gateway)
+        except BaseException:
+            self._desfazer_checkout(pedido)
+            raise
+        entrega = self._concluir_checkout(pedido, pagamento, carrinho, endereco)
+        if entrega is not None and agendar_entrega is not None:
+            agendar_entrega(entrega)
+        return pedido, pagamento, entrega
+
+    def _iniciar_checkout(self, cliente_id, carrinho, metodo):
+        if self.buscar_cliente(cliente_id) is None:
+            raise ValueError(f"Cliente não encontrado: {cliente_id}")
+        itens = carrinho.itens
+        if not itens:
+            raise ValueError("Carrinho vazio")
+        # O estoque é reservado antes da cobrança e devolvido se ela for recusada
+        if not self.estoque.reservar_itens((item.produto.id, item.quantidade) for item in itens):
+            return None, None
+        pedido = self.criar_pedido(cliente_id)
+        for item in itens:
+            pedido.adicionar_item(item.produto, item.quantidade)
+        return pedido, Pagamento(pedido.id, pedido.total, metodo)
+
+    def _concluir_checkout(self, pedido, pagamento, carrinho, endereco):
+        if pagamento.status != "processado":
+            self._desfazer_checkout(pedido)
+            return None
+        pedido.confirmar_pedido()
+        self.buscar_cliente(pedido.cliente_id).adicionar_compra(pedido)
+        carrinho.limpar_carrinho()
+        return self.entregas.adicionar(Entrega(pedido.id, pedido.id, endereco))
+
+    def _desfazer_checkout(self, pedido):
+        # Cobrança recusada ou que falhou: devolve o estoque reservado
+        self.estoque.liberar_itens((item.produto.id, item.quantidade) for item in pedido.itens)
+        pedido.cancelar_pedido()
+
+    def salvar_snapshot(self, caminho):
+        snapshot.salvar(self, caminho)
+
+    def publicar_catalogo(self, caminho):
+        return catalogo_mmap.publicar(self.estoque.listar_produtos(), caminho)
+
+    @classmethod
+    def carregar_snapshot(cls, caminho, catalogo=None):
+        loja = cls(catalogo)
+        snapshot.carregar(loja, caminho)
+        return loja
+
+    def ativar_diario(self, diario):
+        self.diario = diario
+        self.estoque.diario = diario
+        for cliente in self.clientes.values():
+            cliente._diario = diario
+        for pedido in self.pedidos.values():
+            pedido._diario = diario
+
+    def checkpoint(self, caminho_snapshot):
+        self.diario.checkpoint(lambda geracao: snapshot.salvar(self, caminho_snapshot, geracao))
+
+    @classmethod
+    def recuperar(cls, caminho_diario, caminho_snapshot=None, politica="sempre", catalogo=None):
+        loja = cls(catalogo)
+        marca = 0
+        if caminho_snapshot is not None and os.path.exists(caminho_snapshot):
+            marca = snapshot.carregar(loja, caminho_snapshot)
+        reproduzir(loja, caminho_diario, marca)
+        loja._ids_pedidos = Sequencia(max(loja.pedidos, default=0) + 1)
+        loja.ativar_diario(Diario(caminho_diario, politica, geracao_minima=marca + 1))
+        return loja
\ No newline at end of file
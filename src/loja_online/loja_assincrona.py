@@ -0,0 +1,42 @@
+import asyncio
+
+
+class LojaAssincrona:
+    # Fachada asyncio sobre a Loja: reserva de estoque e criação do pedido
+    # continuam síncronas (rápidas, sem E/S); a cobrança e o agendamento da
+    # entrega são aguardados, então milhares de checkouts podem esperar o
+    # gateway ao mesmo tempo em um único processo.
+    def __init__(self, loja, gateway, agendar_entrega=None, limite_simultaneos=None):
+        self.loja = loja
+        self.gateway = gateway
+        self.agendar_entrega = agendar_entrega
+        self.limite_simultaneos = limite_simultaneos
+        self._semaforo = None
+
+    async def finalizar_compra(self, cliente_id, carrinho, endereco, metodo="cartao"):
+        if not self.limite_simultaneos:
+            return await self._finalizar_compra(cliente_id, carrinho, endereco, metodo)
+        if self._semaforo is None:
+            # Criado dentro do loop em execução (no Python < 3.10 o semáforo
+            # se prende ao loop corrente na construção)
+            self._semaforo = asyncio.Semaphore(self.limite_simultaneos)
+        async with self._semaforo:
+            return await self._finalizar_compra(cliente_id, carrinho, endereco, metodo)
+
+    async def finalizar_compras(self, compras):
+        return await asyncio.gather(*(self.finalizar_compra(*compra) for compra in compras))
+
+    async def _finalizar_compra(self, cliente_id, carrinho, endereco, metodo):
+        pedido, pagamento = self.loja._iniciar_checkout(cliente_id, carrinho, metodo)
+        if pedido is None:
+            return None
+        try:
+            await pagamento.processar_pagamento_async(self.gateway)
+        except BaseException:
+            # Inclui o cancelamento da tarefa: o estoque reservado volta
+            self.loja._desfazer_checkout(pedido)
+            raise
+        entrega = self.loja._concluir_checkout(pedido, pagamento, carrinho, endereco)
+        if entrega is not None and self.agendar_entrega is not None:
+            await self.agendar_entrega(entrega)
+        return pedido, pagamento, entrega
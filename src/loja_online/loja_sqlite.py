@@ -0,0 +1,417 @@
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+
+from .cliente import Cliente
+from .loja import Loja
+from .pedido import Pedido
+from .produto import Produto
+from .travas import TRAVAS_ESTOQUE
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS produtos (
+    id INTEGER PRIMARY KEY, nome TEXT NOT NULL, preco REAL NOT NULL, estoque INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS clientes (
+    id INTEGER PRIMARY KEY, nome TEXT NOT NULL, email TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS pedidos (
+    id INTEGER PRIMARY KEY, cliente_id INTEGER NOT NULL, status TEXT NOT NULL, total REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS itens_pedido (
+    pedido_id INTEGER NOT NULL, produto_id INTEGER NOT NULL, quantidade INTEGER NOT NULL,
+    preco REAL NOT NULL, PRIMARY KEY (pedido_id, produto_id)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS compras (
+    id INTEGER PRIMARY KEY, cliente_id INTEGER NOT NULL, pedido_id INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS compras_por_cliente ON compras (cliente_id);
+"""
+
+_ESTOQUE = Produto.estoque
+_PRECO = Produto.preco
+
+
+class _EstoqueInsuficiente(Exception):
+    pass
+
+
+class _ConexaoDaThread:
+    # Guardada no threading.local: é descartada quando a thread termina, e o
+    # finalizador associado fecha a conexão junto
+    __slots__ = ("conexao", "__weakref__")
+
+    def __init__(self, conexao):
+        self.conexao = conexao
+
+
+def _descartar_conexao(conexoes, trava, conexao):
+    with trava:
+        conexoes.discard(conexao)
+    conexao.close()
+
+
+class BancoSQLite:
+    def __init__(self, caminho):
+        self.caminho = str(caminho)
+        self._local = threading.local()
+        self._conexoes = set()
+        self._trava = threading.Lock()
+        self.conexao().executescript(ESQUEMA)
+
+    def conexao(self):
+        # Uma conexão por thread, fechada quando a thread termina; o sqlite3
+        # mantém em cada conexão o cache de comandos preparados, reaproveitados
+        # pelo texto SQL constante. check_same_thread=False só para que fechar()
+        # e o fim da thread as encerrem de outra thread.
+        dona = getattr(self._local, "dona", None)
+        if dona is None:
+            conexao = sqlite3.connect(self.caminho, isolation_level=None, cached_statements=256,
+                                      check_same_thread=False)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            dona = _ConexaoDaThread(conexao)
+            weakref.finalize(dona, _descartar_conexao, self._conexoes, self._trava, conexao)
+            self._local.dona = dona
+            with self._trava:
+                self._conexoes.add(conexao)
+        return dona.conexao
+
+    def conexoes_abertas(self):
+        with self._trava:
+            return len(self._conexoes)
+
+    def executar(self, sql, parametros=()):
+        return self.conexao().execute(sql, parametros)
+
+    def consultar(self, sql, parametros=()):
+        return self.conexao().execute(sql, parametros).fetchall()
+
+    def valor(self, sql, parametros=()):
+        return self.conexao().execute(sql, parametros).fetchone()[0]
+
+    @contextmanager
+    def transacao(self):
+        conexao = self.conexao()
+        conexao.execute("BEGIN IMMEDIATE")
+        try:
+            yield conexao
+        except BaseException:
+            conexao.execute("ROLLBACK")
+            raise
+        conexao.execute("COMMIT")
+
+    def fechar(self):
+        with self._trava:
+            for conexao in self._conexoes:
+                conexao.close()
+            self._conexoes.clear()
+        self._local = threading.local()
+
+
+class ProdutoSQLite(Produto):
+    __slots__ = ("_banco", "__weakref__")
+
+    @classmethod
+    def _criar(cls, banco, id, nome, preco, estoque):
+        produto = cls.__new__(cls)
+        produto._banco = banco
+        produto.id = id
+        produto.nome = nome
+        _PRECO.__set__(produto, preco)
+        _ESTOQUE.__set__(produto, estoque)
+        return produto
+
+    @property
+    def preco(self):
+        return _PRECO.__get__(self)
+
+    @preco.setter
+    def preco(self, valor):
+        _PRECO.__set__(self, valor)
+        self._banco.executar("UPDATE produtos SET preco = ? WHERE id = ?", (valor, self.id))
+
+    @property
+    def estoque(self):
+        return _ESTOQUE.__get__(self)
+
+    @estoque.setter
+    def estoque(self, valor):
+        _ESTOQUE.__set__(self, valor)
+        self._banco.executar("UPDATE produtos SET estoque = ? WHERE id = ?", (valor, self.id))
+
+    def reduzir_estoque(self, quantidade):
+        # O banco decide se há estoque; o valor em cache pode estar atrasado
+        # em relação a outras conexões e só é atualizado com o que foi gravado
+        with TRAVAS_ESTOQUE.trava(self.id):
+            linha = self._banco.executar(
+                "UPDATE produtos SET estoque = estoque - ? WHERE id = ? AND estoque >= ? "
+                "RETURNING estoque", (quantidade, self.id, quantidade)).fetchone()
+            if linha is None:
+                return False
+            _ESTOQUE.__set__(self, linha[0])
+            return True
+
+    def aumentar_estoque(self, quantidade):
+        with TRAVAS_ESTOQUE.trava(self.id):
+            linha = self._banco.executar(
+                "UPDATE produtos SET estoque = estoque + ? WHERE id = ? RETURNING estoque",
+                (quantidade, self.id)).fetchone()
+            if linha is not None:
+                _ESTOQUE.__set__(self, linha[0])
+
+
+class CatalogoSQLite(MutableMapping):
+    def __init__(self, banco, tamanho_cache=100_000):
+        self.banco = banco
+        self.tamanho_cache = tamanho_cache
+        # Produtos vivos mantêm a mesma identidade enquanto alguém os referencia;
+        # os mais recentes ficam também no cache LRU, mesmo sem referências.
+        self._vivos = weakref.WeakValueDictionary()
+        self._recentes = OrderedDict()
+        self._trava = threading.RLock()
+
+    def __getitem__(self, produto_id):
+        with self._trava:
+            produto = self._recentes.get(produto_id)
+            if produto is not None:
+                self._recentes.move_to_end(produto_id)
+                return produto
+            produto = self._vivos.get(produto_id)
+            if produto is None:
+                linha = self.banco.executar(
+                    "SELECT id, nome, preco, estoque FROM produtos WHERE id = ?",
+                    (produto_id,)).fetchone()
+                if linha is None:
+                    raise KeyError(produto_id)
+                produto = self._registrar(linha)
+            self._lembrar(produto)
+            return produto
+
+    def __setitem__(self, produto_id, produto):
+        self.adicionar(produto)
+
+    def __delitem__(self, produto_id):
+        with self._trava:
+            cursor = self.banco.executar("DELETE FROM produtos WHERE id = ?", (produto_id,))
+            self._recentes.pop(produto_id, None)
+            self._vivos.pop(produto_id, None)
+            if cursor.rowcount == 0:
+                raise KeyError(produto_id)
+
+    def __contains__(self, produto_id):
+        if produto_id in self._recentes:
+            return True
+        return self.banco.executar(
+            "SELECT 1 FROM produtos WHERE id = ?", (produto_id,)).fetchone() is not None
+
+    def __iter__(self):
+        return iter([linha[0] for linha in self.banco.consultar("SELECT id FROM produtos ORDER BY id")])
+
+    def __len__(self):
+        return self.banco.valor("SELECT COUNT(*) FROM produtos")
+
+    def values(self):
+        linhas = self.banco.consultar("SELECT id, nome, preco, estoque FROM produtos ORDER BY id")
+        with self._trava:
+            return [self._vivos.get(linha[0]) or self._registrar(linha) for linha in linhas]
+
+    def items(self):
+        return [(produto.id, produto) for produto in self.values()]
+
+    def adicionar(self, produto):
+        linha = (produto.id, produto.nome, produto.preco, produto.estoque)
+        with self._trava:
+            self.banco.executar("INSERT OR REPLACE INTO produtos VALUES (?, ?, ?, ?)", linha)
+            self._vivos.pop(produto.id, None)
+            armazenado = self._registrar(linha)
+            self._lembrar(armazenado)
+            return armazenado
+
+    def adicionar_linhas(self, linhas):
+        # A chave primária recusa ids repetidos e a transação desfaz o lote inteiro
+        try:
+            return self._gravar_linhas("INSERT INTO produtos VALUES (?, ?, ?, ?)", linhas)
+        except sqlite3.IntegrityError:
+            raise ValueError("Ids de produto repetidos no cadastro em lote") from None
+
+    def update(self, outro=(), **kwargs):
+        produtos = dict(outro, **kwargs).values()
+        self._gravar_linhas("INSERT OR REPLACE INTO produtos VALUES (?, ?, ?, ?)",
+                            ((p.id, p.nome, p.preco, p.estoque) for p in produtos))
+
+    def reservar_itens(self, quantidades):
+        # Uma transação imediata com baixa condicional por linha: ou todas as
+        # linhas têm estoque no banco, ou nada é gravado. Os valores em cache
+        # são atualizados antes do COMMIT, enquanto nenhuma outra conexão
+        # consegue gravar, para que fiquem na mesma ordem das gravações; sem
+        # a trava do catálogo, que adicionar() segura enquanto espera o banco.
+        try:
+            with self.banco.transacao() as conexao:
+                estoques = []
+                for produto_id, quantidade in quantidades:
+                    linha = conexao.execute(
+                        "UPDATE produtos SET estoque = estoque - ? WHERE id = ? AND estoque >= ? "
+                        "RETURNING estoque", (quantidade, produto_id, quantidade)).fetchone()
+                    if linha is None:
+                        raise _EstoqueInsuficiente
+                    estoques.append((produto_id, linha[0]))
+                for produto_id, estoque in estoques:
+                    produto = self._vivos.get(produto_id)
+                    if produto is not None:
+                        _ESTOQUE.__set__(produto, estoque)
+        except _EstoqueInsuficiente:
+            return False
+        return True
+
+    def reajustar_precos(self, porcentagem):
+        fator = 1 + porcentagem / 100
+        with self._trava:
+            self.banco.executar("UPDATE produtos SET preco = preco * ?", (fator,))
+            for produto in list(self._vivos.values()):
+                _PRECO.__set__(produto, _PRECO.__get__(produto) * fator)
+
+    def _gravar_linhas(self, sql, linhas):
+        linhas = [tuple(linha) for linha in linhas]
+        with self._trava:
+            with self.banco.transacao() as conexao:
+                conexao.executemany(sql, linhas)
+            for linha in linhas:
+                self._recentes.pop(linha[0], None)
+                self._vivos.pop(linha[0], None)
+            return [self._registrar(linha) for linha in linhas]
+
+    def _registrar(self, linha):
+        produto = ProdutoSQLite._criar(self.banco, *linha)
+        self._vivos[produto.id] = produto
+        return produto
+
+    def _lembrar(self, produto):
+        self._recentes[produto.id] = produto
+        if len(self._recentes) > self.tamanho_cache:
+            self._recentes.popitem(last=False)
+
+
+class ClienteSQLite(Cliente):
+    __slots__ = ("_banco",)
+
+    def __init__(self, banco, id, nome, email):
+        super().__init__(id, nome, email)
+        self._banco = banco
+
+    def adicionar_compra(self, compra):
+        self._banco.executar(
+            "INSERT INTO compras (cliente_id, pedido_id) VALUES (?, ?)", (self.id, compra.id))
+        super().adicionar_compra(compra)
+
+
+class PedidoSQLite(Pedido):
+    __slots__ = ("_banco",)
+
+    def __init__(self, banco, id, cliente_id):
+        super().__init__(id, cliente_id)
+        self._banco = banco
+
+    def adicionar_item(self, produto, quantidade):
+        super().adicionar_item(produto, quantidade)
+        item = self._itens[produto.id]
+        with self._banco.transacao() as conexao:
+            conexao.execute(
+                "INSERT INTO itens_pedido VALUES (?, ?, ?, ?) ON CONFLICT (pedido_id, produto_id) "
+                "DO UPDATE SET quantidade = excluded.quantidade",
+                (self.id, produto.id, item.quantidade, produto.preco))
+            conexao.execute("UPDATE pedidos SET total = ? WHERE id = ?", (self.total, self.id))
+
+    def remover_item(self, produto_id, quantidade=None):
+        if not super().remover_item(produto_id, quantidade):
+            return False
+        item = self._itens.get(produto_id)
+        with self._banco.transacao() as conexao:
+            if item is None:
+                conexao.execute("DELETE FROM itens_pedido WHERE pedido_id = ? AND produto_id = ?",
+                                (self.id, produto_id))
+            else:
+                conexao.execute("UPDATE itens_pedido SET quantidade = ? "
+                                "WHERE pedido_id = ? AND produto_id = ?",
+                                (item.quantidade, self.id, produto_id))
+            conexao.execute("UPDATE pedidos SET total = ? WHERE id = ?", (self.total, self.id))
+        return True
+
+    def confirmar_pedido(self):
+        super().confirmar_pedido()
+        self._gravar_status()
+
+    def cancelar_pedido(self):
+        super().cancelar_pedido()
+        self._gravar_status()
+
+    def _gravar_status(self):
+        self._banco.executar("UPDATE pedidos SET status = ? WHERE id = ?", (self.status, self.id))
+
+
+class LojaSQLite(Loja):
+    def __init__(self, caminho, tamanho_cache=100_000):
+        self.banco = BancoSQLite(caminho)
+        super().__init__(CatalogoSQLite(self.banco, tamanho_cache))
+        self._trava_cadastros = threading.Lock()
+
+    def cadastrar_cliente(self, id, nome, email):
+        self.banco.executar("INSERT OR REPLACE INTO clientes VALUES (?, ?, ?)", (id, nome, email))
+        cliente = ClienteSQLite(self.banco, id, nome, email)
+        self.clientes[id] = cliente
+        return cliente
+
+    def criar_pedido(self, cliente_id):
+        # O SQLite atribui o id sob a trava de escrita do banco, única entre processos
+        pedido_id = self.banco.valor("INSERT INTO pedidos VALUES (NULL, ?, ?, ?) RETURNING id",
+                                     (cliente_id, "pendente", 0))
+        pedido = PedidoSQLite(self.banco, pedido_id, cliente_id)
+        self.pedidos[pedido_id] = pedido
+        return pedido
+
+    def buscar_cliente(self, cliente_id):
+        cliente = self.clientes.get(cliente_id)
+        if cliente is None:
+            with self._trava_cadastros:
+                cliente = self.clientes.get(cliente_id) or self._carregar_cliente(cliente_id)
+        return cliente
+
+    def buscar_pedido(self, pedido_id):
+        pedido = self.pedidos.get(pedido_id)
+        if pedido is None:
+            with self._trava_cadastros:
+                pedido = self.pedidos.get(pedido_id) or self._carregar_pedido(pedido_id)
+        return pedido
+
+    def fechar(self):
+        self.banco.fechar()
+
+    def _carregar_cliente(self, cliente_id):
+        linha = self.banco.executar(
+            "SELECT id, nome, email FROM clientes WHERE id = ?", (cliente_id,)).fetchone()
+        if linha is None:
+            return None
+        cliente = ClienteSQLite(self.banco, *linha)
+        compras = self.banco.consultar(
+            "SELECT pedido_id FROM compras WHERE cliente_id = ? ORDER BY id", (cliente_id,))
+        for pedido_id, in compras:
+            pedido = self.pedidos.get(pedido_id) or self._carregar_pedido(pedido_id)
+            # Compra já gravada: só reconstrói histórico e agregados em memória
+            Cliente.adicionar_compra(cliente, pedido)
+        self.clientes[cliente_id] = cliente
+        return cliente
+
+    def _carregar_pedido(self, pedido_id):
+        linha = self.banco.executar(
+            "SELECT cliente_id, status, total FROM pedidos WHERE id = ?", (pedido_id,)).fetchone()
+        if linha is None:
+            return None
+        cliente_id, status, total = linha
+        pedido = PedidoSQLite(self.banco, pedido_id, cliente_id)
+        itens = self.banco.consultar(
+            "SELECT produto_id, quantidade, preco FROM itens_pedido WHERE pedido_id = ?", (pedido_id,))
+        for produto_id, quantidade, preco in itens:
+            produto = self.buscar_produto(produto_id) or Produto(produto_id, "", preco)
+            Pedido.adicionar_item(pedido, produto, quantidade)
+        pedido.total = total
+        pedido.status = status
+        self.pedidos[pedido_id] = pedido
+        return pedido
@@ -1,9 +1,31 @@
+import os
+
+from .catalogo_mmap import CatalogoMmap
+from .estoque_compartilhado import CatalogoCompartilhado, MemoriaEstoque
 from .loja import Loja
 from .utilitarios import Utilitarios
 
-def main():
-    loja = Loja()
-    
+def carregar_loja():
+    # Com LOJA_ESTOQUE_COMPARTILHADO, os workers usam o mesmo segmento de
+    # memória para os contadores de estoque
+    catalogo = None
+    nome = os.environ.get("LOJA_ESTOQUE_COMPARTILHADO")
+    if nome:
+        capacidade = int(os.environ.get("LOJA_ESTOQUE_CAPACIDADE", 1_000_000))
+        catalogo = CatalogoCompartilhado(MemoriaEstoque(nome, capacidade))
+
+    caminho = os.environ.get("LOJA_SNAPSHOT")
+    if caminho and os.path.exists(caminho):
+        return Loja.carregar_snapshot(caminho, catalogo)
+    return Loja(catalogo)
+
+def carregar_catalogo():
+    caminho = os.environ.get("LOJA_CATALOGO")
+    if caminho and os.path.exists(caminho):
+        return CatalogoMmap(caminho)
+    return None
+
+def cadastrar_exemplo(loja):
     produto1 = loja.cadastrar_produto(1, "Notebook", 2500.00)
     produto1.definir_estoque(10)
     
@@ -20,8 +42,21 @@ def main():
     
     pedido.confirmar_pedido()
     cliente1.adicionar_compra(pedido)
+
+def main():
+    loja = carregar_loja()
     
-    print(f"Total gasto pelo cliente: {Utilitarios.formatar_preco(cliente1.obter_total_gasto())}")
+    # Após uma partida a quente os dados já vieram do snapshot; cadastrá-los
+    # de novo substituiria o cliente (e o histórico) e o estoque carregados
+    if not loja.clientes and not loja.produtos:
+        cadastrar_exemplo(loja)
+    
+    cliente1 = loja.buscar_cliente(1)
+    if cliente1 is not None:
+        print(f"Total gasto pelo cliente: {Utilitarios.formatar_preco(cliente1.obter_total_gasto())}")
+
+    if os.environ.get("LOJA_SNAPSHOT"):
+        loja.salvar_snapshot(os.environ["LOJA_SNAPSHOT"])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,13 +1,24 @@
 class Pagamento:
+    __slots__ = ("id", "valor", "metodo", "status")
+
     def __init__(self, id, valor, metodo):
         self.id = id
         self.valor = valor
         self.metodo = metodo
         self.status = "pendente"
 
-    def processar_pagamento(self):
-        self.status = "processado"
-        return True
+    def processar_pagamento(self, gateway=None):
+        if gateway is None:
+            self.status = "processado"
+            return True
+        return self._registrar_resultado(gateway.cobrar(self))
+
+    async def processar_pagamento_async(self, gateway):
+        return self._registrar_resultado(await gateway.cobrar_async(self))
+
+    def _registrar_resultado(self, aprovado):
+        self.status = "processado" if aprovado else "recusado"
+        return aprovado
 
     def cancelar_pagamento(self):
         self.status = "cancelado"
@@ -1,21 +1,89 @@
+from contextlib import nullcontext
+
+
+class ItemPedido:
+    __slots__ = ("produto", "quantidade")
+
+    def __init__(self, produto, quantidade):
+        self.produto = produto
+        self.quantidade = quantidade
+
+    def __getitem__(self, chave):
+        if chave not in ItemPedido.__slots__:
+            raise KeyError(chave)
+        return getattr(self, chave)
+
+
 class Pedido:
+    __slots__ = ("id", "cliente_id", "_itens", "total", "status", "_cliente", "_diario")
+
     def __init__(self, id, cliente_id):
         self.id = id
         self.cliente_id = cliente_id
-        self.itens = []
+        self._itens = {}
         self.total = 0
         self.status = "pendente"
+        self._cliente = None
+        self._diario = None
+
+    @property
+    def itens(self):
+        return list(self._itens.values())
 
     def adicionar_item(self, produto, quantidade):
-        item = {"produto": produto, "quantidade": quantidade}
-        self.itens.append(item)
-        self.calcular_total()
+        with self._mutacao():
+            item = self._itens.get(produto.id)
+            if item is None:
+                self._itens[produto.id] = ItemPedido(produto, quantidade)
+            else:
+                item.quantidade += quantidade
+            self.total += produto.preco * quantidade
+            sequencia = self._anexar("adicionar_item", self.id, produto.id, quantidade, produto.preco)
+        self._aguardar(sequencia)
+
+    def remover_item(self, produto_id, quantidade=None):
+        with self._mutacao():
+            item = self._itens.get(produto_id)
+            if item is None:
+                return False
+            if quantidade is None or quantidade >= item.quantidade:
+                quantidade = item.quantidade
+                del self._itens[produto_id]
+            else:
+                item.quantidade -= quantidade
+            self.total = self.total - item.produto.preco * quantidade if self._itens else 0
+            sequencia = self._anexar("remover_item", self.id, produto_id, quantidade)
+        self._aguardar(sequencia)
+        return True
 
     def calcular_total(self):
-        self.total = sum(item["produto"].preco * item["quantidade"] for item in self.itens)
+        self.total = sum(item.produto.preco * item.quantidade for item in self._itens.values())
+        return self.total
 
     def confirmar_pedido(self):
-        self.status = "confirmado"
+        with self._mutacao():
+            self.status = "confirmado"
+            sequencia = self._anexar("confirmar_pedido", self.id)
+        self._aguardar(sequencia)
 
     def cancelar_pedido(self):
-        self.status = "cancelado"
\ No newline at end of file
+        with self._mutacao():
+            if self.status == "cancelado":
+                return
+            self.status = "cancelado"
+            if self._cliente is not None:
+                self._cliente.estornar_compra(self)
+            sequencia = self._anexar("cancelar_pedido", self.id)
+        self._aguardar(sequencia)
+
+    def _mutacao(self):
+        return nullcontext() if self._diario is None else self._diario.mutacao()
+
+    def _anexar(self, operacao, *argumentos):
+        if self._diario is None:
+            return None
+        return self._diario.anexar(operacao, *argumentos)
+
+    def _aguardar(self, sequencia):
+        if sequencia is not None:
+            self._diario.aguardar(sequencia)
@@ -0,0 +1,108 @@
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .gateway_pagamento import FalhaGateway
+
+_FIM = object()
+
+
+class ProcessadorPagamentos:
+    # Pagamentos enviados entram em uma fila limitada; um despachante junta
+    # até `tamanho_lote` deles (ou o que chegar em `intervalo` segundos) e
+    # entrega cada lote a um pool de `trabalhadores`. Com todos ocupados, o
+    # despachante para de consumir, a fila enche e enviar() bloqueia.
+    def __init__(self, gateway, tamanho_lote=50, trabalhadores=8, intervalo=0.005,
+                 tentativas=3, espera_base=0.01, espera_maxima=0.5, limite_pendentes=10_000,
+                 semente=None):
+        self.gateway = gateway
+        self.tamanho_lote = tamanho_lote
+        self.intervalo = intervalo
+        self.tentativas = tentativas
+        self.espera_base = espera_base
+        self.espera_maxima = espera_maxima
+        self.repeticoes = 0
+        self._aleatorio = random.Random(semente)
+        self._trava = threading.Lock()
+        self._fila = queue.Queue(maxsize=limite_pendentes)
+        self._vagas = threading.BoundedSemaphore(trabalhadores)
+        self._executor = ThreadPoolExecutor(max_workers=trabalhadores)
+        self._despachante = threading.Thread(target=self._despachar, daemon=True)
+        self._despachante.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def enviar(self, pagamento):
+        futuro = Future()
+        self._fila.put((pagamento, futuro))
+        return futuro
+
+    def processar(self, pagamentos):
+        futuros = [self.enviar(pagamento) for pagamento in pagamentos]
+        return [futuro.result() for futuro in futuros]
+
+    def fechar(self):
+        self._fila.put(_FIM)
+        self._despachante.join()
+        self._executor.shutdown(wait=True)
+
+    def _despachar(self):
+        while True:
+            lote, fim = self._proximo_lote()
+            if lote:
+                self._vagas.acquire()
+                self._executor.submit(self._processar_lote, lote)
+            if fim:
+                return
+
+    def _proximo_lote(self):
+        item = self._fila.get()
+        if item is _FIM:
+            return [], True
+        lote = [item]
+        prazo = time.monotonic() + self.intervalo
+        while len(lote) < self.tamanho_lote:
+            restante = prazo - time.monotonic()
+            try:
+                item = self._fila.get(timeout=restante) if restante > 0 else self._fila.get_nowait()
+            except queue.Empty:
+                break
+            if item is _FIM:
+                return lote, True
+            lote.append(item)
+        return lote, False
+
+    def _processar_lote(self, lote):
+        try:
+            pagamentos = [pagamento for pagamento, _ in lote]
+            try:
+                resultados = self._cobrar_com_repeticao(pagamentos)
+            except Exception as erro:
+                for _, futuro in lote:
+                    futuro.set_exception(erro)
+                return
+            for (pagamento, futuro), aprovado in zip(lote, resultados):
+                futuro.set_result(pagamento._registrar_resultado(aprovado))
+        finally:
+            self._vagas.release()
+
+    def _cobrar_com_repeticao(self, pagamentos):
+        for tentativa in range(self.tentativas):
+            try:
+                return self.gateway.cobrar_lote(pagamentos)
+            except FalhaGateway:
+                if tentativa == self.tentativas - 1:
+                    raise
+            # Espera exponencial com jitter completo: lotes que falharam
+            # juntos não voltam ao gateway todos no mesmo instante
+            with self._trava:
+                self.repeticoes += 1
+                espera = self._aleatorio.uniform(
+                    0, min(self.espera_maxima, self.espera_base * 2 ** tentativa))
+            time.sleep(espera)
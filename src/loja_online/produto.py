@@ -1,21 +1,28 @@
+from .travas import TRAVAS_ESTOQUE
+
+
 class Produto:
-    def __init__(self, id, nome, preco):
+    __slots__ = ("id", "nome", "preco", "estoque")
+
+    def __init__(self, id, nome, preco, estoque=0):
         self.id = id
         self.nome = nome
         self.preco = preco
-        self.estoque = 0
+        self.estoque = estoque
 
     def definir_estoque(self, quantidade):
         self.estoque = quantidade
 
     def reduzir_estoque(self, quantidade):
-        if self.estoque >= quantidade:
-            self.estoque -= quantidade
-            return True
-        return False
+        with TRAVAS_ESTOQUE.trava(self.id):
+            if self.estoque >= quantidade:
+                self.estoque -= quantidade
+                return True
+            return False
 
     def aumentar_estoque(self, quantidade):
-        self.estoque += quantidade
+        with TRAVAS_ESTOQUE.trava(self.id):
+            self.estoque += quantidade
 
     def obter_preco(self):
         return self.preco
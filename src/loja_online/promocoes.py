@@ -0,0 +1,97 @@
+import threading
+
+from .utilitarios import Utilitarios
+
+
+class PromocaoPercentual:
+    __slots__ = ("id", "produtos_ids", "porcentagem")
+
+    def __init__(self, id, produtos_ids, porcentagem):
+        self.id = id
+        self.produtos_ids = frozenset(produtos_ids)
+        self.porcentagem = porcentagem
+
+    def calcular_desconto(self, preco, quantidade):
+        return Utilitarios.calcular_desconto(preco * quantidade, self.porcentagem)
+
+
+class PromocaoLeveXPagueY:
+    __slots__ = ("id", "produtos_ids", "leve", "pague")
+
+    def __init__(self, id, produtos_ids, leve, pague):
+        if not 0 <= pague < leve:
+            raise ValueError("pague deve ser menor que leve")
+        self.id = id
+        self.produtos_ids = frozenset(produtos_ids)
+        self.leve = leve
+        self.pague = pague
+
+    def calcular_desconto(self, preco, quantidade):
+        gratuitos = quantidade // self.leve * (self.leve - self.pague)
+        return preco * gratuitos
+
+
+class PromocaoProgressiva:
+    __slots__ = ("id", "produtos_ids", "faixas")
+
+    def __init__(self, id, produtos_ids, faixas):
+        self.id = id
+        self.produtos_ids = frozenset(produtos_ids)
+        # (quantidade mínima, porcentagem), da maior faixa para a menor
+        self.faixas = sorted(faixas, reverse=True)
+
+    def calcular_desconto(self, preco, quantidade):
+        for minimo, porcentagem in self.faixas:
+            if quantidade >= minimo:
+                return Utilitarios.calcular_desconto(preco * quantidade, porcentagem)
+        return 0
+
+
+class MotorPromocoes:
+    def __init__(self):
+        self.promocoes = {}
+        self._por_produto = None
+        self._trava = threading.Lock()
+
+    def adicionar(self, promocao):
+        with self._trava:
+            self.promocoes[promocao.id] = promocao
+            self._por_produto = None
+
+    def remover(self, promocao_id):
+        with self._trava:
+            removida = self.promocoes.pop(promocao_id, None)
+            if removida is not None:
+                self._por_produto = None
+            return removida is not None
+
+    def compilar(self):
+        with self._trava:
+            if self._por_produto is None:
+                por_produto = {}
+                for promocao in self.promocoes.values():
+                    for produto_id in promocao.produtos_ids:
+                        por_produto.setdefault(produto_id, []).append(promocao)
+                self._por_produto = {produto_id: tuple(regras)
+                                     for produto_id, regras in por_produto.items()}
+            return self._por_produto
+
+    def calcular_desconto_item(self, produto, quantidade):
+        # Promoções não se acumulam: vale a de maior desconto para a linha
+        regras = self.compilar().get(produto.id)
+        if not regras:
+            return 0
+        return max(regra.calcular_desconto(produto.preco, quantidade) for regra in regras)
+
+    def calcular_desconto(self, compra):
+        por_produto = self.compilar()
+        desconto = 0
+        for item in compra.itens:
+            regras = por_produto.get(item.produto.id)
+            if regras:
+                desconto += max(regra.calcular_desconto(item.produto.preco, item.quantidade)
+                                for regra in regras)
+        return desconto
+
+    def calcular_total(self, compra):
+        return compra.calcular_total() - self.calcular_desconto(compra)
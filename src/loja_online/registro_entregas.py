@@ -0,0 +1,102 @@
+import threading
+
+STATUS_ENTREGA = ("preparando", "em_transito", "entregue")
+
+
+class RegistroEntregas:
+    # Índices status -> conjunto de entregas e pedido_id -> entrega, mantidos
+    # pelas próprias transições de Entrega e pelas transições em lote.
+    def __init__(self):
+        self._por_status = {status: set() for status in STATUS_ENTREGA}
+        self._por_pedido = {}
+        self._trava = threading.Lock()
+
+    def __len__(self):
+        return len(self._por_pedido)
+
+    def __contains__(self, entrega):
+        return entrega._registro is self
+
+    def adicionar(self, entrega):
+        self.adicionar_varias([entrega])
+        return entrega
+
+    def adicionar_varias(self, entregas):
+        entregas = list(entregas)
+        with self._trava:
+            for entrega in entregas:
+                atual = self._por_pedido.get(entrega.pedido_id)
+                if atual is not None and atual is not entrega:
+                    raise ValueError(f"Pedido {entrega.pedido_id} já possui entrega registrada")
+            for entrega in entregas:
+                entrega._registro = self
+                self._por_pedido[entrega.pedido_id] = entrega
+                self._conjunto(entrega.status).add(entrega)
+
+    def remover(self, entrega):
+        with self._trava:
+            if entrega._registro is not self:
+                return False
+            entrega._registro = None
+            del self._por_pedido[entrega.pedido_id]
+            self._conjunto(entrega.status).discard(entrega)
+            return True
+
+    def buscar_por_pedido(self, pedido_id):
+        return self._por_pedido.get(pedido_id)
+
+    def contar(self, status):
+        return len(self._por_status.get(status, ()))
+
+    def contagens(self):
+        return {status: len(entregas) for status, entregas in self._por_status.items()}
+
+    def listar(self, status, limite=None):
+        with self._trava:
+            entregas = self._por_status.get(status, ())
+            if limite is None:
+                return list(entregas)
+            return [entrega for entrega, _ in zip(entregas, range(limite))]
+
+    def iniciar_entregas(self, entregas):
+        return self._mover_varias(entregas, "em_transito")
+
+    def confirmar_entregas(self, entregas):
+        return self._mover_varias(entregas, "entregue")
+
+    def transicionar(self, origem, destino, limite=None):
+        # Move todas (ou até `limite`) as entregas de um status para outro
+        with self._trava:
+            entregas = self._por_status.get(origem, set())
+            if limite is None or limite >= len(entregas):
+                movidas, self._por_status[origem] = entregas, set()
+            else:
+                movidas = {entregas.pop() for _ in range(limite)}
+            for entrega in movidas:
+                entrega.status = destino
+            self._conjunto(destino).update(movidas)
+            return len(movidas)
+
+    def _mover(self, entrega, status):
+        with self._trava:
+            self._conjunto(entrega.status).discard(entrega)
+            entrega.status = status
+            self._conjunto(status).add(entrega)
+
+    def _mover_varias(self, entregas, status):
+        with self._trava:
+            registradas = [entrega for entrega in entregas if entrega._registro is self]
+            destino = self._conjunto(status)
+            for origem, conjunto in self._por_status.items():
+                if conjunto is not destino:
+                    conjunto.difference_update(registradas)
+            for entrega in registradas:
+                entrega.status = status
+            destino.update(registradas)
+            return len(registradas)
+
+    def _conjunto(self, status):
+        conjunto = self._por_status.get(status)
+        if conjunto is None:
+            conjunto = self._por_status[status] = set()
+        return conjunto
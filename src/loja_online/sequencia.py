@@ -0,0 +1,27 @@
+import threading
+
+# Quantidade de ids reservados por thread de uma só vez; a trava global só
+# é tomada quando o bloco da thread se esgota.
+_TAMANHO_BLOCO = 64
+
+
+class Sequencia:
+    def __init__(self, inicio=1, tamanho_bloco=_TAMANHO_BLOCO):
+        self._proximo_bloco = inicio
+        self._tamanho_bloco = tamanho_bloco
+        self._trava = threading.Lock()
+        self._local = threading.local()
+
+    def proximo(self):
+        local = self._local
+        proximo = getattr(local, "proximo", None)
+        if proximo is None or proximo >= local.limite:
+            proximo, local.limite = self._reservar_bloco()
+        local.proximo = proximo + 1
+        return proximo
+
+    def _reservar_bloco(self):
+        with self._trava:
+            inicio = self._proximo_bloco
+            self._proximo_bloco += self._tamanho_bloco
+        return inicio, inicio + self._tamanho_bloco
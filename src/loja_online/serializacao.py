@@ -0,0 +1,94 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from operator import attrgetter
+
+_CODIFICADOR = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+class Serializador:
+    # Os campos são lidos de uma vez por um attrgetter montado na criação;
+    # a tupla resultante é o estado do objeto e serve de versão no cache.
+    def __init__(self, campos, **listas):
+        nomes = [campo if isinstance(campo, str) else campo[0] for campo in campos]
+        caminhos = [campo if isinstance(campo, str) else campo[1] for campo in campos]
+        self._nomes = tuple(nomes)
+        self._obter = attrgetter(*caminhos)
+        self._listas = tuple((nome, attrgetter(atributo), serializador)
+                             for nome, (atributo, serializador) in listas.items())
+
+    def estado(self, objeto):
+        valores = self._obter(objeto)
+        if len(self._nomes) == 1:
+            valores = (valores,)
+        if self._listas:
+            valores += tuple(tuple(map(serializador.estado, obter(objeto)))
+                             for _, obter, serializador in self._listas)
+        return valores
+
+    def dados(self, estado):
+        dados = dict(zip(self._nomes, estado))
+        for (nome, _, serializador), itens in zip(self._listas, estado[len(self._nomes):]):
+            dados[nome] = [serializador.dados(item) for item in itens]
+        return dados
+
+    def codificar(self, objeto):
+        return codificar(self.dados(self.estado(objeto)))
+
+
+def codificar(dados):
+    return _CODIFICADOR.encode(dados).encode("utf-8")
+
+
+def etag(corpo):
+    return hashlib.blake2b(corpo, digest_size=12).hexdigest()
+
+
+PRODUTO = Serializador(["id", "nome", "preco", "estoque"])
+ITEM_PEDIDO = Serializador([("produto_id", "produto.id"), "quantidade", ("preco", "produto.preco")])
+PEDIDO = Serializador(["id", "cliente_id", "status", "total"], itens=("itens", ITEM_PEDIDO))
+CLIENTE = Serializador(["id", "nome", "email", "total_gasto", "quantidade_compras"])
+
+
+class CacheRespostas:
+    def __init__(self, tamanho=100_000):
+        self.tamanho = tamanho
+        self._entradas = OrderedDict()
+        self._trava = threading.Lock()
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def obter(self, chave, serializador, objeto):
+        # Só recodifica quando o estado mudou; o ETag acompanha o corpo em
+        # cache, então um GET condicional responde 304 sem codificar nada.
+        estado = serializador.estado(objeto)
+        with self._trava:
+            entrada = self._entradas.get(chave)
+            if entrada is not None and entrada[0] == estado:
+                self._entradas.move_to_end(chave)
+                return entrada[1], entrada[2]
+
+        corpo = codificar(serializador.dados(estado))
+        marca = etag(corpo)
+        with self._trava:
+            self._entradas[chave] = (estado, corpo, marca)
+            self._entradas.move_to_end(chave)
+            if len(self._entradas) > self.tamanho:
+                self._entradas.popitem(last=False)
+        return corpo, marca
+
+    def obter_lista(self, chave, serializador, objetos):
+        # Listas reaproveitam os corpos já codificados de cada objeto
+        corpos = [self.obter((chave, objeto.id), serializador, objeto)[0] for objeto in objetos]
+        corpo = b"[" + b",".join(corpos) + b"]"
+        return corpo, etag(corpo)
+
+    def invalidar(self, chave):
+        with self._trava:
+            self._entradas.pop(chave, None)
+
+    def limpar(self):
+        with self._trava:
+            self._entradas.clear()
@@ -0,0 +1,186 @@
+import gc
+import os
+import struct
+import sys
+from array import array
+from itertools import accumulate
+
+from .cliente import Cliente
+from .pedido import Pedido
+from .produto import Produto
+from .sequencia import Sequencia
+
+# Cabeçalho: assinatura, versão do formato e ordem dos bytes dos arrays.
+# Cada seção é uma sequência de blocos "<I quantidade" + colunas, terminada
+# por um bloco vazio, de modo que escrita e leitura nunca precisam do
+# catálogo inteiro em um único buffer.
+ASSINATURA = b"LOJASNAP"
+VERSAO = 2
+_CABECALHO = struct.Struct("<8sIB")
+# A partir da versão 2: geração do diário já incluída no snapshot
+_MARCA = struct.Struct("<Q")
+_QUANTIDADE = struct.Struct("<I")
+_ORDEM_BYTES = {"little": 0, "big": 1}
+TAMANHO_BLOCO = 65_536
+
+
+def salvar(loja, caminho, marca=0):
+    temporario = f"{caminho}.tmp"
+    with open(temporario, "wb") as arquivo:
+        arquivo.write(_CABECALHO.pack(ASSINATURA, VERSAO, _ORDEM_BYTES[sys.byteorder]))
+        arquivo.write(_MARCA.pack(marca))
+        _escrever_produtos(arquivo, loja.estoque.listar_produtos())
+        _escrever_clientes(arquivo, list(loja.clientes.values()))
+        _escrever_pedidos(arquivo, list(loja.pedidos.values()))
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+    os.replace(temporario, caminho)
+
+
+def carregar(loja, caminho):
+    # A carga cria milhões de objetos de uma vez; pausar o coletor evita
+    # varreduras completas repetidas sobre objetos que nunca serão lixo.
+    coletor_ativo = gc.isenabled()
+    gc.disable()
+    try:
+        return _carregar(loja, caminho)
+    finally:
+        if coletor_ativo:
+            gc.enable()
+
+
+def _carregar(loja, caminho):
+    with open(caminho, "rb", buffering=1 << 20) as arquivo:
+        assinatura, versao, ordem = _CABECALHO.unpack(arquivo.read(_CABECALHO.size))
+        if assinatura != ASSINATURA or not 1 <= versao <= VERSAO:
+            raise ValueError(f"Snapshot inválido: {caminho}")
+        marca = _MARCA.unpack(arquivo.read(_MARCA.size))[0] if versao >= 2 else 0
+        leitor = _Leitor(arquivo, ordem != _ORDEM_BYTES[sys.byteorder])
+
+        for ids, nomes, precos, estoques in leitor.blocos("q", "s", "d", "q"):
+            loja.cadastrar_produtos_em_lote(colunas=(ids, nomes, precos, estoques))
+
+        historicos = []
+        for ids, nomes, emails, tamanhos, compras in leitor.blocos("q", "s", "s", "I", "q"):
+            for cliente_id, nome, email in zip(ids, nomes, emails):
+                loja.clientes[cliente_id] = Cliente(cliente_id, nome, email)
+            historicos.extend(zip(ids, _fatiar(compras, tamanhos)))
+
+        for colunas in leitor.blocos("q", "q", "s", "d", "I", "q", "q", "d"):
+            ids, clientes_ids, status, totais, tamanhos, produtos_ids, quantidades, precos = colunas
+            itens = zip(_fatiar(produtos_ids, tamanhos), _fatiar(quantidades, tamanhos),
+                        _fatiar(precos, tamanhos))
+            for pedido_id, cliente_id, situacao, total, (produtos, qtds, valores) in zip(
+                    ids, clientes_ids, status, totais, itens):
+                pedido = Pedido(pedido_id, cliente_id)
+                for produto_id, quantidade, preco in zip(produtos, qtds, valores):
+                    produto = loja.buscar_produto(produto_id) or Produto(produto_id, "", preco)
+                    pedido.adicionar_item(produto, quantidade)
+                pedido.total = total
+                pedido.status = situacao
+                loja.pedidos[pedido_id] = pedido
+
+    for cliente_id, compras in historicos:
+        cliente = loja.clientes[cliente_id]
+        for pedido_id in compras:
+            cliente.adicionar_compra(loja.pedidos[pedido_id])
+    loja._ids_pedidos = Sequencia(max(loja.pedidos, default=0) + 1)
+    return marca
+
+
+def _escrever_produtos(arquivo, produtos):
+    for inicio in range(0, len(produtos), TAMANHO_BLOCO):
+        bloco = produtos[inicio:inicio + TAMANHO_BLOCO]
+        _escrever_bloco(arquivo, len(bloco), [
+            array("q", [p.id for p in bloco]),
+            [p.nome for p in bloco],
+            array("d", [p.preco for p in bloco]),
+            array("q", [p.estoque for p in bloco]),
+        ])
+    _escrever_bloco(arquivo, 0, [])
+
+
+def _escrever_clientes(arquivo, clientes):
+    for inicio in range(0, len(clientes), TAMANHO_BLOCO):
+        bloco = clientes[inicio:inicio + TAMANHO_BLOCO]
+        _escrever_bloco(arquivo, len(bloco), [
+            array("q", [c.id for c in bloco]),
+            [c.nome for c in bloco],
+            [c.email for c in bloco],
+            array("I", [len(c.historico) for c in bloco]),
+            array("q", [compra.id for c in bloco for compra in c.historico]),
+        ])
+    _escrever_bloco(arquivo, 0, [])
+
+
+def _escrever_pedidos(arquivo, pedidos):
+    for inicio in range(0, len(pedidos), TAMANHO_BLOCO):
+        bloco = pedidos[inicio:inicio + TAMANHO_BLOCO]
+        itens = [p.itens for p in bloco]
+        _escrever_bloco(arquivo, len(bloco), [
+            array("q", [p.id for p in bloco]),
+            array("q", [p.cliente_id for p in bloco]),
+            [p.status for p in bloco],
+            array("d", [p.total for p in bloco]),
+            array("I", [len(linhas) for linhas in itens]),
+            array("q", [i.produto.id for linhas in itens for i in linhas]),
+            array("q", [i.quantidade for linhas in itens for i in linhas]),
+            array("d", [i.produto.preco for linhas in itens for i in linhas]),
+        ])
+    _escrever_bloco(arquivo, 0, [])
+
+
+def _escrever_bloco(arquivo, quantidade, colunas):
+    arquivo.write(_QUANTIDADE.pack(quantidade))
+    for coluna in colunas:
+        if isinstance(coluna, array):
+            # Arrays levam o próprio tamanho: itens e históricos variam por linha
+            arquivo.write(_QUANTIDADE.pack(len(coluna)))
+            arquivo.write(coluna)
+        else:
+            _escrever_textos(arquivo, coluna)
+
+
+def _escrever_textos(arquivo, textos):
+    # Tamanhos em caracteres e um único blob UTF-8 por coluna do bloco
+    tamanhos = array("I", map(len, textos))
+    dados = "".join(textos).encode("utf-8")
+    arquivo.write(_QUANTIDADE.pack(len(dados)))
+    arquivo.write(tamanhos)
+    arquivo.write(dados)
+
+
+def _fatiar(valores, tamanhos):
+    fins = list(accumulate(tamanhos))
+    return [valores[fim - tamanho:fim] for tamanho, fim in zip(tamanhos, fins)]
+
+
+class _Leitor:
+    def __init__(self, arquivo, inverter_bytes):
+        self._arquivo = arquivo
+        self._inverter_bytes = inverter_bytes
+
+    def blocos(self, *tipos):
+        while True:
+            quantidade, = _QUANTIDADE.unpack(self._arquivo.read(_QUANTIDADE.size))
+            if quantidade == 0:
+                return
+            yield [self._ler_textos(quantidade) if tipo == "s" else self._ler_array(tipo)
+                   for tipo in tipos]
+
+    def _ler_array(self, tipo):
+        tamanho, = _QUANTIDADE.unpack(self._arquivo.read(_QUANTIDADE.size))
+        valores = array(tipo)
+        valores.frombytes(self._arquivo.read(tamanho * valores.itemsize))
+        if self._inverter_bytes:
+            valores.byteswap()
+        return valores
+
+    def _ler_textos(self, quantidade):
+        tamanho_dados, = _QUANTIDADE.unpack(self._arquivo.read(_QUANTIDADE.size))
+        tamanhos = array("I")
+        tamanhos.frombytes(self._arquivo.read(quantidade * tamanhos.itemsize))
+        if self._inverter_bytes:
+            tamanhos.byteswap()
+        texto = self._arquivo.read(tamanho_dados).decode("utf-8")
+        return [texto[fim - tamanho:fim] for tamanho, fim in zip(tamanhos, accumulate(tamanhos))]
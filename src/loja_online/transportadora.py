@@ -0,0 +1,28 @@
+import threading
+import time
+
+
+class Transportadora:
+    # Interface das transportadoras: uma chamada coleta todas as entregas
+    # de uma região
+    def despachar(self, regiao, entregas):
+        raise NotImplementedError
+
+
+class TransportadoraSimulada(Transportadora):
+    # Transportadora local para testes e benchmarks: cada chamada custa
+    # `latencia` segundos, mais `latencia_por_item` por entrega coletada.
+    def __init__(self, latencia=0.0, latencia_por_item=0.0):
+        self.latencia = latencia
+        self.latencia_por_item = latencia_por_item
+        self.chamadas = 0
+        self.despachadas = 0
+        self._trava = threading.Lock()
+
+    def despachar(self, regiao, entregas):
+        latencia = self.latencia + self.latencia_por_item * len(entregas)
+        if latencia:
+            time.sleep(latencia)
+        with self._trava:
+            self.chamadas += 1
+            self.despachadas += len(entregas)
@@ -0,0 +1,86 @@
+import os
+import threading
+import zlib
+
+try:
+    import fcntl
+except ImportError:  # fcntl só existe em POSIX; sem ele apenas as travas locais funcionam
+    fcntl = None
+
+
+class TravasListradas:
+    def __init__(self, quantidade=256):
+        self._travas = [threading.RLock() for _ in range(quantidade)]
+
+    def indice(self, chave):
+        return hash(chave) % len(self._travas)
+
+    def trava(self, chave):
+        return self._travas[self.indice(chave)]
+
+    def travas_ordenadas(self, chaves):
+        indices = sorted({self.indice(chave) for chave in chaves})
+        return [self._travas[i] for i in indices]
+
+
+class _TravaEntreProcessos:
+    __slots__ = ("_descritor", "_posicao", "_trava", "_profundidade")
+
+    def __init__(self, descritor, posicao, trava):
+        self._descritor = descritor
+        self._posicao = posicao
+        self._trava = trava
+        self._profundidade = 0
+
+    def acquire(self):
+        # As travas de registro do fcntl pertencem ao processo: com duas
+        # threads do mesmo processo esperando por listras, o kernel acusa um
+        # falso impasse (EDEADLK). A RLock do processo, comum a todas as
+        # listras, deixa só uma thread por vez segurar ou esperar pelo fcntl.
+        self._trava.acquire()
+        try:
+            if self._profundidade == 0:
+                fcntl.lockf(self._descritor, fcntl.LOCK_EX, 1, self._posicao)
+        except BaseException:
+            self._trava.release()
+            raise
+        self._profundidade += 1
+
+    def release(self):
+        self._profundidade -= 1
+        if self._profundidade == 0:
+            fcntl.lockf(self._descritor, fcntl.LOCK_UN, 1, self._posicao)
+        self._trava.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *excecao):
+        self.release()
+
+
+class TravasEntreProcessos(TravasListradas):
+    # Cada listra é um byte do arquivo de travas, bloqueado com fcntl.lockf;
+    # processos que abrem o mesmo arquivo compartilham as listras.
+    def __init__(self, caminho, quantidade=256):
+        if fcntl is None:
+            raise RuntimeError("Travas entre processos exigem fcntl (POSIX)")
+        self.caminho = caminho
+        self._descritor = os.open(caminho, os.O_RDWR | os.O_CREAT, 0o600)
+        trava = threading.RLock()
+        self._travas = [_TravaEntreProcessos(self._descritor, i, trava) for i in range(quantidade + 1)]
+        # Listra extra, fora do intervalo das chaves, para operações globais
+        self.trava_global = self._travas.pop()
+
+    def indice(self, chave):
+        # hash() de textos muda entre processos; o índice precisa ser estável
+        if isinstance(chave, int):
+            return chave % len(self._travas)
+        return zlib.crc32(str(chave).encode("utf-8")) % len(self._travas)
+
+    def fechar(self):
+        os.close(self._descritor)
+
+
+TRAVAS_ESTOQUE = TravasListradas()
@@ -1,10 +1,22 @@
-import random
-import string
+import math
+import numbers
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional; sem ele os descontos em lote usam laços em Python
+    np = None
+
+from .gerador_ids import GERADOR_IDS
 
 class Utilitarios:
     @staticmethod
     def gerar_id():
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=8))
+        return GERADOR_IDS.gerar_id()
+
+    @staticmethod
+    def gerar_ids(quantidade):
+        return GERADOR_IDS.gerar_ids(quantidade)
 
     @staticmethod
     def formatar_preco(valor):
@@ -21,4 +33,45 @@ class Utilitarios:
     @staticmethod
     def aplicar_desconto(valor, porcentagem):
         desconto = Utilitarios.calcular_desconto(valor, porcentagem)
-        return valor - desconto
\ No newline at end of file
+        return valor - desconto
+
+    @staticmethod
+    def calcular_descontos(valores, porcentagens):
+        _, descontos = _descontos_em_centavos(valores, porcentagens)
+        if np is not None:
+            return (descontos / 100).tolist()
+        return [desconto / 100 for desconto in descontos]
+
+    @staticmethod
+    def aplicar_descontos(valores, porcentagens):
+        precos, descontos = _descontos_em_centavos(valores, porcentagens)
+        if np is not None:
+            return ((precos - descontos) / 100).tolist()
+        return [(preco - desconto) / 100 for preco, desconto in zip(precos, descontos)]
+
+
+# Preços viram centavos e porcentagens viram centésimos de ponto percentual,
+# de modo que o desconto é calculado só com inteiros e arredondado meio
+# centavo para cima, sem acumular erro de ponto flutuante.
+def _descontos_em_centavos(valores, porcentagens):
+    # Normaliza antes de escolher o caminho, para que NumPy e o laço em Python
+    # aceitem e recusem exatamente as mesmas entradas
+    if not hasattr(valores, "__len__"):
+        valores = list(valores)
+    porcentagem_unica = isinstance(porcentagens, numbers.Real)
+    if not porcentagem_unica:
+        if not hasattr(porcentagens, "__len__"):
+            porcentagens = list(porcentagens)
+        if len(porcentagens) != len(valores):
+            raise ValueError("valores e porcentagens devem ter o mesmo tamanho")
+
+    if np is not None:
+        precos = np.floor(np.asarray(valores, dtype=np.float64) * 100 + 0.5).astype(np.int64)
+        centesimos = np.floor(np.asarray(porcentagens, dtype=np.float64) * 100 + 0.5).astype(np.int64)
+        return precos, (precos * centesimos + 5000) // 10000
+    precos = [math.floor(valor * 100 + 0.5) for valor in valores]
+    if porcentagem_unica:
+        porcentagens = repeat(porcentagens, len(precos))
+    descontos = [(preco * math.floor(porcentagem * 100 + 0.5) + 5000) // 10000
+                 for preco, porcentagem in zip(precos, porcentagens)]
+    return precos, descontos
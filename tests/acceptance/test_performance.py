@@ -6,21 +6,128 @@ e a capacidade de carga da aplicação.
 """
 
 from loja_online.loja import Loja
+from loja_online.loja_sqlite import LojaSQLite
 from loja_online.produto import Produto
 from loja_online.pedido import Pedido
+from loja_online.carrinho import Carrinho
+from loja_online.pagamento import Pagamento
+from loja_online.entrega import Entrega
+from loja_online.estoque import Estoque
+from loja_online.catalogo_colunar import CatalogoColunar, np
+from loja_online.catalogo_mmap import CatalogoMmap
+from loja_online import catalogo_mmap
+from loja_online.estoque_compartilhado import CatalogoCompartilhado, MemoriaEstoque
+from loja_online.serializacao import PRODUTO
+from loja_online.gateway_pagamento import GatewaySimulado
+from loja_online.loja_assincrona import LojaAssincrona
+from loja_online.processador_pagamentos import ProcessadorPagamentos
+from loja_online.registro_entregas import RegistroEntregas
+from loja_online.despacho_entregas import DespachoEntregas, regiao_cep
+from loja_online.transportadora import TransportadoraSimulada
+from loja_online.utilitarios import Utilitarios
+from loja_online.diario import Diario
+from loja_online import diario
+from loja_online.promocoes import PromocaoPercentual, PromocaoLeveXPagueY, PromocaoProgressiva
 import pytest
+import asyncio
 import time
 import sys
 import os
 import json
+import gc
+import tracemalloc
+import random
+import string
+import multiprocessing
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import statistics
 
 # Adiciona o diretório src ao path
 sys.path.insert(0, os.path.abspath(
     os.path.join(os.path.dirname(__file__), '../../src')))
 
+# Tamanho do catálogo nos testes em escala (pode ser reduzido localmente)
+ESCALA_CATALOGO = int(os.environ.get("LOJA_PERF_ESCALA_CATALOGO", 1_000_000))
+
+
+def _gerar_ids_em_processo(quantidade):
+    """Gera ids em um processo separado (precisa ser picklável)"""
+    return Utilitarios.gerar_ids(quantidade)
+
+
+def _memoria_do_processo():
+    """Lê RSS total e privado (anônimo) do processo atual em KB (Linux)"""
+    campos = {}
+    with open("/proc/self/status") as arquivo:
+        for linha in arquivo:
+            nome, _, valor = linha.partition(":")
+            if nome in ("VmRSS", "RssAnon", "RssFile"):
+                campos[nome] = int(valor.split()[0])
+    return campos
+
+
+def _consultar_catalogo_em_processo(modo, caminho, ids):
+    """Abre o catálogo em um worker e mede memória e latência das consultas"""
+    antes = _memoria_do_processo()
+    if modo == "mmap":
+        catalogo = CatalogoMmap(caminho)
+        consultar = catalogo.preco
+    else:
+        loja = Loja.carregar_snapshot(caminho)
+        consultar = lambda produto_id: loja.buscar_produto(produto_id).preco
+    gc.collect()
+
+    # A primeira passada inclui as faltas de página do mapeamento
+    latencias = []
+    for _ in range(2):
+        inicio = time.perf_counter()
+        soma = sum(consultar(produto_id) for produto_id in ids)
+        latencias.append((time.perf_counter() - inicio) / len(ids) * 1e6)
+
+    depois = _memoria_do_processo()
+    return {
+        "rss_kb": depois["VmRSS"] - antes["VmRSS"],
+        "rss_privado_kb": depois["RssAnon"] - antes["RssAnon"],
+        "latencia_fria_us": latencias[0],
+        "latencia_quente_us": latencias[1],
+        "soma": soma,
+    }
+
+
+def _reservar_estoque_em_processo(nome, caminho_travas, quantidade_produtos, tentativas, semente,
+                                  threads=1):
+    """Reserva estoque compartilhado em um worker (com uma ou mais threads) e conta as unidades vendidas por produto"""
+    memoria = MemoriaEstoque(nome, caminho_travas=caminho_travas)
+    loja = Loja(CatalogoCompartilhado(memoria))
+    loja.cadastrar_produtos_em_lote(
+        (i + 1, f"Produto {i + 1}", 10.0, 0) for i in range(quantidade_produtos))
+
+    def reservar(thread):
+        vendidos = [0] * (quantidade_produtos + 1)
+        gerador = random.Random(semente * 1000 + thread)
+        for tentativa in range(tentativas // threads):
+            produto_id = gerador.randint(1, quantidade_produtos)
+            quantidade = gerador.randint(1, 2)
+            if tentativa % 4 == 0:
+                outro_id = produto_id % quantidade_produtos + 1
+                if loja.estoque.reservar_itens([(produto_id, quantidade), (outro_id, 1)]):
+                    vendidos[produto_id] += quantidade
+                    vendidos[outro_id] += 1
+            elif loja.estoque.verificar_disponibilidade(produto_id, quantidade) and \
+                    loja.estoque.reservar(produto_id, quantidade):
+                vendidos[produto_id] += quantidade
+        return vendidos
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        parciais = list(executor.map(reservar, range(threads)))
+    tempo = time.perf_counter() - inicio
+    vendidos = [sum(coluna) for coluna in zip(*parciais)]
+
+    memoria.fechar()
+    return vendidos, tempo
+
 
 class TestPerformanceLoja:
     """
@@ -97,6 +204,152 @@ class TestPerformanceLoja:
 
         self._salvar_metricas()
 
+    @pytest.mark.slow
+    def test_performance_cadastro_produtos_em_massa_em_lote(self):
+        """
+        Teste de Performance: Cadastro em Massa de Produtos em Lote
+
+        Compara o cadastro item a item (cadastrar_produto + definir_estoque)
+        com cadastrar_produtos_em_lote para 1.000.000 de produtos.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: CADASTRO EM MASSA DE PRODUTOS EM LOTE")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Cadastro em Massa de Produtos em Lote"
+
+        quantidade = ESCALA_CATALOGO
+        linhas = [(i + 1, f"Produto {i + 1}", 100.0 + (i * 0.5), 10)
+                  for i in range(quantidade)]
+
+        print(f"\n[TESTE] Cadastrando {quantidade} produtos item a item...")
+        loja_item_a_item = Loja()
+        tempo_inicio = time.time()
+        for id, nome, preco, estoque in linhas:
+            loja_item_a_item.cadastrar_produto(id, nome, preco).definir_estoque(estoque)
+        tempo_item_a_item = time.time() - tempo_inicio
+        del loja_item_a_item
+        gc.collect()
+
+        print(f"[TESTE] Cadastrando {quantidade} produtos em lote...")
+        tempo_inicio = time.time()
+        self.loja.cadastrar_produtos_em_lote(linhas)
+        tempo_lote = time.time() - tempo_inicio
+
+        aceleracao = tempo_item_a_item / tempo_lote
+
+        print(f"\n✓ Resultados:")
+        print(f"  - Produtos cadastrados: {len(self.loja.produtos)}")
+        print(f"  - Tempo item a item: {tempo_item_a_item:.3f} segundos")
+        print(f"  - Tempo em lote: {tempo_lote:.3f} segundos")
+        print(f"  - Produtos/segundo em lote: {quantidade / tempo_lote:.2f}")
+        print(f"  - Aceleração: {aceleracao:.2f}x")
+
+        self.metricas["metricas"] = {
+            "quantidade": quantidade,
+            "tempo_item_a_item_segundos": tempo_item_a_item,
+            "tempo_lote_segundos": tempo_lote,
+            "produtos_por_segundo_lote": quantidade / tempo_lote,
+            "aceleracao": aceleracao
+        }
+
+        # Validação: o lote cadastra tudo e é mais rápido que o laço item a item
+        assert len(self.loja.produtos) == quantidade
+        assert self.loja.buscar_produto(quantidade).estoque == 10
+        assert tempo_lote < tempo_item_a_item
+
+        print(f"\n✓ APROVADO: Lote {aceleracao:.2f}x mais rápido que item a item")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    @pytest.mark.slow
+    def test_performance_operacoes_catalogo_colunar(self):
+        """
+        Teste de Performance: Operações em Todo o Catálogo (Colunar)
+
+        Compara reajuste de preços, valoração do inventário e máscara de
+        disponibilidade com 1.000.000 de SKUs no modelo de um objeto por
+        produto e no catálogo colunar (vetorizado com NumPy quando disponível).
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: OPERAÇÕES EM TODO O CATÁLOGO")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Operações em Todo o Catálogo"
+
+        quantidade = ESCALA_CATALOGO
+        linhas = [(i + 1, f"Produto {i + 1}", 10.0 + (i % 100), i % 7)
+                  for i in range(quantidade)]
+
+        print(f"\n[PREPARAÇÃO] Cadastrando {quantidade} produtos em cada modelo...")
+        loja_objetos = Loja()
+        loja_objetos.cadastrar_produtos_em_lote(linhas)
+        catalogo = CatalogoColunar()
+        loja_colunar = Loja(catalogo)
+        loja_colunar.cadastrar_produtos_em_lote(linhas)
+        del linhas
+
+        def medir_objetos():
+            tempos = {}
+            inicio = time.time()
+            for produto in loja_objetos.estoque.listar_produtos():
+                produto.preco *= 1.1
+            tempos["reajuste"] = time.time() - inicio
+
+            inicio = time.time()
+            valor = sum(p.preco * p.estoque for p in loja_objetos.estoque.listar_produtos())
+            tempos["valoracao"] = time.time() - inicio
+
+            inicio = time.time()
+            disponiveis = [p.id for p in loja_objetos.estoque.listar_produtos() if p.estoque >= 3]
+            tempos["disponibilidade"] = time.time() - inicio
+            return tempos, valor, len(disponiveis)
+
+        def medir_colunar():
+            tempos = {}
+            inicio = time.time()
+            catalogo.reajustar_precos(10)
+            tempos["reajuste"] = time.time() - inicio
+
+            inicio = time.time()
+            valor = catalogo.valor_total_inventario()
+            tempos["valoracao"] = time.time() - inicio
+
+            inicio = time.time()
+            disponiveis = catalogo.ids_disponiveis(3)
+            tempos["disponibilidade"] = time.time() - inicio
+            return tempos, valor, len(disponiveis)
+
+        print(f"[TESTE] Executando operações (NumPy {'ativo' if np is not None else 'indisponível'})...")
+        tempos_objetos, valor_objetos, disponiveis_objetos = medir_objetos()
+        tempos_colunar, valor_colunar, disponiveis_colunar = medir_colunar()
+
+        print(f"\n✓ Resultados:")
+        for operacao in ("reajuste", "valoracao", "disponibilidade"):
+            print(f"  - {operacao}: objetos {tempos_objetos[operacao]*1000:.1f} ms, "
+                  f"colunar {tempos_colunar[operacao]*1000:.1f} ms "
+                  f"({tempos_objetos[operacao] / max(tempos_colunar[operacao], 1e-9):.1f}x)")
+
+        self.metricas["metricas"] = {
+            "quantidade": quantidade,
+            "numpy_disponivel": np is not None,
+            "tempos_objetos_ms": {k: v * 1000 for k, v in tempos_objetos.items()},
+            "tempos_colunar_ms": {k: v * 1000 for k, v in tempos_colunar.items()},
+            "valor_inventario": valor_colunar
+        }
+
+        # Validação: mesmos resultados; com NumPy as operações colunares são mais rápidas
+        assert valor_colunar == pytest.approx(valor_objetos)
+        assert disponiveis_colunar == disponiveis_objetos
+        if np is not None:
+            assert sum(tempos_colunar.values()) < sum(tempos_objetos.values())
+
+        print(f"\n✓ APROVADO: Catálogo colunar consistente com o modelo de objetos")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
     def test_performance_criacao_pedidos_simultaneos(self):
         """
         Teste de Carga: Criação de Pedidos Simultâneos
@@ -134,12 +387,19 @@ class TestPerformanceLoja:
                     produto = produtos[i % len(produtos)]
                     pedido.adicionar_item(produto, 1)
 
+                # Reservar todos os itens do pedido de uma só vez
+                reservado = self.loja.estoque.reservar_itens(
+                    (item["produto"].id, item["quantidade"]) for item in pedido.itens)
+                if not reservado:
+                    raise RuntimeError("Estoque insuficiente para o pedido")
+
                 total = pedido.calcular_total()
                 fim = time.time()
 
                 return {
                     "sucesso": True,
                     "pedido_id": pedido_id,
+                    "pedido": pedido,
                     "total": total,
                     "tempo": fim - inicio
                 }
@@ -194,6 +454,79 @@ class TestPerformanceLoja:
         print(f"  - Tempo máximo: {tempo_maximo*1000:.3f} ms")
         print(f"  - Desvio padrão: {desvio_padrao*1000:.3f} ms")
 
+        ids_pedidos = {r["pedido"].id for r in sucessos}
+        print(f"  - Ids de pedido distintos: {len(ids_pedidos)}")
+        print(f"  - Pedidos registrados na loja: {len(self.loja.pedidos)}")
+
+        # Vazão da criação de pedidos conforme o número de threads cresce
+        pedidos_por_nivel = 20_000
+        niveis_threads = [1, 2, 4, 8, 16, 32, 64, 100]
+        vazao_por_nivel = []
+        print(f"\n[TESTE] Criando {pedidos_por_nivel} pedidos com "
+              f"{niveis_threads[0]} a {niveis_threads[-1]} threads...")
+        for threads in niveis_threads:
+            loja_vazao = Loja()
+            por_thread = pedidos_por_nivel // threads
+
+            def criar_pedidos(cliente_id):
+                for _ in range(por_thread):
+                    loja_vazao.criar_pedido(cliente_id)
+
+            inicio_nivel = time.time()
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                list(executor.map(criar_pedidos, range(threads)))
+            tempo_nivel = time.time() - inicio_nivel
+
+            vazao_por_nivel.append({
+                "threads": threads,
+                "pedidos_criados": por_thread * threads,
+                "pedidos_registrados": len(loja_vazao.pedidos),
+                "pedidos_por_segundo": por_thread * threads / tempo_nivel
+            })
+            print(f"  - {threads:>3} threads: {vazao_por_nivel[-1]['pedidos_por_segundo']:>12.2f} "
+                  f"pedidos/s, registrados: {len(loja_vazao.pedidos)}/{por_thread * threads}")
+
+        # Pedidos sobrepostos: centenas de pedidos disputando poucos produtos
+        # com estoque limitado; cada pedido é reservado por inteiro ou não é.
+        quantidade_sobrepostos = 500
+        estoque_limitado = 200
+        loja_disputada = Loja()
+        for i in range(10):
+            loja_disputada.cadastrar_produto(i + 1, f"Produto {i + 1}", 50.0) \
+                .definir_estoque(estoque_limitado)
+
+        def itens_do_pedido(indice):
+            return [((indice + k * 3) % 10 + 1, 1 + (indice + k) % 2) for k in range(3)]
+
+        def reservar_pedido_sobreposto(indice):
+            itens = itens_do_pedido(indice)
+            return itens if loja_disputada.estoque.reservar_itens(itens) else None
+
+        print(f"\n[TESTE] Reservando {quantidade_sobrepostos} pedidos sobrepostos "
+              f"em 10 produtos com {estoque_limitado} unidades cada...")
+
+        tempo_inicio_sobrepostos = time.time()
+        with ThreadPoolExecutor(max_workers=50) as executor:
+            reservas = list(executor.map(reservar_pedido_sobreposto,
+                                         range(quantidade_sobrepostos)))
+        tempo_sobrepostos = time.time() - tempo_inicio_sobrepostos
+
+        reservados_por_produto = {i + 1: 0 for i in range(10)}
+        for itens in reservas:
+            for produto_id, quantidade in itens or ():
+                reservados_por_produto[produto_id] += quantidade
+        divergencias = sum(
+            1 for produto_id, reservado in reservados_por_produto.items()
+            if loja_disputada.buscar_produto(produto_id).estoque != estoque_limitado - reservado)
+        pedidos_reservados = sum(1 for itens in reservas if itens)
+        reservas_por_segundo = quantidade_sobrepostos / tempo_sobrepostos
+
+        print(f"  - Pedidos reservados: {pedidos_reservados}/{quantidade_sobrepostos}")
+        print(f"  - Pedidos recusados por falta de estoque: "
+              f"{quantidade_sobrepostos - pedidos_reservados}")
+        print(f"  - Produtos com estoque divergente: {divergencias}")
+        print(f"  - Reservas/segundo: {reservas_por_segundo:.2f}")
+
         self.metricas["metricas"] = {
             "quantidade_pedidos": quantidade_pedidos,
             "pedidos_sucesso": len(sucessos),
@@ -203,7 +536,16 @@ class TestPerformanceLoja:
             "tempo_medio_ms": tempo_medio * 1000,
             "tempo_minimo_ms": tempo_minimo * 1000,
             "tempo_maximo_ms": tempo_maximo * 1000,
-            "desvio_padrao_ms": desvio_padrao * 1000
+            "desvio_padrao_ms": desvio_padrao * 1000,
+            "ids_distintos": len(ids_pedidos),
+            "vazao_por_threads": vazao_por_nivel,
+            "reserva_sobreposta": {
+                "quantidade_pedidos": quantidade_sobrepostos,
+                "pedidos_reservados": pedidos_reservados,
+                "produtos_divergentes": divergencias,
+                "tempo_total_segundos": tempo_sobrepostos,
+                "reservas_por_segundo": reservas_por_segundo
+            }
         }
 
         # Validações
@@ -211,6 +553,16 @@ class TestPerformanceLoja:
             sucessos) == quantidade_pedidos, f"Alguns pedidos falharam: {len(falhas)} falhas"
         assert tempo_total < 10.0, f"Tempo total muito alto: {tempo_total:.3f}s"
         assert tempo_medio < 0.1, f"Tempo médio muito alto: {tempo_medio:.3f}s"
+        for produto in produtos[:3]:
+            assert produto.estoque == 1000 - quantidade_pedidos
+        assert len(ids_pedidos) == quantidade_pedidos, "Ids de pedido repetidos"
+        assert len(self.loja.pedidos) == quantidade_pedidos, "Pedidos sobrescritos"
+        for nivel in vazao_por_nivel:
+            assert nivel["pedidos_registrados"] == nivel["pedidos_criados"], \
+                f"Pedidos sobrescritos com {nivel['threads']} threads"
+        assert divergencias == 0, f"Reservas parciais detectadas em {divergencias} produtos"
+        assert 0 < pedidos_reservados < quantidade_sobrepostos
+        assert tempo_sobrepostos < 5.0, f"Reservas sobrepostas muito lentas: {tempo_sobrepostos:.3f}s"
 
         print(
             f"\n✓ APROVADO: {len(sucessos)} pedidos criados em {tempo_total:.3f}s")
@@ -218,6 +570,1351 @@ class TestPerformanceLoja:
 
         self._salvar_metricas()
 
+    @pytest.mark.slow
+    def test_performance_pedido_com_muitas_linhas(self):
+        """
+        Teste de Performance: Pedido com Muitas Linhas
+
+        Compara a montagem de um pedido de 10.000 linhas recalculando o
+        total a cada item (comportamento anterior, O(n²)) com o total
+        incremental mantido por Pedido.adicionar_item.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: PEDIDO COM MUITAS LINHAS")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Pedido com Muitas Linhas"
+
+        quantidade_linhas = 10_000
+        produtos = [Produto(i + 1, f"Produto {i + 1}", 1.0 + (i % 100) * 0.25)
+                    for i in range(quantidade_linhas)]
+
+        print(f"\n[TESTE] Montando pedido de {quantidade_linhas} linhas recalculando o total...")
+        pedido_recalculando = Pedido(1, 1)
+        inicio = time.time()
+        for produto in produtos:
+            pedido_recalculando.adicionar_item(produto, 2)
+            pedido_recalculando.calcular_total()
+        tempo_recalculando = time.time() - inicio
+
+        print(f"[TESTE] Montando pedido de {quantidade_linhas} linhas com total incremental...")
+        pedido_incremental = Pedido(2, 1)
+        inicio = time.time()
+        for produto in produtos:
+            pedido_incremental.adicionar_item(produto, 2)
+        tempo_incremental = time.time() - inicio
+
+        # Produtos repetidos são agrupados na mesma linha
+        for produto in produtos[:1000]:
+            pedido_incremental.adicionar_item(produto, 1)
+
+        aceleracao = tempo_recalculando / tempo_incremental
+
+        print(f"\n✓ Resultados:")
+        print(f"  - Recalculando a cada item: {tempo_recalculando:.3f} segundos")
+        print(f"  - Total incremental: {tempo_incremental*1000:.3f} ms")
+        print(f"  - Aceleração: {aceleracao:.0f}x")
+
+        self.metricas["metricas"] = {
+            "quantidade_linhas": quantidade_linhas,
+            "tempo_recalculando_segundos": tempo_recalculando,
+            "tempo_incremental_segundos": tempo_incremental,
+            "aceleracao": aceleracao
+        }
+
+        # Validação: total incremental confere com o recálculo completo
+        total_incremental = pedido_incremental.total
+        assert pedido_incremental.calcular_total() == pytest.approx(total_incremental)
+        assert len(pedido_incremental.itens) == quantidade_linhas
+        assert tempo_incremental < tempo_recalculando
+
+        print(f"\n✓ APROVADO: Total incremental {aceleracao:.0f}x mais rápido")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    def test_performance_carrinho_grande(self):
+        """
+        Teste de Performance: Carrinho Grande
+
+        Compara uma carga mista de inclusões, remoções e leituras do total
+        em um carrinho de 2.000 produtos usando a lista de itens anterior
+        (remoção e total O(n)) contra o carrinho indexado por produto com
+        total memorizado.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: CARRINHO GRANDE")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Carrinho Grande"
+
+        class CarrinhoEmLista:
+            def __init__(self):
+                self.itens = []
+
+            def adicionar_produto(self, produto, quantidade):
+                self.itens.append({"produto": produto, "quantidade": quantidade})
+
+            def remover_produto(self, produto_id):
+                self.itens = [item for item in self.itens if item["produto"].id != produto_id]
+
+            def calcular_total(self):
+                return sum(item["produto"].preco * item["quantidade"] for item in self.itens)
+
+        quantidade_produtos = 2_000
+        operacoes = 1_000
+        leituras_por_operacao = 3
+        produtos = [Produto(i + 1, f"Produto {i + 1}", 1.0 + (i % 100) * 0.25)
+                    for i in range(quantidade_produtos)]
+
+        def carga(carrinho):
+            for produto in produtos:
+                carrinho.adicionar_produto(produto, 1)
+            totais = []
+            inicio = time.time()
+            for i in range(operacoes):
+                produto = produtos[(i * 7919) % quantidade_produtos]
+                carrinho.remover_produto(produto.id)
+                carrinho.adicionar_produto(produto, 2)
+                # A página do carrinho lê o total várias vezes por renderização
+                for _ in range(leituras_por_operacao):
+                    total = carrinho.calcular_total()
+                totais.append(total)
+            return time.time() - inicio, totais
+
+        print(f"\n[TESTE] {operacoes} operações mistas em carrinho de "
+              f"{quantidade_produtos} produtos com lista de itens...")
+        tempo_lista, totais_lista = carga(CarrinhoEmLista())
+
+        print(f"[TESTE] {operacoes} operações mistas com carrinho indexado...")
+        carrinho = Carrinho()
+        tempo_indexado, totais_indexado = carga(carrinho)
+
+        aceleracao = tempo_lista / tempo_indexado
+
+        print(f"\n✓ Resultados:")
+        print(f"  - Carrinho em lista: {tempo_lista:.3f} segundos")
+        print(f"  - Carrinho indexado: {tempo_indexado:.3f} segundos")
+        print(f"  - Aceleração: {aceleracao:.0f}x")
+
+        self.metricas["metricas"] = {
+            "quantidade_produtos": quantidade_produtos,
+            "operacoes": operacoes,
+            "leituras_total_por_operacao": leituras_por_operacao,
+            "tempo_lista_segundos": tempo_lista,
+            "tempo_indexado_segundos": tempo_indexado,
+            "aceleracao": aceleracao
+        }
+
+        # Validação: mesmos totais e carrinho indexado mais rápido
+        assert totais_indexado == pytest.approx(totais_lista)
+        assert len(carrinho.itens) == quantidade_produtos
+        assert tempo_indexado < tempo_lista
+
+        print(f"\n✓ APROVADO: Carrinho indexado {aceleracao:.0f}x mais rápido")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    def test_performance_total_gasto_cliente(self):
+        """
+        Teste de Performance: Total Gasto do Cliente
+
+        Compara a leitura do total gasto somando todo o histórico de um
+        cliente com 50.000 pedidos contra os agregados mantidos por
+        Cliente.adicionar_compra, incluindo cancelamentos.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: TOTAL GASTO DO CLIENTE")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Total Gasto do Cliente"
+
+        quantidade_pedidos = 50_000
+        leituras = 1_000
+        cliente = self.loja.cadastrar_cliente(1, "Cliente Fiel", "fiel@email.com")
+
+        print(f"\n[PREPARAÇÃO] Registrando {quantidade_pedidos} pedidos no histórico...")
+        inicio = time.time()
+        for i in range(quantidade_pedidos):
+            pedido = Pedido(i + 1, cliente.id)
+            pedido.total = float(10 + i % 90)
+            cliente.adicionar_compra(pedido)
+        tempo_registro = time.time() - inicio
+
+        # Cancela 1 a cada 10 pedidos depois de registrados
+        for pedido in cliente.historico[::10]:
+            pedido.cancelar_pedido()
+
+        print(f"[TESTE] {leituras} leituras somando o histórico...")
+        inicio = time.time()
+        for _ in range(leituras):
+            total_somando = sum(p.total for p in cliente.historico if p.status != "cancelado")
+        tempo_somando = (time.time() - inicio) / leituras
+
+        print(f"[TESTE] {leituras} leituras dos agregados...")
+        inicio = time.time()
+        for _ in range(leituras):
+            total_agregado = cliente.obter_total_gasto()
+        tempo_agregado = (time.time() - inicio) / leituras
+
+        aceleracao = tempo_somando / tempo_agregado
+
+        print(f"\n✓ Resultados:")
+        print(f"  - Registro de {quantidade_pedidos} pedidos: {tempo_registro:.3f} segundos")
+        print(f"  - Leitura somando o histórico: {tempo_somando*1000:.3f} ms")
+        print(f"  - Leitura dos agregados: {tempo_agregado*1_000_000:.3f} µs")
+        print(f"  - Aceleração: {aceleracao:.0f}x")
+
+        self.metricas["metricas"] = {
+            "quantidade_pedidos": quantidade_pedidos,
+            "leituras": leituras,
+            "tempo_registro_segundos": tempo_registro,
+            "tempo_leitura_somando_ms": tempo_somando * 1000,
+            "tempo_leitura_agregado_us": tempo_agregado * 1_000_000,
+            "aceleracao": aceleracao
+        }
+
+        # Validação: agregados conferem com o histórico e leitura é O(1)
+        assert total_agregado == pytest.approx(total_somando)
+        assert cliente.quantidade_compras == quantidade_pedidos - quantidade_pedidos // 10
+        assert cliente.ultima_compra is cliente.historico[-1]
+        assert tempo_agregado * 100 < tempo_somando
+
+        print(f"\n✓ APROVADO: Leitura dos agregados {aceleracao:.0f}x mais rápida")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    def test_performance_geracao_de_ids(self):
+        """
+        Teste de Performance: Geração de Ids
+
+        Compara a vazão do gerar_id anterior (8 caracteres aleatórios) com o
+        gerador ordenado por tempo, individual e em lote, e valida a
+        unicidade dos ids gerados por vários processos no mesmo host.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: GERAÇÃO DE IDS")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Geração de Ids"
+
+        caracteres = string.ascii_letters + string.digits
+
+        def gerar_id_aleatorio():
+            return ''.join(random.choices(caracteres, k=8))
+
+        quantidade = 200_000
+
+        print(f"\n[TESTE] Gerando {quantidade} ids com cada implementação...")
+        inicio = time.time()
+        aleatorios = [gerar_id_aleatorio() for _ in range(quantidade)]
+        tempo_aleatorio = time.time() - inicio
+
+        inicio = time.time()
+        individuais = [Utilitarios.gerar_id() for _ in range(quantidade)]
+        tempo_individual = time.time() - inicio
+
+        inicio = time.time()
+        lote = Utilitarios.gerar_ids(quantidade)
+        tempo_lote = time.time() - inicio
+
+        processos = 4
+        por_processo = 50_000
+        print(f"[TESTE] Gerando {por_processo} ids em cada um de {processos} processos...")
+        contexto = multiprocessing.get_context("fork" if hasattr(os, "fork") else "spawn")
+        with ProcessPoolExecutor(max_workers=processos, mp_context=contexto) as executor:
+            por_processos = [i for ids in executor.map(_gerar_ids_em_processo,
+                                                       [por_processo] * processos)
+                             for i in ids]
+
+        def vazao(tempo):
+            return quantidade / tempo
+
+        print(f"\n✓ Resultados:")
+        print(f"  - Aleatório (anterior): {vazao(tempo_aleatorio):>12.2f} ids/s")
+        print(f"  - Ordenado por tempo: {vazao(tempo_individual):>12.2f} ids/s")
+        print(f"  - Ordenado por tempo em lote: {vazao(tempo_lote):>12.2f} ids/s")
+        print(f"  - Ids distintos entre processos: {len(set(por_processos))}/{len(por_processos)}")
+
+        self.metricas["metricas"] = {
+            "quantidade": quantidade,
+            "ids_por_segundo_aleatorio": vazao(tempo_aleatorio),
+            "ids_por_segundo_individual": vazao(tempo_individual),
+            "ids_por_segundo_lote": vazao(tempo_lote),
+            "processos": processos,
+            "ids_por_processo": por_processo,
+            "ids_distintos_entre_processos": len(set(por_processos))
+        }
+
+        # Validação: ids únicos, ordenados e geração em lote mais rápida
+        assert len(set(individuais + lote)) == 2 * quantidade
+        assert individuais == sorted(individuais) and lote == sorted(lote)
+        assert individuais[-1] < lote[0]
+        assert len(set(por_processos)) == processos * por_processo
+        assert tempo_lote < tempo_aleatorio
+        assert len(aleatorios) == quantidade
+
+        print(f"\n✓ APROVADO: {vazao(tempo_lote):.0f} ids/s em lote, sem colisões entre processos")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    @pytest.mark.slow
+    def test_performance_descontos_em_lote(self):
+        """
+        Teste de Performance: Descontos em Lote
+
+        Compara a promoção noturna aplicada preço a preço com
+        Utilitarios.aplicar_desconto contra Utilitarios.aplicar_descontos
+        em centavos inteiros (vetorizado com NumPy quando disponível),
+        com 1.000.000 de preços.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: DESCONTOS EM LOTE")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Descontos em Lote"
+
+        quantidade = ESCALA_CATALOGO
+        precos = [10.0 + (i % 10_000) * 0.37 for i in range(quantidade)]
+        porcentagens = [(5, 10, 12.5, 15, 20, 33.3)[i % 6] for i in range(quantidade)]
+
+        print(f"\n[TESTE] Aplicando promoções a {quantidade} preços, um por vez...")
+        inicio = time.time()
+        individuais = [Utilitarios.aplicar_desconto(preco, porcentagem)
+                       for preco, porcentagem in zip(precos, porcentagens)]
+        tempo_individual = time.time() - inicio
+
+        print(f"[TESTE] Aplicando promoções em lote "
+              f"(NumPy {'ativo' if np is not None else 'indisponível'})...")
+        inicio = time.time()
+        em_lote = Utilitarios.aplicar_descontos(precos, porcentagens)
+        tempo_lote = time.time() - inicio
+
+        inicio = time.time()
+        porcentagem_unica = Utilitarios.aplicar_descontos(precos, 10)
+        tempo_porcentagem_unica = time.time() - inicio
+
+        # Em centavos o resultado nunca tem mais de duas casas decimais
+        fora_dos_centavos = sum(1 for preco in em_lote if round(preco, 2) != preco)
+        divergencia_maxima = max(abs(a - b) for a, b in zip(individuais, em_lote))
+        aceleracao = tempo_individual / tempo_lote
+
+        print(f"\n✓ Resultados:")
+        print(f"  - Preço a preço: {tempo_individual:.3f} segundos")
+        print(f"  - Em lote: {tempo_lote:.3f} segundos")
+        print(f"  - Em lote com porcentagem única: {tempo_porcentagem_unica:.3f} segundos")
+        print(f"  - Aceleração: {aceleracao:.1f}x")
+        print(f"  - Preços fora dos centavos: {fora_dos_centavos}")
+        print(f"  - Diferença máxima para o cálculo em ponto flutuante: {divergencia_maxima:.4f}")
+
+        self.metricas["metricas"] = {
+            "quantidade": quantidade,
+            "numpy": np is not None,
+            "tempo_individual_segundos": tempo_individual,
+            "tempo_lote_segundos": tempo_lote,
+            "tempo_lote_porcentagem_unica_segundos": tempo_porcentagem_unica,
+            "aceleracao": aceleracao,
+            "precos_fora_dos_centavos": fora_dos_centavos,
+            "divergencia_maxima": divergencia_maxima
+        }
+
+        # Validação: resultados em centavos e no máximo meio centavo de diferença
+        assert len(em_lote) == len(porcentagem_unica) == quantidade
+        assert fora_dos_centavos == 0
+        assert divergencia_maxima <= 0.005 + 1e-9
+        if np is not None:
+            assert tempo_lote < tempo_individual
+
+        print(f"\n✓ APROVADO: {quantidade} preços com desconto em {tempo_lote:.3f}s")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    def test_performance_motor_promocoes(self):
+        """
+        Teste de Performance: Motor de Promoções
+
+        Compara o total com descontos de um carrinho de 500 linhas com
+        1.000 promoções ativas avaliando todas as regras em cada linha
+        contra as tabelas por produto compiladas pelo MotorPromocoes.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: MOTOR DE PROMOÇÕES")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Motor de Promoções"
+
+        quantidade_regras = 1_000
+        quantidade_linhas = 500
+        quantidade_produtos = 5_000
+        avaliacoes = 50
+
+        promocoes = []
+        for i in range(quantidade_regras):
+            produtos_ids = [(i * 37 + k * 101) % quantidade_produtos + 1 for k in range(20)]
+            if i % 3 == 0:
+                promocoes.append(PromocaoPercentual(i, produtos_ids, 5 + i % 30))
+            elif i % 3 == 1:
+                promocoes.append(PromocaoLeveXPagueY(i, produtos_ids, leve=3, pague=2))
+            else:
+                promocoes.append(PromocaoProgressiva(i, produtos_ids, [(2, 5), (4, 10), (8, 15)]))
+        for promocao in promocoes:
+            self.loja.promocoes.adicionar(promocao)
+
+        carrinho = Carrinho()
+        for i in range(quantidade_linhas):
+            produto = Produto(i * 9 + 1, f"Produto {i * 9 + 1}", 10.0 + i % 50)
+            carrinho.adicionar_produto(produto, 1 + i % 9)
+
+        def total_avaliando_todas_as_regras():
+            total = 0
+            for item in carrinho.itens:
+                melhor = 0
+                for promocao in promocoes:
+                    if item.produto.id in promocao.produtos_ids:
+                        melhor = max(melhor, promocao.calcular_desconto(
+                            item.produto.preco, item.quantidade))
+                total += item.produto.preco * item.quantidade - melhor
+            return total
+
+        print(f"\n[TESTE] {avaliacoes} totais de um carrinho de {quantidade_linhas} linhas "
+              f"com {quantidade_regras} promoções, avaliando todas as regras...")
+        inicio = time.time()
+        for _ in range(avaliacoes):
+            esperado = total_avaliando_todas_as_regras()
+        tempo_ingenuo = (time.time() - inicio) / avaliacoes
+
+        inicio = time.time()
+        self.loja.promocoes.compilar()
+        tempo_compilacao = time.time() - inicio
+
+        print(f"[TESTE] {avaliacoes} totais com as regras compiladas por produto...")
+        inicio = time.time()
+        for _ in range(avaliacoes):
+            obtido = self.loja.calcular_total_com_promocoes(carrinho)
+        tempo_compilado = (time.time() - inicio) / avaliacoes
+
+        aceleracao = tempo_ingenuo / tempo_compilado
+
+        print(f"\n✓ Resultados:")
+        print(f"  - Avaliando todas as regras: {tempo_ingenuo*1000:.3f} ms por total")
+        print(f"  - Compilação das regras: {tempo_compilacao*1000:.3f} ms")
+        print(f"  - Regras compiladas: {tempo_compilado*1000:.3f} ms por total")
+        print(f"  - Aceleração: {aceleracao:.0f}x")
+
+        self.metricas["metricas"] = {
+            "quantidade_regras": quantidade_regras,
+            "quantidade_linhas": quantidade_linhas,
+            "tempo_ingenuo_ms": tempo_ingenuo * 1000,
+            "tempo_compilacao_ms": tempo_compilacao * 1000,
+            "tempo_compilado_ms": tempo_compilado * 1000,
+            "aceleracao": aceleracao
+        }
+
+        # Validação: mesmo total e custo proporcional às linhas, não às regras
+        assert obtido == pytest.approx(esperado)
+        assert obtido < carrinho.calcular_total()
+        assert tempo_compilado * 20 < tempo_ingenuo
+
+        print(f"\n✓ APROVADO: Total com promoções {aceleracao:.0f}x mais rápido")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    @pytest.mark.slow
+    def test_performance_snapshot_binario(self, tmp_path):
+        """
+        Teste de Performance: Snapshot Binário
+
+        Mede tempo de gravação, tempo de carga e tamanho do snapshot de uma
+        loja com 1.000.000 de produtos, comparando a partida a quente com a
+        reconstrução do catálogo, clientes e pedidos repetindo os cadastros.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: SNAPSHOT BINÁRIO")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Snapshot Binário"
+
+        quantidade = ESCALA_CATALOGO
+        quantidade_clientes = quantidade // 10
+        caminho = tmp_path / "loja.snap"
+
+        def reconstruir():
+            loja = Loja()
+            for i in range(quantidade):
+                loja.cadastrar_produto(i + 1, f"Produto {i + 1}", 10.0 + i % 1000) \
+                    .definir_estoque(i % 50)
+            for i in range(quantidade_clientes):
+                cliente = loja.cadastrar_cliente(i + 1, f"Cliente {i + 1}", f"c{i + 1}@email.com")
+                pedido = loja.criar_pedido(cliente.id)
+                pedido.adicionar_item(loja.buscar_produto(i + 1), 1 + i % 3)
+                cliente.adicionar_compra(pedido)
+            return loja
+
+        print(f"\n[TESTE] Reconstruindo loja com {quantidade} produtos e "
+              f"{quantidade_clientes} clientes/pedidos repetindo os cadastros...")
+        inicio = time.time()
+        loja = reconstruir()
+        tempo_reconstrucao = time.time() - inicio
+
+        print(f"[TESTE] Gravando e carregando o snapshot...")
+        inicio = time.time()
+        loja.salvar_snapshot(caminho)
+        tempo_gravacao = time.time() - inicio
+        tamanho = os.path.getsize(caminho)
+
+        inicio = time.time()
+        carregada = Loja.carregar_snapshot(caminho)
+        tempo_carga = time.time() - inicio
+
+        aceleracao = tempo_reconstrucao / tempo_carga
+
+        print(f"\n✓ Resultados:")
+        print(f"  - Reconstrução repetindo cadastros: {tempo_reconstrucao:.3f} segundos")
+        print(f"  - Gravação do snapshot: {tempo_gravacao:.3f} segundos")
+        print(f"  - Carga do snapshot: {tempo_carga:.3f} segundos")
+        print(f"  - Tamanho do arquivo: {tamanho / 1024 / 1024:.1f} MB "
+              f"({tamanho / quantidade:.1f} bytes por produto)")
+        print(f"  - Aceleração da partida: {aceleracao:.1f}x")
+
+        self.metricas["metricas"] = {
+            "quantidade_produtos": quantidade,
+            "quantidade_clientes": quantidade_clientes,
+            "quantidade_pedidos": quantidade_clientes,
+            "tempo_reconstrucao_segundos": tempo_reconstrucao,
+            "tempo_gravacao_segundos": tempo_gravacao,
+            "tempo_carga_segundos": tempo_carga,
+            "tamanho_bytes": tamanho,
+            "bytes_por_produto": tamanho / quantidade,
+            "aceleracao": aceleracao
+        }
+
+        # Validação: estado idêntico e carga mais rápida que a reconstrução
+        assert len(carregada.produtos) == quantidade
+        assert len(carregada.pedidos) == quantidade_clientes
+        amostra = quantidade // 2
+        original, copia = loja.buscar_produto(amostra), carregada.buscar_produto(amostra)
+        assert (copia.nome, copia.preco, copia.estoque) == \
+            (original.nome, original.preco, original.estoque)
+        assert carregada.buscar_cliente(1).obter_total_gasto() == \
+            loja.buscar_cliente(1).obter_total_gasto()
+        assert tempo_carga < tempo_reconstrucao
+
+        print(f"\n✓ APROVADO: Snapshot carregado em {tempo_carga:.3f}s ({aceleracao:.1f}x mais rápido)")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    def test_performance_diario_de_mutacoes(self, tmp_path):
+        """
+        Teste de Performance: Diário de Mutações
+
+        Mede mutações de estoque por segundo sem diário e com o diário em
+        cada política de fsync ("sempre" com uma e com várias threads, para
+        o commit em grupo, "intervalo" e "nunca"), e valida a recuperação.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: DIÁRIO DE MUTAÇÕES")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Diário de Mutações"
+
+        quantidade_produtos = 100
+        cenarios = [
+            ("sem diário", None, 1, 20_000),
+            ("sempre", "sempre", 1, 1_000),
+            ("sempre (8 threads)", "sempre", 8, 4_000),
+            ("intervalo", "intervalo", 1, 20_000),
+            ("nunca", "nunca", 1, 20_000),
+        ]
+
+        resultados = {}
+        for nome, politica, threads, mutacoes in cenarios:
+            caminho = tmp_path / f"{nome.split()[0]}-{threads}.diario"
+            loja = Loja()
+            loja.cadastrar_produtos_em_lote(
+                (i + 1, f"Produto {i + 1}", 10.0, 1_000_000) for i in range(quantidade_produtos))
+            if politica is not None:
+                loja.ativar_diario(Diario(caminho, politica=politica))
+            por_thread = mutacoes // threads
+
+            def mutar(semente):
+                for j in range(por_thread):
+                    produto_id = (semente * 31 + j) % quantidade_produtos + 1
+                    if j % 2 == 0:
+                        loja.estoque.reservar(produto_id, 1)
+                    else:
+                        loja.estoque.liberar(produto_id, 1)
+
+            inicio = time.time()
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                list(executor.map(mutar, range(threads)))
+            tempo = time.time() - inicio
+            if politica is not None:
+                loja.diario.fechar()
+
+            recuperada_ok = True
+            if politica is not None:
+                recuperada = Loja()
+                recuperada.cadastrar_produtos_em_lote(
+                    (i + 1, f"Produto {i + 1}", 10.0, 1_000_000) for i in range(quantidade_produtos))
+                diario.reproduzir(recuperada, caminho)
+                recuperada_ok = all(
+                    recuperada.buscar_produto(i + 1).estoque == loja.buscar_produto(i + 1).estoque
+                    for i in range(quantidade_produtos))
+
+            resultados[nome] = {
+                "politica": politica,
+                "threads": threads,
+                "mutacoes": por_thread * threads,
+                "tempo_segundos": tempo,
+                "mutacoes_por_segundo": por_thread * threads / tempo,
+                "recuperacao_consistente": recuperada_ok
+            }
+
+        print(f"\n✓ Resultados:")
+        for nome, r in resultados.items():
+            print(f"  - {nome:<20} {r['mutacoes_por_segundo']:>12.2f} mutações/s "
+                  f"(recuperação {'ok' if r['recuperacao_consistente'] else 'divergente'})")
+
+        self.metricas["metricas"] = {"cenarios": resultados}
+
+        # Validação: recuperação consistente e políticas relaxadas mais rápidas
+        assert all(r["recuperacao_consistente"] for r in resultados.values())
+        assert resultados["nunca"]["mutacoes_por_segundo"] > \
+            resultados["sempre"]["mutacoes_por_segundo"]
+        assert resultados["intervalo"]["mutacoes_por_segundo"] > \
+            resultados["sempre"]["mutacoes_por_segundo"]
+
+        print(f"\n✓ APROVADO: Diário recuperável em todas as políticas de fsync")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    def test_performance_loja_sqlite(self, tmp_path):
+        """
+        Teste de Performance: Loja em SQLite
+
+        Compara a loja em memória com a LojaSQLite (WAL, conexão por thread,
+        executemany e cache de produtos) em leituras, escritas e em um fluxo
+        misto de checkout, e valida que o estado persiste ao reabrir o banco.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: LOJA EM SQLITE")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Loja em SQLite"
+
+        quantidade_produtos = 10_000
+        quantidade_lote = 100_000
+        leituras = 100_000
+        pedidos = 2_000
+
+        def medir(loja):
+            tempos = {}
+            inicio = time.time()
+            for i in range(quantidade_produtos):
+                loja.cadastrar_produto(i + 1, f"Produto {i + 1}", 10.0 + i % 100, 1_000)
+            tempos["escrita_individual"] = time.time() - inicio
+
+            inicio = time.time()
+            loja.cadastrar_produtos_em_lote(
+                (quantidade_produtos + i + 1, f"Produto {i}", 10.0, 10) for i in range(quantidade_lote))
+            tempos["escrita_em_lote"] = time.time() - inicio
+
+            inicio = time.time()
+            for i in range(leituras):
+                loja.buscar_produto((i * 7919) % quantidade_produtos + 1)
+            tempos["leitura"] = time.time() - inicio
+
+            cliente = loja.cadastrar_cliente(1, "Cliente", "cliente@email.com")
+            inicio = time.time()
+            for i in range(pedidos):
+                pedido = loja.criar_pedido(cliente.id)
+                for k in range(3):
+                    pedido.adicionar_item(loja.buscar_produto((i + k * 101) % quantidade_produtos + 1), 1)
+                if loja.estoque.reservar_itens(
+                        (item.produto.id, item.quantidade) for item in pedido.itens):
+                    pedido.confirmar_pedido()
+                    cliente.adicionar_compra(pedido)
+            tempos["checkout"] = time.time() - inicio
+            return tempos
+
+        print(f"\n[TESTE] Executando a carga na loja em memória...")
+        tempos_memoria = medir(Loja())
+
+        print(f"[TESTE] Executando a carga na LojaSQLite...")
+        caminho = tmp_path / "loja.db"
+        loja_sqlite = LojaSQLite(caminho)
+        tempos_sqlite = medir(loja_sqlite)
+
+        # Leituras sem cache: cada busca vai ao banco
+        loja_fria = LojaSQLite(caminho, tamanho_cache=0)
+        inicio = time.time()
+        for i in range(leituras // 10):
+            loja_fria.buscar_produto((i * 7919) % quantidade_produtos + 1)
+        tempo_leitura_fria = (time.time() - inicio) * 10
+        loja_fria.fechar()
+        loja_sqlite.fechar()
+
+        def por_segundo(quantidade, tempo):
+            return quantidade / tempo
+
+        resultados = {
+            "escritas_individuais_por_segundo": (quantidade_produtos, "escrita_individual"),
+            "escritas_em_lote_por_segundo": (quantidade_lote, "escrita_em_lote"),
+            "leituras_por_segundo": (leituras, "leitura"),
+            "checkouts_por_segundo": (pedidos, "checkout"),
+        }
+        metricas = {}
+        print(f"\n✓ Resultados (memória / SQLite):")
+        for nome, (quantidade, chave) in resultados.items():
+            memoria = por_segundo(quantidade, tempos_memoria[chave])
+            sqlite = por_segundo(quantidade, tempos_sqlite[chave])
+            metricas[nome] = {"memoria": memoria, "sqlite": sqlite}
+            print(f"  - {nome.replace('_', ' ').capitalize()}: {memoria:>12.2f} / {sqlite:>12.2f}")
+        metricas["leituras_por_segundo"]["sqlite_sem_cache"] = por_segundo(leituras, tempo_leitura_fria)
+        print(f"  - Leituras por segundo sem cache: "
+              f"{metricas['leituras_por_segundo']['sqlite_sem_cache']:>12.2f}")
+
+        self.metricas["metricas"] = metricas
+
+        # Validação: o estado do checkout persiste ao reabrir o banco
+        reaberta = LojaSQLite(caminho)
+        cliente = reaberta.buscar_cliente(1)
+        assert len(reaberta.produtos) == quantidade_produtos + quantidade_lote
+        assert cliente.quantidade_compras == pedidos
+        assert reaberta.buscar_produto(1).estoque == 1_000 - sum(
+            1 for i in range(pedidos) for k in range(3) if (i + k * 101) % quantidade_produtos == 0)
+        reaberta.fechar()
+        assert metricas["leituras_por_segundo"]["sqlite"] > \
+            metricas["leituras_por_segundo"]["sqlite_sem_cache"]
+
+        print(f"\n✓ APROVADO: Estado da LojaSQLite persistido após {pedidos} checkouts")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="Requer /proc (Linux)")
+    def test_performance_catalogo_mmap(self, tmp_path):
+        """
+        Teste de Performance: Catálogo Mapeado em Memória
+
+        Simula workers do gunicorn: cada processo carrega a própria cópia da
+        loja a partir do snapshot ou abre o catálogo publicado via mmap.
+        Compara o RSS acrescentado por worker e a latência das consultas de
+        preço por id, e valida a troca atômica de versão do catálogo.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: CATÁLOGO MAPEADO EM MEMÓRIA")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Catálogo Mapeado em Memória"
+
+        quantidade = ESCALA_CATALOGO
+        workers = 4
+        consultas = 100_000
+        caminho_snapshot = tmp_path / "loja.snap"
+        caminho_catalogo = tmp_path / "catalogo.bin"
+
+        print(f"\n[TESTE] Publicando catálogo com {quantidade} produtos...")
+        loja = Loja()
+        loja.cadastrar_produtos_em_lote(
+            (i + 1, f"Produto {i + 1}", 10.0 + i % 1000, i % 50) for i in range(quantidade))
+        loja.salvar_snapshot(caminho_snapshot)
+        inicio = time.time()
+        loja.publicar_catalogo(caminho_catalogo)
+        tempo_publicacao = time.time() - inicio
+        del loja
+        gc.collect()
+
+        gerador = random.Random(42)
+        ids = [gerador.randint(1, quantidade) for _ in range(consultas)]
+
+        contexto = multiprocessing.get_context("fork" if hasattr(os, "fork") else "spawn")
+        resultados = {}
+        for modo, caminho in (("copia", caminho_snapshot), ("mmap", caminho_catalogo)):
+            print(f"[TESTE] {workers} workers no modo '{modo}'...")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=contexto) as executor:
+                resultados[modo] = list(executor.map(
+                    _consultar_catalogo_em_processo,
+                    [modo] * workers, [str(caminho)] * workers, [ids] * workers))
+
+        metricas = {"produtos": quantidade, "workers": workers,
+                    "tempo_publicacao_s": tempo_publicacao,
+                    "tamanho_catalogo_mb": os.path.getsize(caminho_catalogo) / 1024 / 1024}
+        print(f"\n✓ Catálogo publicado em {tempo_publicacao:.3f}s "
+              f"({metricas['tamanho_catalogo_mb']:.1f} MB)")
+        print(f"\n✓ Resultados por worker (média de {workers}):")
+        for modo, medidas in resultados.items():
+            metricas[modo] = {
+                chave: statistics.mean(m[chave] for m in medidas)
+                for chave in ("rss_kb", "rss_privado_kb", "latencia_fria_us", "latencia_quente_us")
+            }
+            print(f"  - {modo:>5}: RSS +{metricas[modo]['rss_kb'] / 1024:>8.1f} MB | "
+                  f"privado +{metricas[modo]['rss_privado_kb'] / 1024:>8.1f} MB | "
+                  f"{metricas[modo]['latencia_fria_us']:.3f} µs/consulta (fria), "
+                  f"{metricas[modo]['latencia_quente_us']:.3f} µs/consulta (quente)")
+        print(f"  - Memória privada total ({workers} workers): "
+              f"cópia {metricas['copia']['rss_privado_kb'] * workers / 1024:.1f} MB, "
+              f"mmap {metricas['mmap']['rss_privado_kb'] * workers / 1024:.1f} MB")
+
+        # Troca atômica: uma nova versão publicada é vista após atualizar()
+        catalogo = CatalogoMmap(caminho_catalogo, intervalo_verificacao=3600)
+        antigo = catalogo[1]
+        catalogo_mmap.publicar([Produto(1, "Produto 1", 99.0, 1)], caminho_catalogo)
+        assert catalogo.atualizar()
+        assert catalogo.versao == 2 and catalogo.preco(1) == 99.0
+        assert antigo.preco == 10.0
+
+        self.metricas["metricas"] = metricas
+
+        # Validação: mesmas respostas e memória privada bem menor com mmap
+        somas = {m["soma"] for medidas in resultados.values() for m in medidas}
+        assert len(somas) == 1
+        assert metricas["mmap"]["rss_privado_kb"] <= metricas["copia"]["rss_privado_kb"] / 4
+
+        print(f"\n✓ APROVADO: Workers compartilham o catálogo mapeado sem cópias privadas")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requer fork e fcntl (POSIX)")
+    def test_performance_estoque_compartilhado(self, tmp_path):
+        """
+        Teste de Performance: Estoque Compartilhado entre Processos
+
+        Vários processos (como workers do gunicorn) reservam o mesmo estoque
+        guardado em multiprocessing.shared_memory, com demanda maior que a
+        oferta. Mede decrementos por segundo e valida que nenhum produto foi
+        vendido além do estoque disponível.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: ESTOQUE COMPARTILHADO ENTRE PROCESSOS")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Estoque Compartilhado entre Processos"
+
+        quantidade_produtos = 1_000
+        estoque_inicial = 100
+        tentativas = 50_000
+        nome = f"loja_perf_{os.getpid()}"
+        caminho_travas = str(tmp_path / "estoque.travas")
+        contexto = multiprocessing.get_context("fork")
+
+        def executar(processos, threads):
+            memoria = MemoriaEstoque(nome, capacidade=quantidade_produtos,
+                                     caminho_travas=caminho_travas)
+            try:
+                Loja(CatalogoCompartilhado(memoria)).cadastrar_produtos_em_lote(
+                    (i + 1, f"Produto {i + 1}", 10.0, estoque_inicial)
+                    for i in range(quantidade_produtos))
+                inicio = time.perf_counter()
+                with ProcessPoolExecutor(max_workers=processos, mp_context=contexto) as executor:
+                    resultados = list(executor.map(
+                        _reservar_estoque_em_processo,
+                        [nome] * processos, [caminho_travas] * processos,
+                        [quantidade_produtos] * processos, [tentativas] * processos,
+                        range(processos), [threads] * processos))
+                tempo = time.perf_counter() - inicio
+                finais = [memoria.valor(memoria.posicao(i + 1)) for i in range(quantidade_produtos)]
+            finally:
+                memoria.remover()
+            vendidos = [sum(v[i + 1] for v, _ in resultados) for i in range(quantidade_produtos)]
+            return vendidos, finais, tempo, max(t for _, t in resultados)
+
+        metricas = {"produtos": quantidade_produtos, "estoque_inicial": estoque_inicial,
+                    "tentativas_por_processo": tentativas}
+        print(f"\n[TESTE] {quantidade_produtos} produtos com {estoque_inicial} unidades, "
+              f"{tentativas} tentativas de reserva por processo")
+        # Workers com várias threads (gunicorn com --threads) disputam as
+        # travas do fcntl dentro do mesmo processo
+        for processos, threads in ((1, 1), (2, 1), (4, 1), (4, 6)):
+            vendidos, finais, tempo, tempo_reservas = executar(processos, threads)
+            total_vendido = sum(vendidos)
+            decrementos = processos * tentativas / tempo_reservas
+            chave = f"{processos}_processos" if threads == 1 else f"{processos}_processos_{threads}_threads"
+            metricas[chave] = {
+                "unidades_vendidas": total_vendido,
+                "tempo_total_s": tempo,
+                "decrementos_por_segundo": decrementos,
+            }
+            print(f"  - {processos} processo(s) x {threads} thread(s): {decrementos:>12.2f} decrementos/s | "
+                  f"{total_vendido} unidades vendidas | {tempo:.3f}s")
+
+            # Validação: cada unidade vendida saiu do contador compartilhado
+            assert all(final >= 0 for final in finais)
+            assert all(vendido + final == estoque_inicial
+                       for vendido, final in zip(vendidos, finais))
+            assert total_vendido <= quantidade_produtos * estoque_inicial
+
+        self.metricas["metricas"] = metricas
+
+        print(f"\n✓ APROVADO: Nenhuma venda acima do estoque entre processos")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    def test_performance_api_rest(self, monkeypatch):
+        """
+        Teste de Performance: API REST
+
+        Mede a latência (p50/p99) dos endpoints de produtos e pedidos pelo
+        cliente de testes do Flask: consulta com o cache de respostas frio e
+        quente, GET condicional (304), busca e criação de pedidos. Compara a
+        serialização em cache com o jsonify ingênuo montado a cada requisição.
+        """
+        pytest.importorskip("flask")
+        import app as aplicacao
+        from flask import jsonify
+        from loja_online.serializacao import CacheRespostas
+
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: API REST")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "API REST"
+
+        quantidade_produtos = 10_000
+        requisicoes = 5_000
+
+        loja = Loja()
+        loja.cadastrar_produtos_em_lote(
+            (i + 1, f"Produto {i + 1} {'gamer' if i % 100 == 0 else 'comum'}", 10.0 + i % 500, 1_000)
+            for i in range(quantidade_produtos))
+        loja.cadastrar_cliente(1, "Cliente", "cliente@email.com")
+        monkeypatch.setattr(aplicacao, "loja", loja)
+        monkeypatch.setattr(aplicacao, "respostas", CacheRespostas())
+        cliente_http = aplicacao.app.test_client()
+
+        def medir(requisitar, quantidade=requisicoes):
+            latencias = []
+            for i in range(quantidade):
+                inicio = time.perf_counter()
+                requisitar(i)
+                latencias.append((time.perf_counter() - inicio) * 1e6)
+            latencias.sort()
+            return {
+                "p50_us": latencias[len(latencias) // 2],
+                "p99_us": latencias[int(len(latencias) * 0.99)],
+                "requisicoes_por_segundo": quantidade / (sum(latencias) / 1e6),
+            }
+
+        ids = [(i * 7919) % quantidade_produtos + 1 for i in range(requisicoes)]
+        etags = {}
+
+        def consultar(i):
+            resposta = cliente_http.get(f"/produtos/{ids[i]}")
+            assert resposta.status_code == 200
+            etags[ids[i]] = resposta.headers["ETag"]
+
+        def consultar_condicional(i):
+            resposta = cliente_http.get(f"/produtos/{ids[i]}",
+                                        headers={"If-None-Match": etags[ids[i]]})
+            assert resposta.status_code == 304
+
+        def buscar(i):
+            assert cliente_http.get("/produtos?busca=gamer&limite=50").status_code == 200
+
+        def criar_pedido(i):
+            resposta = cliente_http.post("/pedidos", json={
+                "cliente_id": 1, "itens": [{"produto_id": ids[i], "quantidade": 1}]})
+            assert resposta.status_code == 201
+
+        print(f"\n[TESTE] {requisicoes} requisições por cenário sobre {quantidade_produtos} produtos...")
+        cenarios = {
+            "produto_cache_frio": medir(consultar),
+            "produto_cache_quente": medir(consultar),
+            "produto_304": medir(consultar_condicional),
+            "busca_por_nome": medir(buscar, requisicoes // 10),
+            "criar_pedido": medir(criar_pedido),
+        }
+
+        # Somente a serialização: jsonify montado a cada vez, serializador
+        # pré-compilado (cache frio) e corpo reaproveitado do cache
+        produtos = [loja.buscar_produto(produto_id) for produto_id in ids]
+        cache = CacheRespostas()
+        with aplicacao.app.app_context():
+            inicio = time.perf_counter()
+            for produto in produtos:
+                jsonify({"id": produto.id, "nome": produto.nome,
+                         "preco": produto.preco, "estoque": produto.estoque}).get_data()
+            tempos_serializacao = {"jsonify": time.perf_counter() - inicio}
+        for nome in ("cache_frio", "cache_quente"):
+            inicio = time.perf_counter()
+            for produto in produtos:
+                cache.obter(("produto", produto.id), PRODUTO, produto)
+            tempos_serializacao[nome] = time.perf_counter() - inicio
+        serializacao = {f"{nome}_us": tempo / len(produtos) * 1e6
+                        for nome, tempo in tempos_serializacao.items()}
+
+        print(f"\n✓ Latência por cenário:")
+        for nome, medidas in cenarios.items():
+            print(f"  - {nome:<22}: p50 {medidas['p50_us']:>9.1f} µs | p99 {medidas['p99_us']:>9.1f} µs | "
+                  f"{medidas['requisicoes_por_segundo']:>9.1f} req/s")
+        print(f"\n✓ Serialização de {len(produtos)} produtos:")
+        print(f"  - jsonify a cada requisição: {serializacao['jsonify_us']:.2f} µs/produto")
+        print(f"  - Serializador (cache frio): {serializacao['cache_frio_us']:.2f} µs/produto")
+        print(f"  - Cache de respostas:        {serializacao['cache_quente_us']:.2f} µs/produto")
+
+        self.metricas["metricas"] = {"cenarios": cenarios, "serializacao": serializacao}
+
+        # Validação: estoque coerente com os pedidos e cache mais barato que jsonify
+        assert sum(loja.buscar_produto(i).estoque for i in set(ids)) == \
+            1_000 * len(set(ids)) - requisicoes
+        assert serializacao["cache_quente_us"] < serializacao["cache_frio_us"]
+        assert serializacao["cache_quente_us"] < serializacao["jsonify_us"]
+
+        print(f"\n✓ APROVADO: Corpos em cache evitam recodificar objetos inalterados")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    def test_performance_checkout_assincrono(self):
+        """
+        Teste de Performance: Checkout Assíncrono
+
+        Compara checkouts por segundo do caminho com threads (uma thread
+        bloqueada por cobrança) com a fachada asyncio, usando um gateway
+        simulado com latência fixa por cobrança.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: CHECKOUT ASSÍNCRONO")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Checkout Assíncrono"
+
+        checkouts = 2_000
+        latencia = 0.02
+        quantidade_produtos = 100
+
+        def preparar():
+            loja = Loja()
+            loja.cadastrar_produtos_em_lote(
+                (i + 1, f"Produto {i + 1}", 10.0 + i, checkouts) for i in range(quantidade_produtos))
+            loja.cadastrar_cliente(1, "Cliente", "cliente@email.com")
+            carrinhos = []
+            for i in range(checkouts):
+                carrinho = Carrinho()
+                carrinho.adicionar_produto(loja.buscar_produto(i % quantidade_produtos + 1), 1)
+                carrinhos.append(carrinho)
+            return loja, carrinhos
+
+        def validar(loja, resultados):
+            assert all(pedido.status == "confirmado" for pedido, _, _ in resultados)
+            assert sum(p.estoque for p in loja.estoque.listar_produtos()) == \
+                checkouts * quantidade_produtos - checkouts
+            assert loja.buscar_cliente(1).quantidade_compras == checkouts
+
+        metricas = {"checkouts": checkouts, "latencia_gateway_ms": latencia * 1000}
+        print(f"\n[TESTE] {checkouts} checkouts com gateway de {latencia * 1000:.0f} ms por cobrança")
+
+        for threads in (32, 128):
+            loja, carrinhos = preparar()
+            gateway = GatewaySimulado(latencia=latencia)
+            inicio = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                resultados = list(executor.map(
+                    lambda carrinho: loja.finalizar_compra(1, carrinho, "Rua A, 1", gateway), carrinhos))
+            tempo = time.perf_counter() - inicio
+            validar(loja, resultados)
+            metricas[f"threads_{threads}"] = {"tempo_s": tempo, "checkouts_por_segundo": checkouts / tempo}
+            print(f"  - {threads:>4} threads:        {checkouts / tempo:>10.2f} checkouts/s ({tempo:.3f}s)")
+
+        for limite in (None, 500):
+            loja, carrinhos = preparar()
+            loja_assincrona = LojaAssincrona(loja, GatewaySimulado(latencia=latencia),
+                                             limite_simultaneos=limite)
+            inicio = time.perf_counter()
+            resultados = asyncio.run(loja_assincrona.finalizar_compras(
+                (1, carrinho, "Rua A, 1") for carrinho in carrinhos))
+            tempo = time.perf_counter() - inicio
+            validar(loja, resultados)
+            nome = f"asyncio_limite_{limite}" if limite else "asyncio_sem_limite"
+            metricas[nome] = {"tempo_s": tempo, "checkouts_por_segundo": checkouts / tempo}
+            descricao = f"asyncio (limite {limite})" if limite else "asyncio (sem limite)"
+            print(f"  - {descricao:<20}: {checkouts / tempo:>10.2f} checkouts/s ({tempo:.3f}s)")
+
+        self.metricas["metricas"] = metricas
+
+        # Validação: sem threads bloqueadas, o asyncio supera o pool de 32 threads
+        assert metricas["asyncio_sem_limite"]["checkouts_por_segundo"] > \
+            metricas["threads_32"]["checkouts_por_segundo"]
+
+        print(f"\n✓ APROVADO: {checkouts} checkouts simultâneos em um único processo com asyncio")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    def test_performance_processador_pagamentos(self):
+        """
+        Teste de Performance: Processador de Pagamentos em Lote
+
+        Processa pagamentos por um gateway simulado (latência por chamada e
+        por item, com falhas transitórias) variando o tamanho do lote e o
+        número de trabalhadores. Mede vazão e latência p50/p99 de cada
+        pagamento, do envio até a resposta.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: PROCESSADOR DE PAGAMENTOS EM LOTE")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Processador de Pagamentos em Lote"
+
+        quantidade = 1_000
+        latencia = 0.005
+        latencia_por_item = 0.00005
+        taxa_falhas = 0.05
+
+        print(f"\n[TESTE] {quantidade} pagamentos, gateway com {latencia * 1000:.0f} ms por chamada, "
+              f"{latencia_por_item * 1000:.2f} ms por item e {taxa_falhas:.0%} de falhas")
+
+        metricas = {"pagamentos": quantidade, "latencia_gateway_ms": latencia * 1000,
+                    "taxa_falhas": taxa_falhas, "configuracoes": {}}
+        for tamanho_lote in (1, 10, 50):
+            for trabalhadores in (4, 16):
+                gateway = GatewaySimulado(latencia=latencia, latencia_por_item=latencia_por_item,
+                                          taxa_falhas=taxa_falhas, semente=tamanho_lote)
+                pagamentos = [Pagamento(i, 10.0 + i % 100, "cartao") for i in range(quantidade)]
+                latencias = []
+
+                inicio = time.perf_counter()
+                with ProcessadorPagamentos(gateway, tamanho_lote=tamanho_lote,
+                                           trabalhadores=trabalhadores, tentativas=8,
+                                           espera_base=0.002, semente=1) as processador:
+                    futuros = []
+                    for pagamento in pagamentos:
+                        enviado = time.perf_counter()
+                        futuro = processador.enviar(pagamento)
+                        futuro.add_done_callback(
+                            lambda _, enviado=enviado: latencias.append(time.perf_counter() - enviado))
+                        futuros.append(futuro)
+                    resultados = [futuro.result() for futuro in futuros]
+                tempo = time.perf_counter() - inicio
+
+                # Validação: todo pagamento aprovado apesar das falhas injetadas
+                assert all(resultados)
+                assert all(p.status == "processado" for p in pagamentos)
+
+                latencias.sort()
+                medidas = {
+                    "pagamentos_por_segundo": quantidade / tempo,
+                    "p50_ms": latencias[len(latencias) // 2] * 1000,
+                    "p99_ms": latencias[int(len(latencias) * 0.99)] * 1000,
+                    "chamadas_gateway": gateway.chamadas,
+                    "repeticoes": processador.repeticoes,
+                }
+                metricas["configuracoes"][f"lote_{tamanho_lote}_trabalhadores_{trabalhadores}"] = medidas
+                print(f"  - lote {tamanho_lote:>3} | {trabalhadores:>2} trabalhadores: "
+                      f"{medidas['pagamentos_por_segundo']:>9.2f} pag/s | "
+                      f"p50 {medidas['p50_ms']:>8.2f} ms | p99 {medidas['p99_ms']:>8.2f} ms | "
+                      f"{gateway.chamadas:>4} chamadas | {processador.repeticoes:>3} repetições")
+
+        self.metricas["metricas"] = metricas
+
+        configuracoes = metricas["configuracoes"]
+        assert configuracoes["lote_50_trabalhadores_4"]["pagamentos_por_segundo"] > \
+            configuracoes["lote_1_trabalhadores_4"]["pagamentos_por_segundo"]
+
+        print(f"\n✓ APROVADO: Lotes e concorrência multiplicam a vazão de pagamentos")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    @pytest.mark.slow
+    def test_performance_registro_entregas(self):
+        """
+        Teste de Performance: Registro de Entregas por Status
+
+        Registra 1.000.000 de entregas e compara a contagem por status com
+        índice contra a varredura de todas as entregas, a busca por pedido
+        e as transições de status individuais contra as transições em lote.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: REGISTRO DE ENTREGAS POR STATUS")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Registro de Entregas por Status"
+
+        quantidade = ESCALA_CATALOGO
+        entregas = [Entrega(i, i, f"Rua {i % 1000}, {i}") for i in range(quantidade)]
+
+        print(f"\n[TESTE] Registrando {quantidade} entregas")
+        registro = RegistroEntregas()
+        inicio = time.perf_counter()
+        registro.adicionar_varias(entregas)
+        tempo_registro = time.perf_counter() - inicio
+        print(f"  - Registro: {tempo_registro:.4f}s ({quantidade / tempo_registro:.0f} entregas/s)")
+
+        terco = quantidade // 3
+        for entrega in entregas[:terco]:
+            entrega.iniciar_entrega()
+
+        print(f"\n[TESTE] Contagem por status")
+        repeticoes = 1_000
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            contagens = registro.contagens()
+        tempo_indice = (time.perf_counter() - inicio) / repeticoes
+
+        inicio = time.perf_counter()
+        varredura = {status: 0 for status in contagens}
+        for entrega in entregas:
+            varredura[entrega.status] += 1
+        tempo_varredura = time.perf_counter() - inicio
+
+        assert contagens == varredura
+        assert contagens["em_transito"] == terco
+        print(f"  - Índice: {tempo_indice * 1_000_000:.2f} µs | Varredura: {tempo_varredura * 1000:.2f} ms "
+              f"({tempo_varredura / tempo_indice:.0f}x)")
+
+        print(f"\n[TESTE] Busca por pedido")
+        pedidos = random.Random(42).sample(range(quantidade), min(100_000, quantidade))
+        inicio = time.perf_counter()
+        encontradas = [registro.buscar_por_pedido(pedido_id) for pedido_id in pedidos]
+        tempo_busca = time.perf_counter() - inicio
+        assert all(entrega.pedido_id == pedido_id for entrega, pedido_id in zip(encontradas, pedidos))
+        print(f"  - {len(pedidos)} buscas: {tempo_busca:.4f}s ({len(pedidos) / tempo_busca:.0f} buscas/s)")
+
+        print(f"\n[TESTE] Transições de status")
+        preparando = entregas[terco:]
+        individuais, em_lote = preparando[:terco], preparando[terco:2 * terco]
+
+        inicio = time.perf_counter()
+        for entrega in individuais:
+            entrega.iniciar_entrega()
+        tempo_individual = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        movidas = registro.iniciar_entregas(em_lote)
+        tempo_lote = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        confirmadas = registro.transicionar("em_transito", "entregue")
+        tempo_transicionar = time.perf_counter() - inicio
+
+        assert movidas == len(em_lote)
+        assert confirmadas == 3 * terco
+        assert registro.contagens() == {"preparando": quantidade - 3 * terco, "em_transito": 0,
+                                        "entregue": 3 * terco}
+        assert all(entrega.status == "entregue" for entrega in em_lote)
+
+        print(f"  - Individual (iniciar_entrega): {len(individuais) / tempo_individual:.0f} entregas/s")
+        print(f"  - Em lote (iniciar_entregas):   {movidas / tempo_lote:.0f} entregas/s")
+        print(f"  - Por status (transicionar):    {confirmadas / tempo_transicionar:.0f} entregas/s")
+
+        self.metricas["metricas"] = {
+            "entregas": quantidade,
+            "registro_por_segundo": quantidade / tempo_registro,
+            "contagem_indice_us": tempo_indice * 1_000_000,
+            "contagem_varredura_ms": tempo_varredura * 1000,
+            "buscas_por_segundo": len(pedidos) / tempo_busca,
+            "transicoes_individuais_por_segundo": len(individuais) / tempo_individual,
+            "transicoes_em_lote_por_segundo": movidas / tempo_lote,
+            "transicoes_por_status_por_segundo": confirmadas / tempo_transicionar,
+        }
+
+        assert tempo_indice < tempo_varredura
+        assert tempo_lote < tempo_individual
+
+        print(f"\n✓ APROVADO: Contagens por status em O(1) e transições em lote mais rápidas")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    def test_performance_despacho_entregas(self):
+        """
+        Teste de Performance: Despacho de Entregas por Região
+
+        Despacha entregas de 50 regiões (prefixo do CEP) por uma
+        transportadora simulada com latência por chamada e por item.
+        Compara o despacho individual (uma chamada e uma transição por
+        entrega) com grupos por região de tamanhos variados, e mede quanto
+        cada agendamento custa a quem chama.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: DESPACHO DE ENTREGAS POR REGIÃO")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Despacho de Entregas por Região"
+
+        quantidade = 5_000
+        regioes = 50
+        latencia = 0.0002
+        latencia_por_item = 0.000002
+
+        def criar_entregas():
+            registro = RegistroEntregas()
+            entregas = [Entrega(i, i, f"Rua {i}, {i % 500} - {i % regioes:03d}{i % 100:02d}-000")
+                        for i in range(quantidade)]
+            registro.adicionar_varias(entregas)
+            return registro, entregas
+
+        print(f"\n[TESTE] {quantidade} entregas em {regioes} regiões, transportadora com "
+              f"{latencia * 1000:.1f} ms por chamada e {latencia_por_item * 1000:.3f} ms por item")
+
+        metricas = {"entregas": quantidade, "regioes": regioes, "latencia_transportadora_ms": latencia * 1000,
+                    "configuracoes": {}}
+
+        registro, entregas = criar_entregas()
+        transportadora = TransportadoraSimulada(latencia=latencia, latencia_por_item=latencia_por_item)
+        inicio = time.perf_counter()
+        for entrega in entregas:
+            transportadora.despachar(regiao_cep(entrega.endereco), [entrega])
+            entrega.iniciar_entrega()
+        tempo = time.perf_counter() - inicio
+        assert registro.contar("em_transito") == quantidade
+        metricas["configuracoes"]["individual"] = {
+            "entregas_por_segundo": quantidade / tempo, "chamadas_transportadora": transportadora.chamadas}
+        print(f"  - Individual:   {quantidade / tempo:>10.2f} entregas/s | "
+              f"{transportadora.chamadas:>5} chamadas")
+
+        for tamanho_lote in (10, 50, 200):
+            registro, entregas = criar_entregas()
+            transportadora = TransportadoraSimulada(latencia=latencia, latencia_por_item=latencia_por_item)
+            latencias = []
+            inicio = time.perf_counter()
+            with DespachoEntregas(transportadora, registro, tamanho_lote=tamanho_lote,
+                                  intervalo=60) as despacho:
+                for entrega in entregas:
+                    agendada = time.perf_counter()
+                    despacho.adicionar(entrega)
+                    latencias.append(time.perf_counter() - agendada)
+            tempo = time.perf_counter() - inicio
+            latencias.sort()
+            p99_agendamento = latencias[int(len(latencias) * 0.99)] * 1_000_000
+
+            # Validação: todas despachadas e em trânsito, sem repetir entregas
+            assert registro.contagens() == {"preparando": 0, "em_transito": quantidade, "entregue": 0}
+            assert transportadora.despachadas == quantidade
+
+            # A thread do despacho chama a transportadora: quem agenda (o
+            # checkout) não paga a latência da chamada
+            assert p99_agendamento < latencia * 1_000_000
+
+            metricas["configuracoes"][f"lote_{tamanho_lote}"] = {
+                "entregas_por_segundo": quantidade / tempo, "chamadas_transportadora": transportadora.chamadas,
+                "p99_agendamento_us": p99_agendamento}
+            print(f"  - Lote {tamanho_lote:>4}:    {quantidade / tempo:>10.2f} entregas/s | "
+                  f"{transportadora.chamadas:>5} chamadas | p99 agendamento {p99_agendamento:.1f} µs")
+
+        self.metricas["metricas"] = metricas
+
+        configuracoes = metricas["configuracoes"]
+        assert configuracoes["lote_50"]["chamadas_transportadora"] == regioes * (quantidade // regioes // 50)
+        assert configuracoes["lote_50"]["entregas_por_segundo"] > \
+            5 * configuracoes["individual"]["entregas_por_segundo"]
+
+        print(f"\n✓ APROVADO: Agrupar por região reduz chamadas à transportadora e multiplica a vazão")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
     def test_performance_busca_produtos(self):
         """
         Teste de Performance: Busca de Produtos
@@ -268,17 +1965,68 @@ class TestPerformanceLoja:
         print(f"  - Buscas/segundo: {buscas_por_segundo:.2f}")
         print(f"  - Tempo médio por busca: {tempo_por_busca:.3f} ms")
 
+        # Busca por nome no índice invertido com um catálogo maior
+        quantidade_nomes = 100_000
+        tipos = ["Notebook", "Mouse", "Teclado", "Monitor", "Cadeira",
+                 "Fone", "Webcam", "Impressora", "Roteador", "Tablet"]
+        marcas = ["Acme", "Orion", "Vega", "Pampa", "Sertão",
+                  "Aurora", "Boreal", "Cerrado", "Delta", "Estrela"]
+        cores = ["Preto", "Branco", "Azul", "Vermelho", "Verde", "Cinza", "Rosa", "Prata"]
+
+        loja_nomes = Loja()
+        loja_nomes.cadastrar_produtos_em_lote(
+            (i + 1, f"{tipos[i % 10]} {marcas[(i // 10) % 10]} {cores[i % 8]} Modelo {i}", 100.0, 1)
+            for i in range(quantidade_nomes))
+
+        inicio_indice = time.time()
+        loja_nomes.estoque.indexar_nomes()
+        tempo_indexacao = time.time() - inicio_indice
+
+        consultas = [
+            ("notebook", "e"), ("notebook acme", "e"), ("mouse sertao cinza", "e"),
+            ("monitor aurora", "e"), ("modelo 4242", "e"),
+            ("webcam tablet", "ou"), ("vega azul", "ou"), ("roteador cinza prata", "ou"),
+        ]
+        print(f"\n[TESTE] Realizando {len(consultas) * 50} buscas por nome "
+              f"em {quantidade_nomes} produtos...")
+
+        latencias_nome = []
+        for _ in range(50):
+            for termo, modo in consultas:
+                inicio = time.perf_counter()
+                resultado = loja_nomes.buscar_produtos(termo, modo=modo, limite=20)
+                latencias_nome.append((time.perf_counter() - inicio) * 1000)
+                assert resultado, f"Busca sem resultado: {termo}"
+
+        latencias_nome.sort()
+        p50_nome = latencias_nome[len(latencias_nome) // 2]
+        p95_nome = latencias_nome[int(len(latencias_nome) * 0.95)]
+
+        print(f"  - Tempo de indexação de {quantidade_nomes} nomes: {tempo_indexacao:.3f} s")
+        print(f"  - Latência p50 da busca por nome: {p50_nome:.3f} ms")
+        print(f"  - Latência p95 da busca por nome: {p95_nome:.3f} ms")
+
         self.metricas["metricas"] = {
             "quantidade_produtos": quantidade,
             "quantidade_buscas": quantidade_buscas,
             "tempo_total_segundos": tempo_total,
             "buscas_por_segundo": buscas_por_segundo,
-            "tempo_medio_ms": tempo_por_busca
+            "tempo_medio_ms": tempo_por_busca,
+            "busca_por_nome": {
+                "quantidade_produtos": quantidade_nomes,
+                "quantidade_buscas": len(latencias_nome),
+                "tempo_indexacao_segundos": tempo_indexacao,
+                "latencia_p50_ms": p50_nome,
+                "latencia_p95_ms": p95_nome
+            }
         }
 
         # Validação: deve realizar buscas em menos de 1 segundo
         assert tempo_total < 1.0, f"Tempo de busca muito alto: {tempo_total:.3f}s"
         assert tempo_por_busca < 1.0, f"Tempo médio por busca muito alto: {tempo_por_busca:.3f}ms"
+        # Validação: busca por nome com p95 abaixo de 20 ms
+        assert p95_nome < 20.0, f"Busca por nome muito lenta: p95 {p95_nome:.3f}ms"
+        assert loja_nomes.buscar_produtos("modelo 4242")[0].id == 4243
 
         print(
             f"\n✓ APROVADO: {quantidade_buscas} buscas em {tempo_total:.3f}s")
@@ -286,6 +2034,89 @@ class TestPerformanceLoja:
 
         self._salvar_metricas()
 
+    @pytest.mark.slow
+    def test_performance_indice_de_precos(self):
+        """
+        Teste de Performance: Índice Ordenado de Preços
+
+        Compara consultas por faixa de preço, "mais baratos" e paginação
+        usando o índice ordenado contra ordenar todo o catálogo a cada
+        requisição, com 1.000.000 de produtos.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: ÍNDICE ORDENADO DE PREÇOS")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Índice Ordenado de Preços"
+
+        quantidade = ESCALA_CATALOGO
+        self.loja.cadastrar_produtos_em_lote(
+            (i + 1, f"Produto {i + 1}", float((i * 7919) % 100_000) / 100, 1)
+            for i in range(quantidade))
+        estoque = self.loja.estoque
+
+        def consultas_ordenando_tudo():
+            ordenados = sorted(estoque.listar_produtos(), key=lambda p: (p.preco, p.id))
+            faixa = [p for p in ordenados if 100.0 <= p.preco <= 200.0][40:60]
+            return faixa, ordenados[:20], ordenados[-20:][::-1]
+
+        def consultas_com_indice():
+            faixa = self.loja.buscar_produtos_por_preco(100.0, 200.0, inicio=40, limite=20)
+            return faixa, estoque.mais_baratos(20), estoque.mais_caros(20)
+
+        print(f"\n[TESTE] Consultando {quantidade} produtos ordenando o catálogo...")
+        repeticoes_ordenacao = 3
+        inicio = time.time()
+        for _ in range(repeticoes_ordenacao):
+            esperado = consultas_ordenando_tudo()
+        tempo_ordenacao = (time.time() - inicio) / repeticoes_ordenacao
+
+        inicio = time.time()
+        estoque.indexar_precos()
+        tempo_construcao = time.time() - inicio
+
+        print(f"[TESTE] Consultando {quantidade} produtos com o índice...")
+        repeticoes_indice = 1000
+        inicio = time.time()
+        for _ in range(repeticoes_indice):
+            obtido = consultas_com_indice()
+        tempo_indice = (time.time() - inicio) / repeticoes_indice
+
+        # Alterações de preço mantêm o índice consistente
+        inicio = time.time()
+        for i in range(10_000):
+            estoque.alterar_preco(i + 1, 0.001 * (i % 5))
+        tempo_alteracoes = time.time() - inicio
+
+        aceleracao = tempo_ordenacao / tempo_indice
+
+        print(f"\n✓ Resultados:")
+        print(f"  - Consulta ordenando tudo: {tempo_ordenacao*1000:.1f} ms")
+        print(f"  - Construção do índice: {tempo_construcao:.3f} s")
+        print(f"  - Consulta com índice: {tempo_indice*1000:.3f} ms")
+        print(f"  - Aceleração: {aceleracao:.0f}x")
+        print(f"  - 10.000 alterações de preço: {tempo_alteracoes*1000:.1f} ms")
+
+        self.metricas["metricas"] = {
+            "quantidade": quantidade,
+            "tempo_consulta_ordenando_ms": tempo_ordenacao * 1000,
+            "tempo_construcao_indice_segundos": tempo_construcao,
+            "tempo_consulta_indice_ms": tempo_indice * 1000,
+            "aceleracao": aceleracao,
+            "tempo_10000_alteracoes_ms": tempo_alteracoes * 1000
+        }
+
+        # Validação: mesmos resultados e consultas muito mais rápidas
+        assert [[p.id for p in parte] for parte in obtido] == \
+            [[p.id for p in parte] for parte in esperado]
+        assert [p.id for p in estoque.mais_baratos(5)] == [1, 6, 11, 16, 21]
+        assert tempo_indice * 100 < tempo_ordenacao
+
+        print(f"\n✓ APROVADO: Índice {aceleracao:.0f}x mais rápido que ordenar o catálogo")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
     def test_stress_atualizacao_estoque_concorrente(self):
         """
         Teste de Stress: Atualização Concorrente de Estoque
@@ -367,6 +2198,280 @@ class TestPerformanceLoja:
 
         self._salvar_metricas()
 
+    def test_stress_reserva_estoque_escalando_threads(self):
+        """
+        Teste de Stress: Reserva de Estoque com Travas Listradas
+
+        Valida que reservas concorrentes em muitos SKUs nunca vendem além
+        do estoque disponível e mede a vazão conforme o número de threads cresce.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE STRESS: RESERVA DE ESTOQUE ESCALANDO THREADS")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Reserva de Estoque Escalando Threads"
+
+        quantidade_produtos = 1000
+        estoque_por_produto = 20
+        tentativas = quantidade_produtos * estoque_por_produto * 2
+        niveis_threads = [1, 2, 4, 8, 16, 32]
+
+        print(f"\n[TESTE] {tentativas} tentativas de reserva em "
+              f"{quantidade_produtos} SKUs com {estoque_por_produto} unidades cada")
+
+        intervalo_original = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+        resultados_por_nivel = []
+        try:
+            for threads in niveis_threads:
+                loja = Loja()
+                for i in range(quantidade_produtos):
+                    loja.cadastrar_produto(i + 1, f"Produto {i + 1}", 10.0) \
+                        .definir_estoque(estoque_por_produto)
+
+                por_thread = tentativas // threads
+
+                def reservar_lote(semente):
+                    sucessos = 0
+                    for j in range(por_thread):
+                        produto_id = (semente * 7919 + j * 31) % quantidade_produtos + 1
+                        if loja.estoque.reservar(produto_id, 1):
+                            sucessos += 1
+                    return sucessos
+
+                tempo_inicio = time.time()
+                with ThreadPoolExecutor(max_workers=threads) as executor:
+                    sucessos = sum(executor.map(reservar_lote, range(threads)))
+                tempo_total = time.time() - tempo_inicio
+
+                estoques = [p.estoque for p in loja.estoque.listar_produtos()]
+                vendidos = quantidade_produtos * estoque_por_produto - sum(estoques)
+                excedentes = sucessos - vendidos
+                negativos = sum(1 for e in estoques if e < 0)
+
+                resultados_por_nivel.append({
+                    "threads": threads,
+                    "reservas_sucesso": sucessos,
+                    "unidades_vendidas": vendidos,
+                    "vendas_excedentes": excedentes,
+                    "produtos_negativos": negativos,
+                    "tempo_total_segundos": tempo_total,
+                    "reservas_por_segundo": (por_thread * threads) / tempo_total
+                })
+        finally:
+            sys.setswitchinterval(intervalo_original)
+
+        print(f"\n✓ Resultados:")
+        for r in resultados_por_nivel:
+            print(f"  - {r['threads']:>2} threads: {r['reservas_por_segundo']:>12.2f} reservas/s, "
+                  f"vendas excedentes: {r['vendas_excedentes']}, "
+                  f"estoques negativos: {r['produtos_negativos']}")
+
+        self.metricas["metricas"] = {
+            "quantidade_produtos": quantidade_produtos,
+            "estoque_por_produto": estoque_por_produto,
+            "tentativas": tentativas,
+            "niveis": resultados_por_nivel
+        }
+
+        # Validação: nenhuma venda excedente e nenhum estoque negativo
+        for r in resultados_por_nivel:
+            assert r["vendas_excedentes"] == 0, \
+                f"Venda excedente com {r['threads']} threads: {r['vendas_excedentes']}"
+            assert r["produtos_negativos"] == 0
+            assert r["unidades_vendidas"] == quantidade_produtos * estoque_por_produto
+
+        print(f"\n✓ APROVADO: Nenhuma venda excedente em {len(niveis_threads)} níveis de concorrência")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    @pytest.mark.slow
+    def test_performance_memoria_catalogo_unico(self):
+        """
+        Teste de Performance: Memória do Catálogo Único
+
+        Compara os bytes por produto do layout antigo (Loja.produtos e
+        Estoque.produtos como dicionários separados) com o catálogo único
+        compartilhado entre Loja e Estoque, com 1.000.000 de produtos.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: MEMÓRIA DO CATÁLOGO ÚNICO")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Memória do Catálogo Único"
+
+        quantidade = ESCALA_CATALOGO
+
+        def medir(cadastrar):
+            gc.collect()
+            tracemalloc.start()
+            try:
+                inicio = time.time()
+                referencia = cadastrar()
+                tempo = time.time() - inicio
+                memoria, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return referencia, memoria, tempo
+
+        def cadastrar_layout_duplicado():
+            produtos = {}
+            estoque = Estoque()
+            for i in range(quantidade):
+                produto = Produto(i + 1, f"Produto {i + 1}", 10.0)
+                produtos[produto.id] = produto
+                estoque.adicionar_produto(produto)
+            return produtos, estoque
+
+        def cadastrar_catalogo_unico():
+            loja = Loja()
+            for i in range(quantidade):
+                loja.cadastrar_produto(i + 1, f"Produto {i + 1}", 10.0)
+            return loja
+
+        print(f"\n[TESTE] Cadastrando {quantidade} produtos em cada layout...")
+
+        duplicado, memoria_antes, tempo_antes = medir(cadastrar_layout_duplicado)
+        del duplicado
+        loja, memoria_depois, tempo_depois = medir(cadastrar_catalogo_unico)
+
+        bytes_antes = memoria_antes / quantidade
+        bytes_depois = memoria_depois / quantidade
+
+        # Buscas continuam O(1) pelos dois caminhos
+        inicio = time.time()
+        for i in range(0, quantidade, 10):
+            assert loja.buscar_produto(i + 1) is not None
+            assert loja.estoque.buscar_produto(i + 1) is not None
+        tempo_buscas = time.time() - inicio
+        tempo_por_busca_us = tempo_buscas / (quantidade // 10 * 2) * 1_000_000
+
+        print(f"\n✓ Resultados:")
+        print(f"  - Bytes por produto (dicionários duplicados): {bytes_antes:.1f}")
+        print(f"  - Bytes por produto (catálogo único): {bytes_depois:.1f}")
+        print(f"  - Economia por produto: {bytes_antes - bytes_depois:.1f} bytes")
+        print(f"  - Tempo de cadastro antes/depois: {tempo_antes:.3f}s / {tempo_depois:.3f}s")
+        print(f"  - Tempo médio por busca: {tempo_por_busca_us:.3f} µs")
+
+        self.metricas["metricas"] = {
+            "quantidade": quantidade,
+            "bytes_por_produto_antes": bytes_antes,
+            "bytes_por_produto_depois": bytes_depois,
+            "tempo_cadastro_antes_segundos": tempo_antes,
+            "tempo_cadastro_depois_segundos": tempo_depois,
+            "tempo_medio_busca_us": tempo_por_busca_us
+        }
+
+        # Validação: o catálogo único usa menos memória e mantém buscas rápidas
+        assert len(loja.produtos) == quantidade
+        assert bytes_depois < bytes_antes
+        assert tempo_por_busca_us < 10.0
+
+        print(f"\n✓ APROVADO: {bytes_antes - bytes_depois:.1f} bytes economizados por produto")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
+    @pytest.mark.slow
+    def test_performance_memoria_objetos_compactos(self):
+        """
+        Teste de Performance: Memória dos Objetos de Domínio
+
+        Compara, com tracemalloc, a memória de Pedido (com um item),
+        Pagamento e Entrega residentes usando __dict__ por instância e
+        itens em dicionário contra as versões com __slots__.
+        """
+        print("\n" + "="*80)
+        print("TESTE DE PERFORMANCE: MEMÓRIA DOS OBJETOS DE DOMÍNIO")
+        print("="*80)
+
+        self.metricas["nome_teste"] = "Memória dos Objetos de Domínio"
+
+        class PedidoComDict:
+            def __init__(self, id, cliente_id):
+                self.id = id
+                self.cliente_id = cliente_id
+                self.itens = []
+                self.total = 0
+                self.status = "pendente"
+
+            def adicionar_item(self, produto, quantidade):
+                self.itens.append({"produto": produto, "quantidade": quantidade})
+                self.total = sum(i["produto"].preco * i["quantidade"] for i in self.itens)
+
+        class PagamentoComDict:
+            def __init__(self, id, valor, metodo):
+                self.id = id
+                self.valor = valor
+                self.metodo = metodo
+                self.status = "pendente"
+
+        class EntregaComDict:
+            def __init__(self, id, pedido_id, endereco):
+                self.id = id
+                self.pedido_id = pedido_id
+                self.endereco = endereco
+                self.status = "preparando"
+
+        quantidade = 200_000
+        produto = Produto(1, "Produto", 10.0)
+        endereco = "Rua A, 123"
+
+        def medir(classe_pedido, classe_pagamento, classe_entrega):
+            gc.collect()
+            tracemalloc.start()
+            try:
+                objetos = []
+                for i in range(quantidade):
+                    pedido = classe_pedido(i, i)
+                    pedido.adicionar_item(produto, 2)
+                    objetos.append((pedido,
+                                    classe_pagamento(i, pedido.total, "pix"),
+                                    classe_entrega(i, i, endereco)))
+                memoria, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return objetos, memoria
+
+        print(f"\n[TESTE] Criando {quantidade} conjuntos Pedido + Pagamento + Entrega...")
+
+        objetos, memoria_dict = medir(PedidoComDict, PagamentoComDict, EntregaComDict)
+        del objetos
+        objetos, memoria_slots = medir(Pedido, Pagamento, Entrega)
+
+        bytes_dict = memoria_dict / quantidade
+        bytes_slots = memoria_slots / quantidade
+        reducao = (1 - bytes_slots / bytes_dict) * 100
+
+        # Acesso a atributos continua compatível
+        inicio = time.time()
+        total = sum(p.total + pg.valor for p, pg, _ in objetos)
+        tempo_acesso = time.time() - inicio
+
+        print(f"\n✓ Resultados:")
+        print(f"  - Bytes por conjunto com __dict__: {bytes_dict:.1f}")
+        print(f"  - Bytes por conjunto com __slots__: {bytes_slots:.1f}")
+        print(f"  - Redução: {reducao:.1f}%")
+        print(f"  - Tempo de leitura de atributos: {tempo_acesso*1000:.1f} ms")
+
+        self.metricas["metricas"] = {
+            "quantidade": quantidade,
+            "bytes_por_conjunto_dict": bytes_dict,
+            "bytes_por_conjunto_slots": bytes_slots,
+            "reducao_percentual": reducao,
+            "tempo_acesso_ms": tempo_acesso * 1000
+        }
+
+        # Validação: objetos compactos ocupam menos memória
+        assert total == pytest.approx(quantidade * 40.0)
+        assert bytes_slots < bytes_dict
+
+        print(f"\n✓ APROVADO: Redução de {reducao:.1f}% na memória residente")
+        print("="*80 + "\n")
+
+        self._salvar_metricas()
+
     def _salvar_metricas(self):
         """Salva as métricas de performance em um arquivo JSON"""
         try:
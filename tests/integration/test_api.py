@@ -0,0 +1,148 @@
+import pytest
+
+pytest.importorskip("flask")
+
+import app as aplicacao
+from src.loja_online import catalogo_mmap
+from src.loja_online.catalogo_mmap import CatalogoMmap
+from src.loja_online.loja import Loja
+from src.loja_online.produto import Produto
+from src.loja_online.serializacao import CacheRespostas
+
+
+@pytest.fixture
+def loja(monkeypatch):
+    loja = Loja()
+    loja.cadastrar_produto(1, "Notebook Gamer", 3000.0, 5)
+    loja.cadastrar_produto(2, "Mouse Gamer", 50.0, 20)
+    loja.cadastrar_produto(3, "Café", 19.9, 100)
+    loja.cadastrar_cliente(1, "João Silva", "joao@email.com")
+    monkeypatch.setattr(aplicacao, "loja", loja)
+    monkeypatch.setattr(aplicacao, "catalogo", None)
+    monkeypatch.setattr(aplicacao, "respostas", CacheRespostas())
+    return loja
+
+
+@pytest.fixture
+def catalogo(loja, tmp_path, monkeypatch):
+    # Versão publicada diferente da loja, para distinguir de onde veio a resposta
+    caminho = tmp_path / "catalogo.bin"
+    catalogo_mmap.publicar([Produto(1, "Notebook Gamer", 2800.0, 7), Produto(4, "Teclado", 120.0, 9)],
+                           caminho)
+    catalogo = CatalogoMmap(caminho)
+    monkeypatch.setattr(aplicacao, "catalogo", catalogo)
+    return catalogo
+
+
+@pytest.fixture
+def cliente_http(loja):
+    return aplicacao.app.test_client()
+
+
+class TestApiCatalogoMapeado:
+    def test_buscar_produto_no_catalogo(self, cliente_http, catalogo):
+        """Testa que a consulta por id usa o catálogo mapeado quando configurado"""
+        resposta = cliente_http.get("/produtos/4")
+        assert resposta.get_json() == {"id": 4, "nome": "Teclado", "preco": 120.0, "estoque": 9}
+        assert cliente_http.get("/produtos/1").get_json()["preco"] == 2800.0
+        assert cliente_http.get("/produtos/3").status_code == 404
+
+    def test_buscar_produtos_no_catalogo(self, cliente_http, catalogo):
+        """Testa que as buscas por nome e preço usam o catálogo mapeado"""
+        assert [p["id"] for p in cliente_http.get("/produtos?busca=gamer").get_json()] == [1]
+        resposta = cliente_http.get("/produtos?preco_min=100&preco_max=3000")
+        assert [(p["id"], p["preco"]) for p in resposta.get_json()] == [(4, 120.0), (1, 2800.0)]
+        resposta = cliente_http.get("/produtos?busca=gamer&preco_max=100")
+        assert resposta.get_json() == []
+
+
+class TestApiProdutos:
+    def test_buscar_produto(self, cliente_http):
+        """Testa a consulta de um produto por id"""
+        resposta = cliente_http.get("/produtos/3")
+        assert resposta.status_code == 200
+        assert resposta.get_json() == {"id": 3, "nome": "Café", "preco": 19.9, "estoque": 100}
+        assert resposta.headers["ETag"]
+
+    def test_produto_inexistente(self, cliente_http):
+        """Testa o 404 para produto inexistente"""
+        assert cliente_http.get("/produtos/99").status_code == 404
+
+    def test_get_condicional_retorna_304(self, cliente_http):
+        """Testa que um produto inalterado responde 304 ao If-None-Match"""
+        etag = cliente_http.get("/produtos/1").headers["ETag"]
+        resposta = cliente_http.get("/produtos/1", headers={"If-None-Match": etag})
+        assert resposta.status_code == 304
+        assert resposta.data == b""
+
+    def test_etag_muda_quando_produto_muda(self, cliente_http, loja):
+        """Testa que alterar o produto invalida o ETag anterior"""
+        etag = cliente_http.get("/produtos/1").headers["ETag"]
+        loja.estoque.alterar_preco(1, 2500.0)
+
+        resposta = cliente_http.get("/produtos/1", headers={"If-None-Match": etag})
+        assert resposta.status_code == 200
+        assert resposta.get_json()["preco"] == 2500.0
+        assert resposta.headers["ETag"] != etag
+
+    def test_buscar_produtos_por_nome(self, cliente_http):
+        """Testa a busca de produtos por nome"""
+        resposta = cliente_http.get("/produtos?busca=gamer")
+        assert sorted(p["id"] for p in resposta.get_json()) == [1, 2]
+
+    def test_buscar_produtos_por_preco(self, cliente_http):
+        """Testa a busca por faixa de preço, combinada ou não com nome"""
+        resposta = cliente_http.get("/produtos?preco_min=20&preco_max=3000")
+        assert [p["id"] for p in resposta.get_json()] == [2, 1]
+        resposta = cliente_http.get("/produtos?busca=gamer&preco_max=100")
+        assert [p["id"] for p in resposta.get_json()] == [2]
+
+
+class TestApiPedidos:
+    def test_criar_e_buscar_pedido(self, cliente_http, loja):
+        """Testa a criação de um pedido com reserva de estoque e sua consulta"""
+        resposta = cliente_http.post("/pedidos", json={
+            "cliente_id": 1, "itens": [{"produto_id": 1, "quantidade": 1},
+                                       {"produto_id": 2, "quantidade": 2}]})
+        assert resposta.status_code == 201
+        pedido = resposta.get_json()
+        assert pedido["status"] == "confirmado"
+        assert pedido["total"] == 3100.0
+        assert resposta.headers["Location"] == f"/pedidos/{pedido['id']}"
+        assert loja.buscar_produto(1).estoque == 4
+        assert loja.buscar_cliente(1).quantidade_compras == 1
+
+        consulta = cliente_http.get(f"/pedidos/{pedido['id']}")
+        assert consulta.get_json()["itens"] == [
+            {"produto_id": 1, "quantidade": 1, "preco": 3000.0},
+            {"produto_id": 2, "quantidade": 2, "preco": 50.0},
+        ]
+
+    def test_pedido_sem_estoque(self, cliente_http, loja):
+        """Testa o 409 quando não há estoque para o pedido"""
+        resposta = cliente_http.post("/pedidos", json={
+            "cliente_id": 1, "itens": [{"produto_id": 1, "quantidade": 6}]})
+        assert resposta.status_code == 409
+        assert loja.buscar_produto(1).estoque == 5
+        assert not loja.pedidos
+
+    def test_pedido_invalido(self, cliente_http):
+        """Testa as respostas para corpo inválido, cliente e produto inexistentes"""
+        assert cliente_http.post("/pedidos", json={"cliente_id": 1}).status_code == 400
+        assert cliente_http.post("/pedidos", json={
+            "cliente_id": 9, "itens": [{"produto_id": 1, "quantidade": 1}]}).status_code == 404
+        assert cliente_http.post("/pedidos", json={
+            "cliente_id": 1, "itens": [{"produto_id": 9, "quantidade": 1}]}).status_code == 404
+
+    def test_pedido_atualizado_muda_etag(self, cliente_http, loja):
+        """Testa que cancelar o pedido gera uma nova versão da resposta"""
+        pedido_id = cliente_http.post("/pedidos", json={
+            "cliente_id": 1, "itens": [{"produto_id": 3, "quantidade": 1}]}).get_json()["id"]
+        etag = cliente_http.get(f"/pedidos/{pedido_id}").headers["ETag"]
+        assert cliente_http.get(f"/pedidos/{pedido_id}",
+                                headers={"If-None-Match": etag}).status_code == 304
+
+        loja.buscar_pedido(pedido_id).cancelar_pedido()
+        resposta = cliente_http.get(f"/pedidos/{pedido_id}", headers={"If-None-Match": etag})
+        assert resposta.status_code == 200
+        assert resposta.get_json()["status"] == "cancelado"
@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+import pytest
+
+import asgi
+from src.loja_online.gateway_pagamento import GatewaySimulado
+from src.loja_online.loja import Loja
+from src.loja_online.loja_assincrona import LojaAssincrona
+
+
+@pytest.fixture
+def loja(monkeypatch):
+    loja = Loja()
+    loja.cadastrar_produto(1, "Mouse", 50.0, 3)
+    loja.cadastrar_cliente(1, "João", "joao@email.com")
+    monkeypatch.setattr(asgi, "loja", loja)
+    monkeypatch.setattr(asgi, "loja_assincrona", LojaAssincrona(loja, GatewaySimulado()))
+    return loja
+
+
+def _requisitar(metodo, caminho, dados=None):
+    corpo = json.dumps(dados).encode("utf-8") if dados is not None else b""
+    enviadas = []
+
+    async def receive():
+        return {"type": "http.request", "body": corpo, "more_body": False}
+
+    async def send(mensagem):
+        enviadas.append(mensagem)
+
+    scope = {"type": "http", "method": metodo, "path": caminho}
+    asyncio.run(asgi.app(scope, receive, send))
+    return enviadas[0]["status"], json.loads(enviadas[1]["body"])
+
+
+class TestAsgi:
+    def test_health(self, loja):
+        """Testa o health check da entrada ASGI"""
+        assert _requisitar("GET", "/health") == (200, {"status": "ok"})
+
+    def test_checkout(self, loja):
+        """Testa o checkout pela entrada ASGI"""
+        status, dados = _requisitar("POST", "/checkout", {
+            "cliente_id": 1, "endereco": "Rua A, 1", "itens": [{"produto_id": 1, "quantidade": 2}]})
+
+        assert status == 201
+        assert dados["status"] == "confirmado" and dados["total"] == 100.0
+        assert loja.buscar_produto(1).estoque == 1
+
+    def test_checkout_sem_estoque(self, loja):
+        """Testa o 409 quando falta estoque no checkout"""
+        status, _ = _requisitar("POST", "/checkout", {
+            "cliente_id": 1, "endereco": "Rua A, 1", "itens": [{"produto_id": 1, "quantidade": 4}]})
+        assert status == 409
+
+    def test_checkout_pagamento_recusado(self, loja, monkeypatch):
+        """Testa o 402 quando o gateway recusa o pagamento"""
+        monkeypatch.setattr(asgi, "loja_assincrona",
+                            LojaAssincrona(loja, GatewaySimulado(taxa_recusa=1.0)))
+        status, dados = _requisitar("POST", "/checkout", {
+            "cliente_id": 1, "endereco": "Rua A, 1", "itens": [{"produto_id": 1, "quantidade": 1}]})
+
+        assert status == 402
+        assert dados["pagamento"] == "recusado"
+        assert loja.buscar_produto(1).estoque == 3
+
+    def test_checkout_falha_do_gateway(self, loja, monkeypatch):
+        """Testa o 502 quando o gateway falha, sem perder o estoque reservado"""
+        monkeypatch.setattr(asgi, "loja_assincrona",
+                            LojaAssincrona(loja, GatewaySimulado(taxa_falhas=1.0)))
+        for _ in range(2):
+            status, _ = _requisitar("POST", "/checkout", {
+                "cliente_id": 1, "endereco": "Rua A, 1", "itens": [{"produto_id": 1, "quantidade": 2}]})
+            assert status == 502
+
+        assert loja.buscar_produto(1).estoque == 3
+
+    def test_checkout_invalido(self, loja):
+        """Testa as respostas de erro do checkout"""
+        assert _requisitar("POST", "/checkout", {"cliente_id": 1})[0] == 400
+        assert _requisitar("POST", "/checkout", {
+            "cliente_id": 2, "endereco": "x", "itens": [{"produto_id": 1, "quantidade": 1}]})[0] == 404
+        assert _requisitar("POST", "/checkout", {
+            "cliente_id": 1, "endereco": "x", "itens": [{"produto_id": 9, "quantidade": 1}]})[0] == 404
+        assert _requisitar("GET", "/outra")[0] == 404
@@ -69,3 +69,50 @@ class TestCarrinho:
         carrinho.limpar_carrinho()
 
         assert len(carrinho.itens) == 0
+
+    def test_adicionar_mesmo_produto_soma_quantidade(self):
+        """Testa que o mesmo produto adicionado de novo soma a quantidade"""
+        carrinho = Carrinho()
+        produto = Produto(1, "Notebook", 3000.0)
+
+        carrinho.adicionar_produto(produto, 1)
+        carrinho.adicionar_produto(produto, 2)
+
+        assert len(carrinho.itens) == 1
+        assert carrinho.itens[0].quantidade == 3
+        assert carrinho.calcular_total() == 9000.0
+
+    def test_atualizar_quantidade(self):
+        """Testa a atualização da quantidade de um produto no carrinho"""
+        carrinho = Carrinho()
+        carrinho.adicionar_produto(Produto(1, "Mouse", 50.0), 1)
+        assert carrinho.calcular_total() == 50.0
+
+        assert carrinho.atualizar_quantidade(1, 4) is True
+        assert carrinho.calcular_total() == 200.0
+
+    def test_atualizar_quantidade_zero_remove(self):
+        """Testa que quantidade zero remove o produto do carrinho"""
+        carrinho = Carrinho()
+        carrinho.adicionar_produto(Produto(1, "Mouse", 50.0), 1)
+
+        carrinho.atualizar_quantidade(1, 0)
+
+        assert carrinho.itens == []
+        assert carrinho.calcular_total() == 0
+
+    def test_atualizar_quantidade_produto_inexistente(self):
+        """Testa a atualização de um produto que não está no carrinho"""
+        carrinho = Carrinho()
+        assert carrinho.atualizar_quantidade(999, 1) is False
+
+    def test_total_recalculado_apos_remocao(self):
+        """Testa que o total memorizado é invalidado ao remover um produto"""
+        carrinho = Carrinho()
+        carrinho.adicionar_produto(Produto(1, "Notebook", 3000.0), 1)
+        carrinho.adicionar_produto(Produto(2, "Mouse", 50.0), 1)
+        assert carrinho.calcular_total() == 3050.0
+
+        carrinho.remover_produto(1)
+
+        assert carrinho.calcular_total() == 50.0
@@ -0,0 +1,48 @@
+import pytest
+from src.loja_online.catalogo import Catalogo
+from src.loja_online.produto import Produto
+
+
+class TestCatalogo:
+    def test_adicionar_retorna_produto_armazenado(self):
+        """Testa que adicionar devolve o próprio produto cadastrado"""
+        catalogo = Catalogo()
+        produto = Produto(1, "Notebook", 3000.0)
+
+        assert catalogo.adicionar(produto) is produto
+        assert catalogo[1] is produto
+
+    def test_adicionar_linhas(self):
+        """Testa o cadastro de várias linhas (id, nome, preco, estoque)"""
+        catalogo = Catalogo()
+        produtos = catalogo.adicionar_linhas([(1, "Notebook", 3000.0, 5), (2, "Mouse", 50.0, 20)])
+
+        assert len(catalogo) == 2
+        assert catalogo[2] is produtos[1]
+        assert catalogo[1].estoque == 5
+
+    def test_adicionar_linhas_com_id_repetido(self):
+        """Testa que ids repetidos no lote ou já cadastrados são rejeitados sem alterar o catálogo"""
+        catalogo = Catalogo()
+        catalogo.adicionar_linhas([(1, "Notebook", 3000.0, 5)])
+
+        with pytest.raises(ValueError):
+            catalogo.adicionar_linhas([(2, "Mouse", 50.0, 1), (2, "Mouse", 60.0, 1)])
+        with pytest.raises(ValueError):
+            catalogo.adicionar_linhas([(1, "Outro", 1.0, 1)])
+        assert list(catalogo) == [1]
+        assert catalogo[1].nome == "Notebook"
+
+    def test_catalogo_vazio_igual_dicionario_vazio(self):
+        """Testa que o catálogo se comporta como um dicionário"""
+        assert Catalogo() == {}
+
+    def test_reajustar_precos(self):
+        """Testa o reajuste percentual de todos os preços"""
+        catalogo = Catalogo()
+        catalogo.adicionar_linhas([(1, "Notebook", 100.0, 1), (2, "Mouse", 50.0, 1)])
+
+        catalogo.reajustar_precos(10)
+
+        assert catalogo[1].preco == pytest.approx(110.0)
+        assert catalogo[2].preco == pytest.approx(55.0)
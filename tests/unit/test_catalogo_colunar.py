@@ -0,0 +1,113 @@
+import pytest
+from src.loja_online.catalogo_colunar import CatalogoColunar, ProdutoColunar
+from src.loja_online.estoque import Estoque
+from src.loja_online.loja import Loja
+from src.loja_online.produto import Produto
+
+
+def criar_catalogo():
+    catalogo = CatalogoColunar()
+    catalogo.adicionar_linhas([
+        (1, "Notebook", 3000.0, 2),
+        (2, "Mouse", 50.0, 0),
+        (3, "Teclado", 150.0, 10),
+    ])
+    return catalogo
+
+
+class TestCatalogoColunar:
+    def test_adicionar_retorna_visao_do_produto(self):
+        """Testa que o produto armazenado é uma visão sobre as colunas"""
+        catalogo = CatalogoColunar()
+        produto = catalogo.adicionar(Produto(1, "Notebook", 3000.0, 5))
+
+        assert isinstance(produto, ProdutoColunar)
+        assert produto.id == 1
+        assert produto.nome == "Notebook"
+        assert produto.preco == 3000.0
+        assert produto.estoque == 5
+
+    def test_visao_escreve_nas_colunas(self):
+        """Testa que alterações pela visão aparecem em novas buscas"""
+        catalogo = criar_catalogo()
+
+        catalogo[1].definir_estoque(7)
+        catalogo[1].preco = 2800.0
+
+        assert catalogo.get(1).estoque == 7
+        assert catalogo.get(1).preco == 2800.0
+
+    def test_reduzir_estoque_pela_visao(self):
+        """Testa a regra de redução de estoque do Produto sobre a visão"""
+        catalogo = criar_catalogo()
+
+        assert catalogo[1].reduzir_estoque(2) is True
+        assert catalogo[1].reduzir_estoque(1) is False
+        assert catalogo[1].estoque == 0
+
+    def test_visoes_do_mesmo_produto_sao_iguais(self):
+        """Testa a igualdade entre duas visões do mesmo produto"""
+        catalogo = criar_catalogo()
+        assert catalogo[1] == catalogo.get(1)
+        assert catalogo[1] != catalogo[2]
+
+    def test_remover_produto(self):
+        """Testa a remoção de um produto do catálogo colunar"""
+        catalogo = criar_catalogo()
+        del catalogo[1]
+
+        assert 1 not in catalogo
+        assert catalogo.get(1) is None
+        assert len(catalogo) == 2
+
+    def test_adicionar_linhas_com_id_repetido(self):
+        """Testa que ids repetidos no lote são rejeitados"""
+        catalogo = criar_catalogo()
+        with pytest.raises(ValueError):
+            catalogo.adicionar_linhas([(1, "Outro", 1.0, 1)])
+
+    def test_reajustar_precos(self):
+        """Testa o reajuste de preços de todo o catálogo"""
+        catalogo = criar_catalogo()
+        catalogo.reajustar_precos(10)
+
+        assert catalogo[2].preco == pytest.approx(55.0)
+        assert catalogo[3].preco == pytest.approx(165.0)
+
+    def test_valor_total_inventario(self):
+        """Testa a valoração do inventário (preço x estoque)"""
+        catalogo = criar_catalogo()
+        assert catalogo.valor_total_inventario() == pytest.approx(3000.0 * 2 + 150.0 * 10)
+
+    def test_valor_total_ignora_removidos(self):
+        """Testa que produtos removidos não entram na valoração"""
+        catalogo = criar_catalogo()
+        del catalogo[3]
+        assert catalogo.valor_total_inventario() == pytest.approx(6000.0)
+
+    def test_mascara_disponibilidade(self):
+        """Testa a máscara de disponibilidade alinhada às posições"""
+        catalogo = criar_catalogo()
+        assert list(catalogo.mascara_disponibilidade(2)) == [True, False, True]
+
+    def test_ids_disponiveis(self):
+        """Testa a lista de ids com estoque suficiente"""
+        catalogo = criar_catalogo()
+        del catalogo[3]
+        assert catalogo.ids_disponiveis() == [1]
+
+    def test_loja_com_catalogo_colunar(self):
+        """Testa a loja operando sobre o catálogo colunar"""
+        loja = Loja(CatalogoColunar())
+        produto = loja.cadastrar_produto(1, "Notebook", 3000.0)
+        produto.definir_estoque(10)
+
+        assert loja.buscar_produto(1).estoque == 10
+        assert loja.estoque.verificar_disponibilidade(1, 10) is True
+        assert loja.estoque.reservar_itens([(1, 4)]) is True
+        assert loja.estoque.buscar_produto(1).estoque == 6
+
+    def test_estoque_lista_visoes(self):
+        """Testa a listagem de produtos do estoque com catálogo colunar"""
+        estoque = Estoque(criar_catalogo())
+        assert [produto.id for produto in estoque.listar_produtos()] == [1, 2, 3]
@@ -0,0 +1,150 @@
+import pytest
+from src.loja_online import catalogo_mmap
+from src.loja_online.catalogo_mmap import CatalogoMmap
+from src.loja_online.loja import Loja
+from src.loja_online.produto import Produto
+
+
+def _publicar_exemplo(caminho):
+    loja = Loja()
+    loja.cadastrar_produto(30, "Notebook", 3000.0, 5)
+    loja.cadastrar_produto(10, "Café Orgânico ☕", 19.9, 100)
+    loja.cadastrar_produto(20, "", 0.5)
+    return loja.publicar_catalogo(caminho)
+
+
+class TestCatalogoMmap:
+    def test_busca_por_id(self, tmp_path):
+        """Testa a busca de produtos por id no catálogo mapeado"""
+        caminho = tmp_path / "catalogo.bin"
+        _publicar_exemplo(caminho)
+        catalogo = CatalogoMmap(caminho)
+
+        produto = catalogo[10]
+        assert (produto.id, produto.nome, produto.preco, produto.estoque) == (
+            10, "Café Orgânico ☕", 19.9, 100)
+        assert catalogo[20].nome == ""
+        assert catalogo.get(99) is None
+        with pytest.raises(KeyError):
+            catalogo[15]
+
+    def test_ids_ordenados_e_tamanho(self, tmp_path):
+        """Testa que o catálogo lista os ids em ordem crescente"""
+        caminho = tmp_path / "catalogo.bin"
+        _publicar_exemplo(caminho)
+        catalogo = CatalogoMmap(caminho)
+
+        assert list(catalogo) == [10, 20, 30]
+        assert len(catalogo) == 3
+        assert 30 in catalogo
+        assert 31 not in catalogo
+
+    def test_busca_com_ids_sequenciais_e_lacunas(self, tmp_path):
+        """Testa a busca em catálogos com ids sequenciais seguidos de lacunas"""
+        caminho = tmp_path / "catalogo.bin"
+        ids = list(range(1, 101)) + [150, 200]
+        catalogo_mmap.publicar([Produto(i, f"Produto {i}", float(i)) for i in ids], caminho)
+        catalogo = CatalogoMmap(caminho)
+
+        assert all(catalogo.preco(i) == float(i) for i in ids)
+        assert catalogo.preco(0) is None
+        assert catalogo.preco(101) is None
+        assert catalogo.preco(175) is None
+
+    def test_colunas_de_preco_e_estoque(self, tmp_path):
+        """Testa o acesso direto às colunas de preço e estoque"""
+        caminho = tmp_path / "catalogo.bin"
+        _publicar_exemplo(caminho)
+        catalogo = CatalogoMmap(caminho)
+
+        ids, precos, estoques = catalogo.colunas()
+        assert list(ids) == [10, 20, 30]
+        assert list(precos) == [19.9, 0.5, 3000.0]
+        assert list(estoques) == [100, 0, 5]
+        assert catalogo.preco(30) == 3000.0
+        assert catalogo.estoque(10) == 100
+        assert catalogo.preco(99) is None
+
+    def test_busca_por_nome(self, tmp_path):
+        """Testa a busca por nome no catálogo mapeado"""
+        caminho = tmp_path / "catalogo.bin"
+        _publicar_exemplo(caminho)
+        catalogo = CatalogoMmap(caminho)
+
+        assert [p.id for p in catalogo.buscar_por_nome("cafe organico")] == [10]
+        assert [p.id for p in catalogo.buscar_por_nome("notebook cafe", modo="ou")] == [10, 30]
+        assert catalogo.buscar_por_nome("inexistente") == []
+
+    def test_busca_por_faixa_de_preco(self, tmp_path):
+        """Testa a busca por preço na ordem (preço, id) gravada no arquivo"""
+        caminho = tmp_path / "catalogo.bin"
+        catalogo_mmap.publicar([Produto(i, f"Produto {i}", float(i % 5)) for i in range(1, 21)], caminho)
+        catalogo = CatalogoMmap(caminho)
+
+        assert [p.id for p in catalogo.buscar_por_preco(minimo=4)] == [4, 9, 14, 19]
+        assert [p.id for p in catalogo.buscar_por_preco(maximo=0.5)] == [5, 10, 15, 20]
+        assert [p.id for p in catalogo.buscar_por_preco(1, 2, inicio=3, limite=3)] == [16, 2, 7]
+        assert catalogo.buscar_por_preco(minimo=10) == []
+
+    def test_produto_somente_leitura(self, tmp_path):
+        """Testa que os produtos do catálogo mapeado não podem ser alterados"""
+        caminho = tmp_path / "catalogo.bin"
+        _publicar_exemplo(caminho)
+        produto = CatalogoMmap(caminho)[30]
+
+        with pytest.raises(AttributeError):
+            produto.preco = 1.0
+        with pytest.raises(AttributeError):
+            produto.reduzir_estoque(1)
+
+    def test_catalogo_vazio(self, tmp_path):
+        """Testa a publicação de um catálogo sem produtos"""
+        caminho = tmp_path / "catalogo.bin"
+        catalogo_mmap.publicar([], caminho)
+        catalogo = CatalogoMmap(caminho)
+
+        assert len(catalogo) == 0
+        assert catalogo.get(1) is None
+
+    def test_versoes_incrementais(self, tmp_path):
+        """Testa que cada publicação incrementa a versão do catálogo"""
+        caminho = tmp_path / "catalogo.bin"
+        assert _publicar_exemplo(caminho) == 1
+        assert catalogo_mmap.publicar([Produto(1, "Mouse", 50.0)], caminho) == 2
+        assert catalogo_mmap.publicar([], caminho, versao=10) == 10
+        assert catalogo_mmap.ler_versao(caminho) == 10
+
+    def test_troca_atomica_de_versao(self, tmp_path):
+        """Testa que uma nova versão publicada substitui a anterior sem afetar leitores"""
+        caminho = tmp_path / "catalogo.bin"
+        _publicar_exemplo(caminho)
+        catalogo = CatalogoMmap(caminho, intervalo_verificacao=3600)
+        antigo = catalogo[30]
+
+        catalogo_mmap.publicar([Produto(30, "Notebook", 2500.0, 4)], caminho)
+        assert catalogo.versao == 1
+        assert catalogo.atualizar()
+        assert not catalogo.atualizar()
+
+        assert catalogo.versao == 2
+        assert catalogo[30].preco == 2500.0
+        assert 10 not in catalogo
+        assert antigo.preco == 3000.0
+
+    def test_verificacao_automatica(self, tmp_path):
+        """Testa que o catálogo detecta novas versões sem chamada explícita"""
+        caminho = tmp_path / "catalogo.bin"
+        _publicar_exemplo(caminho)
+        catalogo = CatalogoMmap(caminho, intervalo_verificacao=0)
+
+        catalogo_mmap.publicar([Produto(1, "Mouse", 50.0)], caminho)
+
+        assert list(catalogo) == [1]
+
+    def test_arquivo_invalido(self, tmp_path):
+        """Testa a rejeição de arquivos que não são catálogos"""
+        caminho = tmp_path / "catalogo.bin"
+        caminho.write_bytes(b"x" * 64)
+
+        with pytest.raises(ValueError):
+            CatalogoMmap(caminho)
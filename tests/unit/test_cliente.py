@@ -65,3 +65,97 @@ class TestCliente:
         cliente.adicionar_compra(pedido2)
 
         assert cliente.obter_total_gasto() == 350.0
+
+    def test_cliente_sem_dict_por_instancia(self):
+        """Testa que o cliente usa __slots__ em vez de __dict__"""
+        cliente = Cliente(1, "Maria Edudarda", "maria@email.com")
+        assert not hasattr(cliente, "__dict__")
+
+    def test_agregados_de_compras(self):
+        """Testa os agregados mantidos a cada compra"""
+        cliente = Cliente(1, "Maria Edudarda", "maria@email.com")
+        pedido1 = Pedido(1, 1)
+        pedido1.total = 100.0
+        pedido2 = Pedido(2, 1)
+        pedido2.total = 250.0
+
+        cliente.adicionar_compra(pedido1)
+        cliente.adicionar_compra(pedido2)
+
+        assert cliente.total_gasto == 350.0
+        assert cliente.quantidade_compras == 2
+        assert cliente.ultima_compra is pedido2
+
+    def test_cancelar_compra_ajusta_agregados(self):
+        """Testa que cancelar um pedido estorna o total gasto"""
+        cliente = Cliente(1, "Maria Edudarda", "maria@email.com")
+        pedido1 = Pedido(1, 1)
+        pedido1.total = 100.0
+        pedido2 = Pedido(2, 1)
+        pedido2.total = 250.0
+        cliente.adicionar_compra(pedido1)
+        cliente.adicionar_compra(pedido2)
+
+        pedido2.cancelar_pedido()
+        pedido2.cancelar_pedido()
+
+        assert cliente.obter_total_gasto() == 100.0
+        assert cliente.quantidade_compras == 1
+        assert cliente.ultima_compra is pedido1
+        assert len(cliente.historico) == 2
+
+    def test_cancelar_compra_alterada_depois(self):
+        """Testa que o estorno usa o valor somado na compra, não o total atual do pedido"""
+        cliente = Cliente(1, "Maria Edudarda", "maria@email.com")
+        pedido1 = Pedido(1, 1)
+        pedido1.total = 250.0
+        pedido2 = Pedido(2, 1)
+        pedido2.adicionar_item(Produto(1, "Mouse", 100.0), 1)
+        cliente.adicionar_compra(pedido1)
+        cliente.adicionar_compra(pedido2)
+
+        pedido2.adicionar_item(Produto(2, "Monitor", 500.0), 1)
+        pedido2.cancelar_pedido()
+
+        assert cliente.obter_total_gasto() == 250.0
+        assert cliente.quantidade_compras == 1
+
+    def test_cancelar_todas_as_compras(self):
+        """Testa os agregados quando todas as compras são canceladas"""
+        cliente = Cliente(1, "Maria Edudarda", "maria@email.com")
+        pedido = Pedido(1, 1)
+        pedido.total = 0.1
+        cliente.adicionar_compra(pedido)
+
+        pedido.cancelar_pedido()
+
+        assert cliente.obter_total_gasto() == 0
+        assert cliente.quantidade_compras == 0
+        assert cliente.ultima_compra is None
+
+    def test_adicionar_compra_cancelada(self):
+        """Testa que um pedido já cancelado não entra no total gasto"""
+        cliente = Cliente(1, "Maria Edudarda", "maria@email.com")
+        pedido = Pedido(1, 1)
+        pedido.total = 100.0
+        pedido.cancelar_pedido()
+
+        cliente.adicionar_compra(pedido)
+
+        assert cliente.obter_total_gasto() == 0
+        assert len(cliente.historico) == 1
+
+    def test_adicionar_compra_de_outro_tipo(self):
+        """Testa que qualquer objeto com id, total e status é aceito como compra"""
+        class Compra:
+            def __init__(self, id, total):
+                self.id = id
+                self.total = total
+                self.status = "confirmado"
+
+        cliente = Cliente(1, "Maria Edudarda", "maria@email.com")
+        compra = Compra(1, 80.0)
+
+        cliente.adicionar_compra(compra)
+        assert cliente.obter_historico() == [compra]
+        assert cliente.obter_total_gasto() == 80.0
@@ -0,0 +1,170 @@
+import asyncio
+import time
+
+import pytest
+from src.loja_online.carrinho import Carrinho
+from src.loja_online.despacho_entregas import DespachoEntregas, regiao_cep
+from src.loja_online.entrega import Entrega
+from src.loja_online.gateway_pagamento import GatewaySimulado
+from src.loja_online.loja import Loja
+from src.loja_online.loja_assincrona import LojaAssincrona
+from src.loja_online.registro_entregas import RegistroEntregas
+from src.loja_online.transportadora import TransportadoraSimulada
+
+
+class TransportadoraRegistrada(TransportadoraSimulada):
+    def __init__(self, falhas=0):
+        super().__init__()
+        self.lotes = []
+        self.falhas = falhas
+
+    def despachar(self, regiao, entregas):
+        if self.falhas:
+            self.falhas -= 1
+            raise ConnectionError("Transportadora indisponível")
+        super().despachar(regiao, entregas)
+        self.lotes.append((regiao, [entrega.id for entrega in entregas]))
+
+
+def _entrega(id, cep):
+    return Entrega(id, id, f"Rua {id}, {id} - CEP {cep}")
+
+
+class TestRegiaoCep:
+    def test_prefixo_do_cep(self):
+        """Testa a região derivada do prefixo do CEP, com ou sem hífen"""
+        assert regiao_cep("Av. Paulista, 1000 - 01310-100") == "013"
+        assert regiao_cep("Rua B, 2, 20040020, Rio") == "200"
+        assert regiao_cep("Rua C, 3 - 01310-100", digitos=5) == "01310"
+
+    def test_endereco_sem_cep(self):
+        """Testa que endereços sem CEP ficam na região None"""
+        assert regiao_cep("Rua A, 123") is None
+
+
+def _aguardar(condicao, limite=5.0):
+    prazo = time.monotonic() + limite
+    while not condicao():
+        assert time.monotonic() < prazo
+        time.sleep(0.005)
+
+
+class TestDespachoEntregas:
+    def test_despacho_por_tamanho_de_lote(self):
+        """Testa que um grupo sai em uma chamada ao atingir o tamanho do lote"""
+        transportadora = TransportadoraRegistrada()
+        with DespachoEntregas(transportadora, tamanho_lote=3, intervalo=3600) as despacho:
+            despacho.adicionar_varias(
+                [_entrega(1, "01310-100"), _entrega(2, "20040-020"),
+                 _entrega(3, "01311-000"), _entrega(4, "01399-999")])
+            _aguardar(lambda: despacho.despachadas == 3)
+
+            assert transportadora.lotes == [("013", [1, 3, 4])]
+            assert len(despacho) == 1
+            assert despacho.registro.contagens() == {"preparando": 1, "em_transito": 3, "entregue": 0}
+
+    def test_despacho_por_prazo(self):
+        """Testa que grupos vencidos saem sozinhos, sem novas chamadas ao despacho"""
+        transportadora = TransportadoraRegistrada()
+        with DespachoEntregas(transportadora, tamanho_lote=100, intervalo=0.05) as despacho:
+            despacho.adicionar(_entrega(1, "01310-100"))
+            despacho.adicionar(_entrega(2, "20040-020"))
+            assert transportadora.chamadas == 0
+
+            _aguardar(lambda: despacho.despachadas == 2)
+            assert sorted(transportadora.lotes) == [("013", [1]), ("200", [2])]
+            assert len(despacho) == 0
+
+    def test_despachar_todos(self):
+        """Testa que despachar_todos antecipa os grupos pendentes e espera o envio"""
+        transportadora = TransportadoraRegistrada()
+        entregas = [_entrega(1, "01310-100"), Entrega(2, 2, "Rua sem CEP")]
+
+        with DespachoEntregas(transportadora, intervalo=3600) as despacho:
+            despacho.adicionar_varias(entregas)
+            assert transportadora.chamadas == 0
+            despacho.despachar_todos()
+
+            assert transportadora.lotes == [("013", [1]), (None, [2])]
+            assert all(entrega.status == "em_transito" for entrega in entregas)
+            assert len(despacho) == 0
+
+    def test_fechar_despacha_pendentes(self):
+        """Testa que fechar o despacho envia os grupos pendentes e recusa novas entregas"""
+        transportadora = TransportadoraRegistrada()
+        despacho = DespachoEntregas(transportadora, intervalo=3600)
+        despacho.adicionar(_entrega(1, "01310-100"))
+        despacho.fechar()
+
+        assert transportadora.lotes == [("013", [1])]
+        with pytest.raises(RuntimeError):
+            despacho.adicionar(_entrega(2, "01310-100"))
+
+    def test_usa_registro_existente(self):
+        """Testa que o despacho move as entregas no registro informado"""
+        registro = RegistroEntregas()
+        entrega = registro.adicionar(_entrega(1, "01310-100"))
+        with DespachoEntregas(TransportadoraSimulada(), registro, tamanho_lote=1) as despacho:
+            despacho.adicionar(entrega)
+            _aguardar(lambda: despacho.despachadas == 1)
+
+        assert registro.listar("em_transito") == [entrega]
+
+    def test_rejeita_entrega_fora_de_preparacao(self):
+        """Testa que apenas entregas em preparação entram no despacho"""
+        entrega = _entrega(1, "01310-100")
+        entrega.iniciar_entrega()
+
+        with DespachoEntregas(TransportadoraSimulada()) as despacho:
+            with pytest.raises(ValueError):
+                despacho.adicionar(entrega)
+
+    def test_falha_da_transportadora_devolve_grupo(self):
+        """Testa que um grupo não despachado volta para a fila e sai na nova tentativa"""
+        transportadora = TransportadoraRegistrada(falhas=1)
+        with DespachoEntregas(transportadora, tamanho_lote=2, intervalo=0.05) as despacho:
+            despacho.adicionar(_entrega(1, "01310-100"))
+            despacho.adicionar(_entrega(2, "01310-100"))
+            _aguardar(lambda: despacho.falhas == 1)
+            assert isinstance(despacho.ultimo_erro, ConnectionError)
+            assert despacho.registro.contar("preparando") == 2
+
+            _aguardar(lambda: despacho.despachadas == 2)
+            assert transportadora.lotes == [("013", [1, 2])]
+
+    def test_checkout_nao_espera_a_transportadora(self):
+        """Testa o despacho como agendador do checkout, sem latência nem erros da transportadora"""
+        loja = Loja()
+        produto = loja.cadastrar_produto(1, "Mouse", 50.0, 10)
+        loja.cadastrar_cliente(1, "João", "joao@email.com")
+        transportadora = TransportadoraRegistrada(falhas=1)
+        transportadora.latencia = 0.2
+
+        with DespachoEntregas(transportadora, loja.entregas, tamanho_lote=2, intervalo=0.01) as despacho:
+            inicio = time.monotonic()
+            for _ in range(2):
+                carrinho = Carrinho()
+                carrinho.adicionar_produto(produto, 1)
+                loja.finalizar_compra(1, carrinho, "Rua A, 1 - 01310-100", GatewaySimulado(),
+                                      agendar_entrega=despacho.adicionar)
+            assert time.monotonic() - inicio < 0.2
+
+            _aguardar(lambda: loja.entregas.contar("em_transito") == 2)
+        assert despacho.falhas == 1
+
+    def test_agendamento_assincrono(self):
+        """Testa o despacho como agendador do checkout assíncrono"""
+        loja = Loja()
+        produto = loja.cadastrar_produto(1, "Mouse", 50.0, 10)
+        loja.cadastrar_cliente(1, "João", "joao@email.com")
+
+        with DespachoEntregas(TransportadoraSimulada(), loja.entregas, intervalo=3600) as despacho:
+            loja_assincrona = LojaAssincrona(loja, GatewaySimulado(),
+                                             agendar_entrega=despacho.adicionar_async)
+            carrinho = Carrinho()
+            carrinho.adicionar_produto(produto, 1)
+            _, _, entrega = asyncio.run(
+                loja_assincrona.finalizar_compra(1, carrinho, "Rua A, 1 - 01310-100"))
+            assert len(despacho) == 1
+
+        assert entrega.status == "em_transito"
@@ -0,0 +1,239 @@
+import pytest
+import threading
+from src.loja_online import diario, snapshot
+from src.loja_online.diario import Diario
+from src.loja_online.loja import Loja
+from src.loja_online.produto import Produto
+
+
+def _movimentar(loja):
+    loja.cadastrar_produto(1, "Notebook", 3000.0, 10)
+    loja.cadastrar_produtos_em_lote([(2, "Mouse", 50.0, 20), (3, "Teclado", 150.0, 5)])
+    cliente = loja.cadastrar_cliente(1, "Maria Eduarda", "maria@email.com")
+    pedido = loja.criar_pedido(1)
+    pedido.adicionar_item(loja.buscar_produto(1), 1)
+    pedido.adicionar_item(loja.buscar_produto(2), 2)
+    loja.estoque.reservar_itens([(1, 1), (2, 2)])
+    pedido.confirmar_pedido()
+    cliente.adicionar_compra(pedido)
+    loja.estoque.alterar_preco(3, 120.0)
+    loja.estoque.definir_estoque(3, 7)
+    return pedido
+
+
+class TestDiario:
+    def test_registrar_e_ler(self, tmp_path):
+        """Testa que os registros gravados são lidos na mesma ordem"""
+        caminho = tmp_path / "loja.diario"
+        registro = Diario(caminho)
+        registro.registrar("reservar", 1, 2)
+        registro.registrar("cadastrar_cliente", 1, "Maria", "maria@email.com")
+        registro.fechar()
+
+        geracao, registros = diario.ler(caminho)
+
+        assert geracao == 1
+        assert registros == [["reservar", 1, 2], ["cadastrar_cliente", 1, "Maria", "maria@email.com"]]
+
+    def test_politica_invalida(self, tmp_path):
+        """Testa o erro com uma política de fsync desconhecida"""
+        with pytest.raises(ValueError):
+            Diario(tmp_path / "loja.diario", politica="as_vezes")
+
+    @pytest.mark.parametrize("politica", ["sempre", "intervalo", "nunca"])
+    def test_politicas_gravam_ao_fechar(self, tmp_path, politica):
+        """Testa que todas as políticas persistem os registros ao fechar"""
+        caminho = tmp_path / "loja.diario"
+        registro = Diario(caminho, politica=politica, intervalo=0.001)
+        for i in range(2000):
+            registro.registrar("liberar", i, 1)
+        registro.fechar()
+
+        assert len(diario.ler(caminho)[1]) == 2000
+
+    def test_nunca_entrega_registros_ao_sistema(self, tmp_path):
+        """Testa que "nunca" dispensa só o fsync: os registros chegam ao arquivo sem fechar o diário"""
+        caminho = tmp_path / "loja.diario"
+        loja = Loja()
+        loja.ativar_diario(Diario(caminho, politica="nunca"))
+        for i in range(500):
+            loja.cadastrar_produto(i + 1, f"Produto {i + 1}", 10.0, 1)
+
+        # Lido por outro descritor, como após a queda do processo
+        recuperada = Loja.recuperar(caminho)
+
+        assert len(recuperada.produtos) == 500
+        recuperada.diario.fechar()
+        loja.diario.fechar()
+
+    def test_descarta_registro_incompleto(self, tmp_path):
+        """Testa que um registro final truncado é descartado ao reabrir"""
+        caminho = tmp_path / "loja.diario"
+        registro = Diario(caminho)
+        registro.registrar("reservar", 1, 1)
+        registro.registrar("reservar", 2, 1)
+        registro.fechar()
+        with open(caminho, "r+b") as arquivo:
+            arquivo.truncate(caminho.stat().st_size - 3)
+
+        registro = Diario(caminho)
+        registro.registrar("reservar", 3, 1)
+        registro.fechar()
+
+        assert diario.ler(caminho)[1] == [["reservar", 1, 1], ["reservar", 3, 1]]
+
+    def test_commit_em_grupo_com_varias_threads(self, tmp_path):
+        """Testa que escritores concorrentes não perdem registros"""
+        caminho = tmp_path / "loja.diario"
+        registro = Diario(caminho)
+
+        def registrar(indice):
+            for i in range(200):
+                registro.registrar("liberar", indice, i)
+
+        threads = [threading.Thread(target=registrar, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        registro.fechar()
+
+        registros = diario.ler(caminho)[1]
+        assert len(registros) == 8 * 200
+        for indice in range(8):
+            assert [r[2] for r in registros if r[1] == indice] == list(range(200))
+
+
+class TestRecuperacao:
+    def test_recuperar_apenas_do_diario(self, tmp_path):
+        """Testa a reconstrução da loja repetindo o diário"""
+        caminho = tmp_path / "loja.diario"
+        loja = Loja.recuperar(caminho)
+        _movimentar(loja)
+        loja.diario.fechar()
+
+        recuperada = Loja.recuperar(caminho)
+
+        assert recuperada.buscar_produto(1).estoque == 9
+        assert recuperada.buscar_produto(2).estoque == 18
+        assert recuperada.buscar_produto(3).preco == 120.0
+        assert recuperada.buscar_produto(3).estoque == 7
+        assert recuperada.pedidos[1].status == "confirmado"
+        assert recuperada.pedidos[1].total == 3100.0
+        assert recuperada.buscar_cliente(1).obter_total_gasto() == 3100.0
+        assert recuperada.criar_pedido(1).id == 2
+        recuperada.diario.fechar()
+
+    def test_cancelamento_apos_recuperar_continua_no_diario(self, tmp_path):
+        """Testa que pedidos recuperados continuam registrando mutações"""
+        caminho = tmp_path / "loja.diario"
+        loja = Loja.recuperar(caminho)
+        _movimentar(loja)
+        loja.diario.fechar()
+
+        recuperada = Loja.recuperar(caminho)
+        recuperada.pedidos[1].cancelar_pedido()
+        recuperada.diario.fechar()
+
+        final = Loja.recuperar(caminho)
+        assert final.pedidos[1].status == "cancelado"
+        assert final.buscar_cliente(1).obter_total_gasto() == 0
+        final.diario.fechar()
+
+    def test_checkpoint_com_snapshot(self, tmp_path):
+        """Testa a recuperação a partir do snapshot mais o diário posterior"""
+        caminho_diario = tmp_path / "loja.diario"
+        caminho_snapshot = tmp_path / "loja.snap"
+        loja = Loja.recuperar(caminho_diario, caminho_snapshot)
+        _movimentar(loja)
+        loja.checkpoint(caminho_snapshot)
+        loja.estoque.reservar(2, 3)
+        loja.diario.fechar()
+
+        geracao, registros = diario.ler(caminho_diario)
+        recuperada = Loja.recuperar(caminho_diario, caminho_snapshot)
+
+        assert geracao == 2
+        assert registros == [["reservar", 2, 3]]
+        assert recuperada.buscar_produto(2).estoque == 15
+        assert recuperada.buscar_produto(1).estoque == 9
+        recuperada.diario.fechar()
+
+    def test_queda_entre_snapshot_e_novo_diario(self, tmp_path):
+        """Testa que o diário já incluído no snapshot não é repetido"""
+        caminho_diario = tmp_path / "loja.diario"
+        caminho_snapshot = tmp_path / "loja.snap"
+        loja = Loja.recuperar(caminho_diario, caminho_snapshot)
+        _movimentar(loja)
+        loja.diario.sincronizar()
+        # Snapshot gravado, mas o diário ainda não foi trocado
+        snapshot.salvar(loja, caminho_snapshot, loja.diario.geracao)
+        loja.diario.fechar()
+
+        recuperada = Loja.recuperar(caminho_diario, caminho_snapshot)
+        recuperada.estoque.reservar(1, 1)
+        recuperada.diario.fechar()
+        final = Loja.recuperar(caminho_diario, caminho_snapshot)
+
+        assert recuperada.buscar_produto(1).estoque == 8
+        assert final.buscar_produto(1).estoque == 8
+        final.diario.fechar()
+
+    def test_checkpoint_bloqueia_mutacoes(self, tmp_path):
+        """Testa que uma mutação durante o checkpoint não é reproduzida duas vezes"""
+        caminho_diario = tmp_path / "loja.diario"
+        caminho_snapshot = tmp_path / "loja.snap"
+        loja = Loja.recuperar(caminho_diario, caminho_snapshot)
+        _movimentar(loja)
+        concluida = threading.Event()
+
+        def reservar():
+            loja.estoque.reservar(2, 3)
+            concluida.set()
+
+        def salvar(geracao):
+            mutacao.start()
+            assert not concluida.wait(0.1)
+            snapshot.salvar(loja, caminho_snapshot, geracao)
+
+        mutacao = threading.Thread(target=reservar)
+        loja.diario.checkpoint(salvar)
+        mutacao.join()
+        loja.diario.fechar()
+
+        geracao, registros = diario.ler(caminho_diario)
+        recuperada = Loja.recuperar(caminho_diario, caminho_snapshot)
+
+        assert registros == [["reservar", 2, 3]]
+        assert recuperada.buscar_produto(2).estoque == 15
+        recuperada.diario.fechar()
+
+    def test_recuperar_substituicao_de_produto_em_lote(self, tmp_path):
+        """Testa a recuperação de um cadastro em lote que substitui um produto existente"""
+        caminho = tmp_path / "loja.diario"
+        loja = Loja.recuperar(caminho)
+        loja.cadastrar_produto(1, "Notebook", 3000.0, 5)
+        loja.estoque.adicionar_produtos([Produto(1, "Notebook Pro", 4000.0, 2), Produto(2, "Mouse", 50.0, 9)])
+        loja.diario.fechar()
+
+        recuperada = Loja.recuperar(caminho)
+
+        assert recuperada.buscar_produto(1).nome == "Notebook Pro"
+        assert recuperada.buscar_produto(1).estoque == 2
+        assert recuperada.buscar_produto(2).preco == 50.0
+        recuperada.diario.fechar()
+
+    def test_compra_registrada_pelo_cliente(self, tmp_path):
+        """Testa que a compra é registrada pelo diário do cliente, não do pedido"""
+        caminho = tmp_path / "loja.diario"
+        loja = Loja.recuperar(caminho)
+        cliente = loja.cadastrar_cliente(1, "Maria Eduarda", "maria@email.com")
+        pedido = loja.criar_pedido(1)
+        pedido._diario = None
+        cliente.adicionar_compra(pedido)
+        loja.diario.fechar()
+
+        recuperada = Loja.recuperar(caminho)
+
+        assert recuperada.buscar_cliente(1).obter_historico() == [recuperada.pedidos[1]]
+        recuperada.diario.fechar()
@@ -1,5 +1,6 @@
 import pytest
 from src.loja_online.entrega import Entrega
+from src.loja_online.registro_entregas import RegistroEntregas
 
 
 class TestEntrega:
@@ -52,3 +53,18 @@ class TestEntrega:
 
         entrega.confirmar_entrega()
         assert entrega.status == "entregue"
+
+    def test_entrega_sem_dict_por_instancia(self):
+        """Testa que a entrega usa __slots__ em vez de __dict__"""
+        entrega = Entrega(1, 10, "Rua A, 123")
+        assert not hasattr(entrega, "__dict__")
+
+    def test_entrega_registrada_atualiza_registro(self):
+        """Testa que a transição de uma entrega registrada atualiza o registro"""
+        registro = RegistroEntregas()
+        entrega = registro.adicionar(Entrega(1, 10, "Rua A, 123"))
+        entrega.iniciar_entrega()
+
+        assert entrega.status == "em_transito"
+        assert registro.contar("em_transito") == 1
+        assert registro.contar("preparando") == 0
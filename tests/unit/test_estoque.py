@@ -1,4 +1,5 @@
 import pytest
+from src.loja_online.catalogo import Catalogo
 from src.loja_online.estoque import Estoque
 from src.loja_online.produto import Produto
 
@@ -90,3 +91,193 @@ class TestEstoque:
         estoque = Estoque()
         disponivel = estoque.verificar_disponibilidade(999, 1)
         assert disponivel is False
+
+    def test_reservar_com_estoque_suficiente(self):
+        """Testa a reserva de unidades com estoque suficiente"""
+        estoque = Estoque()
+        produto = Produto(1, "Notebook", 3000.0)
+        produto.definir_estoque(10)
+
+        estoque.adicionar_produto(produto)
+
+        assert estoque.reservar(1, 4) is True
+        assert produto.estoque == 6
+
+    def test_reservar_com_estoque_insuficiente(self):
+        """Testa que a reserva falha sem alterar o estoque quando não há unidades"""
+        estoque = Estoque()
+        produto = Produto(1, "Notebook", 3000.0)
+        produto.definir_estoque(3)
+
+        estoque.adicionar_produto(produto)
+
+        assert estoque.reservar(1, 5) is False
+        assert produto.estoque == 3
+
+    def test_reservar_produto_inexistente(self):
+        """Testa a reserva de um produto que não existe"""
+        estoque = Estoque()
+        assert estoque.reservar(999, 1) is False
+
+    def test_liberar(self):
+        """Testa a devolução de unidades reservadas ao estoque"""
+        estoque = Estoque()
+        produto = Produto(1, "Notebook", 3000.0)
+        produto.definir_estoque(10)
+
+        estoque.adicionar_produto(produto)
+        estoque.reservar(1, 4)
+        estoque.liberar(1, 4)
+
+        assert produto.estoque == 10
+
+    def test_reservar_concorrente_sem_venda_excedente(self):
+        """Testa que reservas concorrentes nunca vendem além do estoque"""
+        import sys
+        from concurrent.futures import ThreadPoolExecutor
+
+        estoque = Estoque()
+        produto = Produto(1, "Notebook", 3000.0)
+        produto.definir_estoque(100)
+        estoque.adicionar_produto(produto)
+
+        intervalo_original = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                resultados = list(executor.map(lambda _: estoque.reservar(1, 1), range(500)))
+        finally:
+            sys.setswitchinterval(intervalo_original)
+
+        assert sum(resultados) == 100
+        assert produto.estoque == 0
+
+    def test_reservar_itens_com_sucesso(self):
+        """Testa a reserva atômica de todos os itens de um pedido"""
+        estoque = Estoque()
+        notebook = Produto(1, "Notebook", 3000.0)
+        notebook.definir_estoque(5)
+        mouse = Produto(2, "Mouse", 50.0)
+        mouse.definir_estoque(10)
+        estoque.adicionar_produto(notebook)
+        estoque.adicionar_produto(mouse)
+
+        assert estoque.reservar_itens([(1, 2), (2, 3)]) is True
+        assert notebook.estoque == 3
+        assert mouse.estoque == 7
+
+    def test_reservar_itens_sem_estoque_nao_altera_nada(self):
+        """Testa que a falta de um item não reserva nenhum dos outros"""
+        estoque = Estoque()
+        notebook = Produto(1, "Notebook", 3000.0)
+        notebook.definir_estoque(5)
+        mouse = Produto(2, "Mouse", 50.0)
+        mouse.definir_estoque(1)
+        estoque.adicionar_produto(notebook)
+        estoque.adicionar_produto(mouse)
+
+        assert estoque.reservar_itens([(1, 2), (2, 3)]) is False
+        assert notebook.estoque == 5
+        assert mouse.estoque == 1
+
+    def test_reservar_itens_produto_inexistente(self):
+        """Testa que um item inexistente cancela a reserva inteira"""
+        estoque = Estoque()
+        notebook = Produto(1, "Notebook", 3000.0)
+        notebook.definir_estoque(5)
+        estoque.adicionar_produto(notebook)
+
+        assert estoque.reservar_itens([(1, 1), (999, 1)]) is False
+        assert notebook.estoque == 5
+
+    def test_reservar_itens_agrupa_produto_repetido(self):
+        """Testa que linhas repetidas do mesmo produto somam a quantidade"""
+        estoque = Estoque()
+        notebook = Produto(1, "Notebook", 3000.0)
+        notebook.definir_estoque(3)
+        estoque.adicionar_produto(notebook)
+
+        assert estoque.reservar_itens([(1, 2), (1, 2)]) is False
+        assert notebook.estoque == 3
+        assert estoque.reservar_itens([(1, 1), (1, 2)]) is True
+        assert notebook.estoque == 0
+
+    @pytest.mark.parametrize("quantidade", [0, -7])
+    def test_reservar_quantidade_invalida(self, quantidade):
+        """Testa que quantidades nulas ou negativas são recusadas sem alterar o estoque"""
+        estoque = Estoque()
+        notebook = Produto(1, "Notebook", 3000.0)
+        notebook.definir_estoque(3)
+        estoque.adicionar_produto(notebook)
+
+        with pytest.raises(ValueError):
+            estoque.reservar(1, quantidade)
+        with pytest.raises(ValueError):
+            estoque.reservar_itens([(1, 1), (1, quantidade)])
+        assert notebook.estoque == 3
+
+    def test_liberar_itens(self):
+        """Testa a devolução de todos os itens de uma reserva"""
+        estoque = Estoque()
+        notebook = Produto(1, "Notebook", 3000.0)
+        notebook.definir_estoque(5)
+        estoque.adicionar_produto(notebook)
+
+        estoque.reservar_itens([(1, 2)])
+        estoque.liberar_itens([(1, 2)])
+
+        assert notebook.estoque == 5
+
+    def test_criar_estoque_com_catalogo_existente(self):
+        """Testa que o estoque usa o catálogo recebido em vez de criar outro"""
+        catalogo = Catalogo()
+        estoque = Estoque(catalogo)
+        produto = Produto(1, "Notebook", 3000.0)
+
+        estoque.adicionar_produto(produto)
+
+        assert estoque.produtos is catalogo
+        assert catalogo[1] is produto
+
+    def test_adicionar_produtos_em_lote(self):
+        """Testa a adição de vários produtos de uma só vez"""
+        estoque = Estoque()
+        produtos = [Produto(i, f"Produto {i}", 10.0) for i in range(1, 4)]
+
+        estoque.adicionar_produtos(produtos)
+
+        assert len(estoque.produtos) == 3
+        assert estoque.buscar_produto(2) is produtos[1]
+
+    def test_buscar_por_preco_acompanha_alteracao_de_preco(self):
+        """Testa que o índice de preços acompanha alterações de preço"""
+        estoque = Estoque()
+        for produto_id, preco in [(1, 3000.0), (2, 50.0), (3, 150.0)]:
+            estoque.adicionar_produto(Produto(produto_id, f"Produto {produto_id}", preco))
+
+        assert [p.id for p in estoque.mais_baratos(2)] == [2, 3]
+
+        assert estoque.alterar_preco(1, 10.0) is True
+        estoque.adicionar_produto(Produto(4, "Produto 4", 100.0))
+        estoque.remover_produto(2)
+
+        assert [p.id for p in estoque.buscar_por_preco(0, 200)] == [1, 4, 3]
+        assert [p.id for p in estoque.mais_caros(1)] == [3]
+        assert estoque.buscar_produto(1).preco == 10.0
+
+    def test_alterar_preco_produto_inexistente(self):
+        """Testa a alteração de preço de um produto inexistente"""
+        estoque = Estoque()
+        assert estoque.alterar_preco(999, 10.0) is False
+
+    def test_reajustar_precos_reconstroi_indice(self):
+        """Testa que o reajuste geral mantém a busca por preço correta"""
+        estoque = Estoque()
+        estoque.adicionar_produto(Produto(1, "Notebook", 100.0))
+        estoque.adicionar_produto(Produto(2, "Mouse", 200.0))
+        estoque.buscar_por_preco()
+
+        estoque.reajustar_precos(50)
+
+        assert estoque.buscar_produto(1).preco == 150.0
+        assert [p.id for p in estoque.buscar_por_preco(160, 400)] == [2]
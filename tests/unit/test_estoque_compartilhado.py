@@ -0,0 +1,171 @@
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.loja_online.estoque_compartilhado import CatalogoCompartilhado, MemoriaEstoque
+from src.loja_online.loja import Loja
+
+
+@pytest.fixture
+def memoria(tmp_path):
+    memoria = MemoriaEstoque(f"loja_{uuid.uuid4().hex[:12]}", capacidade=16,
+                             caminho_travas=str(tmp_path / "estoque.travas"))
+    yield memoria
+    memoria.remover()
+
+
+def _anexar(memoria):
+    return MemoriaEstoque(memoria.nome, caminho_travas=memoria.travas.caminho)
+
+
+def _reservar_em_processo(nome, caminho_travas, tentativas):
+    memoria = MemoriaEstoque(nome, caminho_travas=caminho_travas)
+    loja = Loja(CatalogoCompartilhado(memoria))
+    loja.cadastrar_produto(1, "Notebook", 3000.0)
+    vendidos = sum(1 for _ in range(tentativas) if loja.estoque.reservar(1, 1))
+    memoria.fechar()
+    return vendidos
+
+
+def _reservar_itens_em_threads(nome, caminho_travas, threads, tentativas):
+    memoria = MemoriaEstoque(nome, caminho_travas=caminho_travas)
+    loja = Loja(CatalogoCompartilhado(memoria))
+    loja.cadastrar_produtos_em_lote([(1, "Notebook", 3000.0, 0), (2, "Mouse", 50.0, 0)])
+
+    def reservar(thread):
+        # Ordens alternadas forçam threads do mesmo processo a disputar as duas listras
+        itens = [(1, 1), (2, 1)] if thread % 2 else [(2, 1), (1, 1)]
+        return sum(1 for _ in range(tentativas) if loja.estoque.reservar_itens(itens))
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        vendidos = sum(executor.map(reservar, range(threads)))
+    memoria.fechar()
+    return vendidos
+
+
+class TestEstoqueCompartilhado:
+    def test_reduzir_estoque(self, memoria):
+        """Testa a redução do estoque guardado na memória compartilhada"""
+        loja = Loja(CatalogoCompartilhado(memoria))
+        produto = loja.cadastrar_produto(1, "Notebook", 3000.0, 3)
+
+        assert produto.reduzir_estoque(2)
+        assert not produto.reduzir_estoque(2)
+        assert produto.estoque == 1
+
+    def test_estoque_visivel_entre_instancias(self, memoria):
+        """Testa que alterações de uma loja aparecem na outra que usa o mesmo segmento"""
+        loja = Loja(CatalogoCompartilhado(memoria))
+        loja.cadastrar_produto(1, "Notebook", 3000.0, 5)
+        outra_memoria = _anexar(memoria)
+        outra = Loja(CatalogoCompartilhado(outra_memoria))
+        outra.cadastrar_produto(1, "Notebook", 3000.0, 100)
+
+        assert outra.buscar_produto(1).estoque == 5
+        assert loja.estoque.reservar(1, 4)
+        assert outra.estoque.verificar_disponibilidade(1, 1)
+        assert not outra.estoque.verificar_disponibilidade(1, 2)
+        outra_memoria.fechar()
+
+    def test_produto_registrado_por_outro_processo(self, memoria):
+        """Testa que um produto registrado em outra instância é localizado por id"""
+        Loja(CatalogoCompartilhado(memoria)).cadastrar_produtos_em_lote(
+            [(1, "Notebook", 3000.0, 5), (2, "Mouse", 50.0, 7)])
+        outra_memoria = _anexar(memoria)
+
+        assert len(outra_memoria) == 2
+        assert outra_memoria.valor(outra_memoria.posicao(2)) == 7
+        assert outra_memoria.posicao(3) is None
+        outra_memoria.fechar()
+
+    def test_reservar_itens_tudo_ou_nada(self, memoria):
+        """Testa que a reserva de vários itens não reduz nada quando falta estoque"""
+        loja = Loja(CatalogoCompartilhado(memoria))
+        loja.cadastrar_produtos_em_lote([(1, "Notebook", 3000.0, 5), (2, "Mouse", 50.0, 1)])
+
+        assert not loja.estoque.reservar_itens([(1, 2), (2, 2)])
+        assert loja.estoque.reservar_itens([(1, 2), (2, 1)])
+        assert [loja.buscar_produto(i).estoque for i in (1, 2)] == [3, 0]
+
+    def test_remover_produto_zera_contador(self, memoria):
+        """Testa que remover o produto zera o contador compartilhado"""
+        loja = Loja(CatalogoCompartilhado(memoria))
+        loja.cadastrar_produto(1, "Notebook", 3000.0, 5)
+        loja.estoque.remover_produto(1)
+
+        assert loja.buscar_produto(1) is None
+        assert memoria.valor(memoria.posicao(1)) == 0
+
+    def test_recadastrar_produto_removido(self, memoria):
+        """Testa que um produto removido volta com o estoque do novo cadastro, também em outra instância"""
+        loja = Loja(CatalogoCompartilhado(memoria))
+        loja.cadastrar_produto(1, "Notebook", 3000.0, 5)
+        loja.estoque.remover_produto(1)
+        produto = loja.cadastrar_produto(1, "Notebook", 3000.0, 50)
+
+        assert produto.estoque == 50
+        assert loja.estoque.reservar_itens([(1, 10)])
+
+        loja.estoque.remover_produto(1)
+        outra_memoria = _anexar(memoria)
+        outra = Loja(CatalogoCompartilhado(outra_memoria))
+        assert outra.cadastrar_produto(1, "Notebook", 3000.0, 7).estoque == 7
+        assert memoria.valor(memoria.posicao(1)) == 7
+        outra_memoria.fechar()
+
+    def test_recadastrar_produto_substitui_estoque(self, memoria):
+        """Testa que recadastrar um produto já cadastrado nesta instância grava o estoque informado"""
+        loja = Loja(CatalogoCompartilhado(memoria))
+        loja.cadastrar_produto(1, "Notebook", 3000.0, 5)
+
+        assert loja.cadastrar_produto(1, "Notebook", 2800.0, 9).estoque == 9
+        assert loja.buscar_produto(1).preco == 2800.0
+
+    def test_cadastro_em_lote_com_id_repetido(self, memoria):
+        """Testa que ids repetidos no lote ou já cadastrados são recusados"""
+        loja = Loja(CatalogoCompartilhado(memoria))
+        loja.cadastrar_produto(1, "Notebook", 3000.0, 5)
+
+        with pytest.raises(ValueError):
+            loja.cadastrar_produtos_em_lote([(2, "Mouse", 50.0, 1), (2, "Teclado", 150.0, 1)])
+        with pytest.raises(ValueError):
+            loja.cadastrar_produtos_em_lote([(3, "Mouse", 50.0, 1), (1, "Outro", 1.0, 1)])
+        assert len(memoria) == 1
+        assert loja.buscar_produto(1).estoque == 5
+
+    def test_capacidade_esgotada(self, memoria):
+        """Testa o erro ao registrar mais produtos que a capacidade do segmento"""
+        loja = Loja(CatalogoCompartilhado(memoria))
+        with pytest.raises(ValueError):
+            loja.cadastrar_produtos_em_lote((i, f"Produto {i}", 1.0, 1) for i in range(17))
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requer fork")
+    def test_sem_vendas_acima_do_estoque_entre_processos(self, memoria):
+        """Testa que processos concorrentes não vendem mais que o estoque"""
+        Loja(CatalogoCompartilhado(memoria)).cadastrar_produto(1, "Notebook", 3000.0, 500)
+
+        contexto = multiprocessing.get_context("fork")
+        with contexto.Pool(4) as pool:
+            vendidos = pool.starmap(_reservar_em_processo,
+                                    [(memoria.nome, memoria.travas.caminho, 300)] * 4)
+
+        assert sum(vendidos) == 500
+        assert memoria.valor(memoria.posicao(1)) == 0
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="Requer fork")
+    def test_varias_threads_por_processo(self, memoria):
+        """Testa reservas de vários itens com várias threads em cada processo"""
+        Loja(CatalogoCompartilhado(memoria)).cadastrar_produtos_em_lote(
+            [(1, "Notebook", 3000.0, 1000), (2, "Mouse", 50.0, 1000)])
+
+        contexto = multiprocessing.get_context("fork")
+        with contexto.Pool(4) as pool:
+            resultado = pool.starmap_async(_reservar_itens_em_threads,
+                                           [(memoria.nome, memoria.travas.caminho, 6, 60)] * 4)
+            vendidos = resultado.get(timeout=60)
+
+        assert sum(vendidos) == 1000
+        assert memoria.valor(memoria.posicao(1)) == 0
+        assert memoria.valor(memoria.posicao(2)) == 0
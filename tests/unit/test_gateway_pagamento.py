@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from src.loja_online.gateway_pagamento import FalhaGateway, GatewayPagamento, GatewaySimulado
+from src.loja_online.pagamento import Pagamento
+
+
+class GatewayAprovaTudo(GatewayPagamento):
+    def __init__(self):
+        self.cobrados = []
+
+    def cobrar(self, pagamento):
+        self.cobrados.append(pagamento.id)
+        return True
+
+
+class TestGatewayPagamento:
+    def test_interface_exige_cobrar(self):
+        """Testa que a interface base não implementa a cobrança"""
+        with pytest.raises(NotImplementedError):
+            GatewayPagamento().cobrar(Pagamento(1, 10.0, "cartao"))
+
+    def test_lote_padrao_usa_cobrar(self):
+        """Testa que o lote padrão cobra cada pagamento individualmente"""
+        gateway = GatewayAprovaTudo()
+        pagamentos = [Pagamento(i, 10.0, "cartao") for i in range(3)]
+
+        assert gateway.cobrar_lote(pagamentos) == [True, True, True]
+        assert gateway.cobrados == [0, 1, 2]
+
+    def test_cobranca_assincrona_padrao(self):
+        """Testa que a versão assíncrona padrão delega para cobrar()"""
+        gateway = GatewayAprovaTudo()
+        assert asyncio.run(gateway.cobrar_async(Pagamento(7, 10.0, "cartao")))
+        assert gateway.cobrados == [7]
+
+
+class TestGatewaySimulado:
+    def test_lote_em_uma_chamada(self):
+        """Testa que um lote inteiro custa uma única chamada ao gateway"""
+        gateway = GatewaySimulado()
+        resultados = gateway.cobrar_lote([Pagamento(i, 10.0, "cartao") for i in range(10)])
+
+        assert resultados == [True] * 10
+        assert gateway.chamadas == 1
+
+    def test_falhas_injetadas(self):
+        """Testa a injeção de falhas transitórias"""
+        gateway = GatewaySimulado(taxa_falhas=1.0)
+        with pytest.raises(FalhaGateway):
+            gateway.cobrar(Pagamento(1, 10.0, "cartao"))
+
+    def test_recusas_com_semente(self):
+        """Testa que a taxa de recusa é reprodutível com a mesma semente"""
+        pagamentos = [Pagamento(i, 10.0, "cartao") for i in range(200)]
+        primeira = GatewaySimulado(taxa_recusa=0.5, semente=3).cobrar_lote(pagamentos)
+        segunda = GatewaySimulado(taxa_recusa=0.5, semente=3).cobrar_lote(pagamentos)
+
+        assert primeira == segunda
+        assert 0 < primeira.count(False) < 200
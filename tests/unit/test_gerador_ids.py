@@ -0,0 +1,78 @@
+import pytest
+import os
+import threading
+from src.loja_online.gerador_ids import GeradorIds, BITS_PID, BITS_SEQUENCIA
+
+
+class TestGeradorIds:
+    def test_ids_largura_fixa_e_ordenados(self):
+        """Testa que ids consecutivos têm a mesma largura e crescem em ordem"""
+        gerador = GeradorIds()
+        ids = [gerador.gerar_id() for _ in range(1000)]
+
+        assert len(set(ids)) == 1000
+        assert {len(i) for i in ids} == {19}
+        assert ids == sorted(ids)
+
+    def test_id_contem_pid(self):
+        """Testa que o id carrega o pid do processo gerador"""
+        gerador = GeradorIds()
+        valor = int(gerador.gerar_id(), 16)
+        pid = (valor >> BITS_SEQUENCIA) & ((1 << BITS_PID) - 1)
+        assert pid == os.getpid() & ((1 << BITS_PID) - 1)
+
+    def test_gerar_ids_em_lote(self):
+        """Testa que o lote mantém unicidade e ordem além de um milissegundo"""
+        gerador = GeradorIds()
+        antes = gerador.gerar_id()
+        lote = gerador.gerar_ids(10_000)
+        depois = gerador.gerar_id()
+
+        assert len(set(lote)) == 10_000
+        assert lote == sorted(lote)
+        assert antes < lote[0] and lote[-1] < depois
+
+    def test_gerar_ids_vazio(self):
+        """Testa o lote com quantidade zero"""
+        assert GeradorIds().gerar_ids(0) == []
+
+    def test_ids_unicos_entre_threads(self):
+        """Testa a unicidade dos ids gerados por várias threads"""
+        gerador = GeradorIds()
+        resultados = [[] for _ in range(8)]
+
+        def gerar(indice):
+            resultados[indice].extend(gerador.gerar_id() for _ in range(2000))
+            resultados[indice].extend(gerador.gerar_ids(2000))
+
+        threads = [threading.Thread(target=gerar, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        ids = [i for lista in resultados for i in lista]
+        assert len(set(ids)) == len(ids) == 8 * 4000
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requer os.fork")
+    def test_reinicia_apos_fork(self):
+        """Testa que o processo filho passa a gerar ids com o próprio pid"""
+        gerador = GeradorIds()
+        gerador.gerar_id()
+        leitura, escrita = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:
+            os.close(leitura)
+            os.write(escrita, gerador.gerar_id().encode())
+            os._exit(0)
+
+        os.close(escrita)
+        id_filho = os.read(leitura, 64).decode()
+        os.close(leitura)
+        os.waitpid(pid, 0)
+
+        valor = int(id_filho, 16)
+        pid_filho = (valor >> BITS_SEQUENCIA) & ((1 << BITS_PID) - 1)
+        assert pid_filho == pid & ((1 << BITS_PID) - 1)
+        assert id_filho != gerador.gerar_id()
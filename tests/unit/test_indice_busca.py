@@ -0,0 +1,96 @@
+import pytest
+from src.loja_online.indice_busca import IndiceInvertido, tokenizar
+
+
+def criar_indice():
+    indice = IndiceInvertido()
+    indice.adicionar(1, "Notebook Gamer Preto")
+    indice.adicionar(2, "Mouse Gamer")
+    indice.adicionar(3, "Notebook")
+    indice.adicionar(4, "Teclado Mecânico Preto")
+    return indice
+
+
+class TestTokenizar:
+    def test_tokenizar_normaliza_caixa_e_acentos(self):
+        """Testa que os tokens ficam em minúsculas e sem acentos"""
+        assert tokenizar("Café com Açúcar - 500g") == ["cafe", "com", "acucar", "500g"]
+
+    def test_tokenizar_texto_vazio(self):
+        """Testa a tokenização de um texto sem palavras"""
+        assert tokenizar("  - ") == []
+
+
+class TestIndiceInvertido:
+    def test_buscar_modo_e(self):
+        """Testa que o modo 'e' exige todos os termos"""
+        indice = criar_indice()
+        assert indice.buscar("notebook preto") == [1]
+
+    def test_buscar_modo_ou(self):
+        """Testa que o modo 'ou' aceita qualquer termo"""
+        indice = criar_indice()
+        assert set(indice.buscar("mouse teclado", modo="ou")) == {2, 4}
+
+    def test_relevancia_empate_ordenado_por_chave(self):
+        """Testa que resultados igualmente relevantes saem ordenados pela chave"""
+        indice = criar_indice()
+        assert indice.buscar("notebook") == [1, 3]
+
+    def test_relevancia_modo_ou_prefere_termo_raro(self):
+        """Testa que termos mais raros pesam mais que termos comuns"""
+        indice = IndiceInvertido()
+        indice.adicionar(1, "Cabo USB")
+        indice.adicionar(2, "Cabo HDMI")
+        indice.adicionar(3, "Cabo Rede")
+        assert indice.buscar("cabo hdmi", modo="ou") == [2, 1, 3]
+
+    def test_relevancia_modo_ou_prefere_mais_termos(self):
+        """Testa que documentos com mais termos da busca ficam à frente"""
+        indice = criar_indice()
+        assert indice.buscar("gamer preto", modo="ou")[0] == 1
+
+    def test_modo_ou_com_muitos_termos(self):
+        """Testa que o modo 'ou' considera todos os termos, mesmo com mais de dez"""
+        indice = IndiceInvertido()
+        termos = [f"termo{i}" for i in range(11)]
+        for chave, termo in enumerate(termos, start=1):
+            indice.adicionar(chave, f"Produto {termo}")
+        indice.adicionar(12, "Produto comum")
+        indice.adicionar(13, "Produto comum")
+
+        resultado = indice.buscar(" ".join(termos + ["comum"]), modo="ou")
+
+        assert resultado == list(range(1, 14))
+        assert indice.buscar(" ".join(termos + ["comum"]), modo="ou", limite=12)[-1] == 12
+
+    def test_buscar_com_limite(self):
+        """Testa que o limite devolve apenas os mais relevantes"""
+        indice = criar_indice()
+        assert indice.buscar("gamer preto notebook", modo="ou", limite=1) == [1]
+
+    def test_remover(self):
+        """Testa que chaves removidas saem dos resultados"""
+        indice = criar_indice()
+        indice.remover(3)
+        assert indice.buscar("notebook") == [1]
+        assert len(indice) == 3
+
+    def test_readicionar_atualiza_tokens(self):
+        """Testa que reindexar uma chave substitui os tokens antigos"""
+        indice = criar_indice()
+        indice.adicionar(3, "Monitor")
+        assert indice.buscar("notebook") == [1]
+        assert indice.buscar("monitor") == [3]
+
+    def test_buscar_termo_inexistente(self):
+        """Testa a busca por um termo fora do índice"""
+        indice = criar_indice()
+        assert indice.buscar("geladeira") == []
+        assert indice.buscar("notebook geladeira") == []
+
+    def test_modo_invalido(self):
+        """Testa que modos desconhecidos geram erro"""
+        indice = criar_indice()
+        with pytest.raises(ValueError):
+            indice.buscar("notebook", modo="xor")
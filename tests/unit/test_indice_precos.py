@@ -0,0 +1,96 @@
+import random
+
+import pytest
+from src.loja_online.indice_precos import IndicePrecos
+
+
+def criar_indice():
+    indice = IndicePrecos()
+    for produto_id, preco in [(1, 3000.0), (2, 50.0), (3, 150.0), (4, 1000.0), (5, 150.0)]:
+        indice.adicionar(produto_id, preco)
+    return indice
+
+
+class TestIndicePrecos:
+    def test_faixa_de_preco(self):
+        """Testa a consulta por faixa de preço em ordem crescente"""
+        indice = criar_indice()
+        assert indice.faixa(100.0, 1000.0) == [3, 5, 4]
+
+    def test_faixa_aberta(self):
+        """Testa faixas sem mínimo ou sem máximo"""
+        indice = criar_indice()
+        assert indice.faixa(maximo=150.0) == [2, 3, 5]
+        assert indice.faixa(minimo=1000.0) == [4, 1]
+
+    def test_paginacao(self):
+        """Testa a paginação com início e limite"""
+        indice = criar_indice()
+        assert indice.faixa(inicio=1, limite=2) == [3, 5]
+        assert indice.faixa(inicio=10, limite=2) == []
+
+    def test_mais_baratos_e_mais_caros(self):
+        """Testa os k produtos mais baratos e mais caros"""
+        indice = criar_indice()
+        assert indice.mais_baratos(2) == [2, 3]
+        assert indice.mais_caros(2) == [1, 4]
+
+    def test_atualizar_preco(self):
+        """Testa que readicionar um produto move sua posição no índice"""
+        indice = criar_indice()
+        indice.adicionar(1, 10.0)
+
+        assert indice.mais_baratos(1) == [1]
+        assert len(indice) == 5
+
+    def test_remover(self):
+        """Testa a remoção de um produto do índice"""
+        indice = criar_indice()
+        indice.remover(2)
+        indice.remover(999)
+
+        assert indice.mais_baratos(1) == [3]
+        assert len(indice) == 4
+
+    def test_consistente_com_ordenacao_completa(self):
+        """Testa o índice com muitos produtos contra uma ordenação completa"""
+        aleatorio = random.Random(42)
+        indice = IndicePrecos()
+        precos = {}
+        for produto_id in range(5000):
+            precos[produto_id] = round(aleatorio.uniform(1, 500), 2)
+            indice.adicionar(produto_id, precos[produto_id])
+        for produto_id in range(0, 5000, 3):
+            del precos[produto_id]
+            indice.remover(produto_id)
+        for produto_id in range(1, 5000, 7):
+            if produto_id in precos:
+                precos[produto_id] = round(aleatorio.uniform(1, 500), 2)
+                indice.adicionar(produto_id, precos[produto_id])
+
+        ordenados = [produto_id for preco, produto_id in
+                     sorted((preco, produto_id) for produto_id, preco in precos.items())]
+        na_faixa = [produto_id for produto_id in ordenados if 100 <= precos[produto_id] <= 200]
+
+        assert indice.faixa() == ordenados
+        assert indice.faixa(100, 200) == na_faixa
+        assert indice.faixa(100, 200, inicio=20, limite=10) == na_faixa[20:30]
+        assert indice.mais_caros(5) == ordenados[::-1][:5]
+
+    def test_adicionar_varios(self):
+        """Testa a carga em lote do índice"""
+        indice = IndicePrecos()
+        indice.adicionar_varios([(1, 30.0), (2, 10.0), (3, 20.0)])
+        indice.adicionar(4, 15.0)
+
+        assert indice.faixa() == [2, 4, 3, 1]
+
+    def test_adicionar_varios_com_id_repetido(self):
+        """Testa que um id repetido no lote fica só com o último preço"""
+        indice = IndicePrecos()
+        indice.adicionar_varios([(1, 30.0), (2, 10.0)])
+        indice.adicionar_varios([(1, 5.0), (3, 20.0), (1, 25.0)])
+        indice.remover(1)
+
+        assert indice.faixa() == [2, 3]
+        assert len(indice) == 2
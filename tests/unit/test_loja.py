@@ -1,7 +1,11 @@
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.loja_online.carrinho import Carrinho
+from src.loja_online.gateway_pagamento import FalhaGateway, GatewaySimulado
 from src.loja_online.loja import Loja
 from src.loja_online.cliente import Cliente
 from src.loja_online.produto import Produto
+from src.loja_online.promocoes import PromocaoPercentual
 
 
 class TestLoja:
@@ -40,6 +44,16 @@ class TestLoja:
         assert pedido.cliente_id == 1
         assert pedido.id in loja.pedidos
 
+    def test_criar_pedidos_concorrentes_ids_unicos(self):
+        """Testa que pedidos criados em várias threads não se sobrescrevem"""
+        loja = Loja()
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            pedidos = list(executor.map(loja.criar_pedido, range(1000)))
+
+        assert len({pedido.id for pedido in pedidos}) == 1000
+        assert len(loja.pedidos) == 1000
+
     def test_buscar_cliente_existente(self):
         """Testa a busca de um cliente existente"""
         loja = Loja()
@@ -78,3 +92,191 @@ class TestLoja:
         produto_estoque = loja.estoque.buscar_produto(1)
         assert produto_estoque is not None
         assert produto_estoque.id == 1
+
+    def test_catalogo_unico_entre_loja_e_estoque(self):
+        """Testa que loja e estoque leem o mesmo catálogo de produtos"""
+        loja = Loja()
+        produto = loja.cadastrar_produto(1, "Notebook", 3000.0)
+
+        assert loja.produtos is loja.estoque.produtos
+        assert loja.produtos[1] is produto
+
+    def test_produto_removido_do_estoque_some_da_loja(self):
+        """Testa que a remoção no estoque reflete na busca da loja"""
+        loja = Loja()
+        loja.cadastrar_produto(1, "Notebook", 3000.0)
+
+        loja.estoque.remover_produto(1)
+
+        assert loja.buscar_produto(1) is None
+        assert 1 not in loja.produtos
+
+    def test_cadastrar_produtos_em_lote_por_linhas(self):
+        """Testa o cadastro em lote a partir de tuplas (id, nome, preco, estoque)"""
+        loja = Loja()
+        produtos = loja.cadastrar_produtos_em_lote([
+            (1, "Notebook", 3000.0, 5),
+            (2, "Mouse", 50.0, 20),
+        ])
+
+        assert len(produtos) == 2
+        assert loja.buscar_produto(1).estoque == 5
+        assert loja.estoque.buscar_produto(2).preco == 50.0
+
+    def test_cadastrar_produtos_em_lote_com_id_repetido(self):
+        """Testa que um lote com id repetido não deixa catálogo e índice de preços divergentes"""
+        loja = Loja()
+        loja.cadastrar_produto(1, "Mouse", 50.0, 1)
+        assert [p.id for p in loja.buscar_produtos_por_preco(minimo=0)] == [1]
+
+        with pytest.raises(ValueError):
+            loja.cadastrar_produtos_em_lote([(50, "Teclado", 100.0, 1), (50, "Teclado", 200.0, 1)])
+        assert loja.buscar_produto(50) is None
+        assert [p.id for p in loja.buscar_produtos_por_preco(minimo=0)] == [1]
+
+    def test_cadastrar_produtos_em_lote_por_colunas(self):
+        """Testa o cadastro em lote a partir de colunas separadas"""
+        loja = Loja()
+        loja.cadastrar_produtos_em_lote(colunas=(
+            [1, 2],
+            ["Notebook", "Mouse"],
+            [3000.0, 50.0],
+            [5, 20],
+        ))
+
+        assert loja.buscar_produto(2).nome == "Mouse"
+        assert loja.buscar_produto(2).estoque == 20
+
+    def test_buscar_produtos_por_nome(self):
+        """Testa a busca de produtos por termos do nome"""
+        loja = Loja()
+        loja.cadastrar_produto(1, "Notebook Gamer", 5000.0)
+        loja.cadastrar_produto(2, "Mouse Gamer", 150.0)
+        loja.cadastrar_produto(3, "Notebook", 3000.0)
+
+        assert [p.id for p in loja.buscar_produtos("notebook")] == [1, 3]
+        assert [p.id for p in loja.buscar_produtos("notebook gamer")] == [1]
+        assert {p.id for p in loja.buscar_produtos("mouse notebook", modo="ou")} == {1, 2, 3}
+
+    def test_buscar_produtos_acompanha_cadastro_e_remocao(self):
+        """Testa que o índice de nomes acompanha cadastros e remoções"""
+        loja = Loja()
+        loja.cadastrar_produto(1, "Notebook", 3000.0)
+        assert len(loja.buscar_produtos("notebook")) == 1
+
+        loja.cadastrar_produto(2, "Notebook Gamer", 5000.0)
+        loja.cadastrar_produtos_em_lote([(3, "Notebook Slim", 4000.0, 1)])
+        loja.estoque.remover_produto(1)
+
+        assert {p.id for p in loja.buscar_produtos("notebook")} == {2, 3}
+
+    def test_buscar_produtos_por_preco(self):
+        """Testa a busca paginada de produtos por faixa de preço"""
+        loja = Loja()
+        loja.cadastrar_produtos_em_lote([
+            (1, "Notebook", 3000.0, 1),
+            (2, "Mouse", 50.0, 1),
+            (3, "Teclado", 150.0, 1),
+            (4, "Monitor", 1000.0, 1),
+        ])
+
+        assert [p.id for p in loja.buscar_produtos_por_preco(100, 2000)] == [3, 4]
+        assert [p.id for p in loja.buscar_produtos_por_preco(inicio=1, limite=2)] == [3, 4]
+
+    def test_calcular_total_com_promocoes(self):
+        """Testa o total do pedido com as promoções ativas da loja"""
+        loja = Loja()
+        produto = loja.cadastrar_produto(1, "Mouse", 50.0)
+        loja.promocoes.adicionar(PromocaoPercentual(1, [1], 20))
+        pedido = loja.criar_pedido(1)
+        pedido.adicionar_item(produto, 2)
+
+        assert loja.calcular_total_com_promocoes(pedido) == 80.0
+
+    def test_finalizar_compra(self):
+        """Testa o checkout completo: reserva, cobrança, pedido confirmado e entrega"""
+        loja = Loja()
+        produto = loja.cadastrar_produto(1, "Mouse", 50.0, 5)
+        cliente = loja.cadastrar_cliente(1, "João", "joao@email.com")
+        carrinho = Carrinho()
+        carrinho.adicionar_produto(produto, 2)
+        agendadas = []
+
+        pedido, pagamento, entrega = loja.finalizar_compra(
+            1, carrinho, "Rua A, 1", GatewaySimulado(), agendar_entrega=agendadas.append)
+
+        assert pedido.status == "confirmado"
+        assert pagamento.status == "processado" and pagamento.valor == 100.0
+        assert entrega.pedido_id == pedido.id and entrega.status == "preparando"
+        assert agendadas == [entrega]
+        assert loja.entregas.buscar_por_pedido(pedido.id) is entrega
+        assert produto.estoque == 3
+        assert cliente.obter_total_gasto() == 100.0
+        assert carrinho.itens == []
+
+    def test_finalizar_compra_pagamento_recusado(self):
+        """Testa que a recusa do pagamento devolve o estoque e cancela o pedido"""
+        loja = Loja()
+        produto = loja.cadastrar_produto(1, "Mouse", 50.0, 5)
+        cliente = loja.cadastrar_cliente(1, "João", "joao@email.com")
+        carrinho = Carrinho()
+        carrinho.adicionar_produto(produto, 2)
+
+        pedido, pagamento, entrega = loja.finalizar_compra(
+            1, carrinho, "Rua A, 1", GatewaySimulado(taxa_recusa=1.0))
+
+        assert pedido.status == "cancelado"
+        assert pagamento.status == "recusado"
+        assert entrega is None
+        assert produto.estoque == 5
+        assert cliente.obter_total_gasto() == 0
+        assert len(carrinho.itens) == 1
+
+    def test_finalizar_compra_falha_do_gateway(self):
+        """Testa que uma falha do gateway devolve o estoque e cancela o pedido"""
+        loja = Loja()
+        produto = loja.cadastrar_produto(1, "Mouse", 50.0, 5)
+        loja.cadastrar_cliente(1, "João", "joao@email.com")
+
+        for _ in range(2):
+            carrinho = Carrinho()
+            carrinho.adicionar_produto(produto, 3)
+            with pytest.raises(FalhaGateway):
+                loja.finalizar_compra(1, carrinho, "Rua A, 1", GatewaySimulado(taxa_falhas=1.0))
+
+        assert produto.estoque == 5
+        assert {pedido.status for pedido in loja.pedidos.values()} == {"cancelado"}
+        assert len(loja.entregas) == 0
+
+    def test_finalizar_compra_sem_estoque(self):
+        """Testa que o checkout sem estoque não cria pedido"""
+        loja = Loja()
+        produto = loja.cadastrar_produto(1, "Mouse", 50.0, 1)
+        loja.cadastrar_cliente(1, "João", "joao@email.com")
+        carrinho = Carrinho()
+        carrinho.adicionar_produto(produto, 2)
+
+        assert loja.finalizar_compra(1, carrinho, "Rua A, 1") is None
+        assert not loja.pedidos
+
+    def test_finalizar_compra_quantidade_negativa(self):
+        """Testa que uma linha negativa no carrinho não devolve estoque nem cria pedido"""
+        loja = Loja()
+        produto = loja.cadastrar_produto(1, "Mouse", 50.0, 0)
+        loja.cadastrar_cliente(1, "João", "joao@email.com")
+        carrinho = Carrinho()
+        carrinho.adicionar_produto(produto, -7)
+
+        with pytest.raises(ValueError):
+            loja.finalizar_compra(1, carrinho, "Rua A, 1")
+        assert produto.estoque == 0
+        assert not loja.pedidos
+
+    def test_finalizar_compra_invalida(self):
+        """Testa os erros de checkout com cliente inexistente ou carrinho vazio"""
+        loja = Loja()
+        loja.cadastrar_cliente(1, "João", "joao@email.com")
+        with pytest.raises(ValueError):
+            loja.finalizar_compra(2, Carrinho(), "Rua A, 1")
+        with pytest.raises(ValueError):
+            loja.finalizar_compra(1, Carrinho(), "Rua A, 1")
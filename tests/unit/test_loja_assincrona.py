@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+from src.loja_online.carrinho import Carrinho
+from src.loja_online.gateway_pagamento import FalhaGateway, GatewaySimulado
+from src.loja_online.loja import Loja
+from src.loja_online.loja_assincrona import LojaAssincrona
+
+
+@pytest.fixture
+def loja():
+    loja = Loja()
+    loja.cadastrar_produto(1, "Mouse", 50.0, 100)
+    for cliente_id in range(1, 101):
+        loja.cadastrar_cliente(cliente_id, f"Cliente {cliente_id}", f"c{cliente_id}@email.com")
+    return loja
+
+
+def _carrinho(loja, quantidade=1):
+    carrinho = Carrinho()
+    carrinho.adicionar_produto(loja.buscar_produto(1), quantidade)
+    return carrinho
+
+
+class TestLojaAssincrona:
+    def test_finalizar_compra(self, loja):
+        """Testa o checkout assíncrono com entrega agendada"""
+        agendadas = []
+
+        async def agendar(entrega):
+            agendadas.append(entrega)
+
+        loja_assincrona = LojaAssincrona(loja, GatewaySimulado(), agendar_entrega=agendar)
+        pedido, pagamento, entrega = asyncio.run(
+            loja_assincrona.finalizar_compra(1, _carrinho(loja, 2), "Rua A, 1"))
+
+        assert pedido.status == "confirmado"
+        assert pagamento.status == "processado"
+        assert agendadas == [entrega]
+        assert loja.buscar_produto(1).estoque == 98
+
+    def test_pagamento_recusado(self, loja):
+        """Testa que a recusa devolve o estoque no checkout assíncrono"""
+        loja_assincrona = LojaAssincrona(loja, GatewaySimulado(taxa_recusa=1.0))
+        pedido, pagamento, entrega = asyncio.run(
+            loja_assincrona.finalizar_compra(1, _carrinho(loja), "Rua A, 1"))
+
+        assert (pedido.status, pagamento.status, entrega) == ("cancelado", "recusado", None)
+        assert loja.buscar_produto(1).estoque == 100
+
+    def test_falha_do_gateway(self, loja):
+        """Testa que uma falha do gateway devolve o estoque no checkout assíncrono"""
+        loja_assincrona = LojaAssincrona(loja, GatewaySimulado(taxa_falhas=1.0))
+        with pytest.raises(FalhaGateway):
+            asyncio.run(loja_assincrona.finalizar_compra(1, _carrinho(loja, 3), "Rua A, 1"))
+
+        assert loja.buscar_produto(1).estoque == 100
+        assert [pedido.status for pedido in loja.pedidos.values()] == ["cancelado"]
+
+    def test_checkout_cancelado(self, loja):
+        """Testa que cancelar a tarefa do checkout devolve o estoque"""
+        loja_assincrona = LojaAssincrona(loja, GatewaySimulado(latencia=10))
+
+        async def cancelar():
+            tarefa = asyncio.ensure_future(
+                loja_assincrona.finalizar_compra(1, _carrinho(loja, 3), "Rua A, 1"))
+            await asyncio.sleep(0.01)
+            tarefa.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await tarefa
+
+        asyncio.run(cancelar())
+        assert loja.buscar_produto(1).estoque == 100
+
+    def test_checkouts_simultaneos(self, loja):
+        """Testa que as cobranças de vários checkouts aguardam o gateway ao mesmo tempo"""
+        loja_assincrona = LojaAssincrona(loja, GatewaySimulado(latencia=0.05))
+        compras = [(cliente_id, _carrinho(loja), "Rua A, 1") for cliente_id in range(1, 101)]
+
+        inicio = time.perf_counter()
+        resultados = asyncio.run(loja_assincrona.finalizar_compras(compras))
+        tempo = time.perf_counter() - inicio
+
+        assert all(pedido.status == "confirmado" for pedido, _, _ in resultados)
+        assert loja.buscar_produto(1).estoque == 0
+        assert tempo < 1.0
+
+    def test_sem_estoque_retorna_none(self, loja):
+        """Testa que checkouts além do estoque não criam pedidos"""
+        loja_assincrona = LojaAssincrona(loja, GatewaySimulado(latencia=0.001))
+        compras = [(cliente_id, _carrinho(loja, 3), "Rua A, 1") for cliente_id in range(1, 41)]
+
+        resultados = asyncio.run(loja_assincrona.finalizar_compras(compras))
+
+        assert sum(resultado is not None for resultado in resultados) == 33
+        assert loja.buscar_produto(1).estoque == 1
+
+    def test_limite_de_checkouts_simultaneos(self, loja):
+        """Testa que o limite restringe quantas cobranças ficam em andamento"""
+        em_andamento = []
+        maximo = []
+
+        class GatewayContador(GatewaySimulado):
+            async def cobrar_async(self, pagamento):
+                em_andamento.append(pagamento)
+                maximo.append(len(em_andamento))
+                await asyncio.sleep(0.001)
+                em_andamento.remove(pagamento)
+                return True
+
+        loja_assincrona = LojaAssincrona(loja, GatewayContador(), limite_simultaneos=5)
+        compras = [(cliente_id, _carrinho(loja), "Rua A, 1") for cliente_id in range(1, 51)]
+        asyncio.run(loja_assincrona.finalizar_compras(compras))
+
+        assert max(maximo) == 5
@@ -0,0 +1,206 @@
+import pytest
+import threading
+from src.loja_online.loja_sqlite import LojaSQLite, ProdutoSQLite
+
+
+@pytest.fixture
+def caminho(tmp_path):
+    return tmp_path / "loja.db"
+
+
+class TestLojaSQLite:
+    def test_cadastrar_e_buscar_produto(self, caminho):
+        """Testa o cadastro e a busca de produto no SQLite"""
+        loja = LojaSQLite(caminho)
+        produto = loja.cadastrar_produto(1, "Notebook", 3000.0, 5)
+
+        assert isinstance(produto, ProdutoSQLite)
+        assert loja.buscar_produto(1) is produto
+        assert loja.buscar_produto(999) is None
+        assert 1 in loja.produtos
+        assert len(loja.produtos) == 1
+        loja.fechar()
+
+    def test_produtos_persistem_ao_reabrir(self, caminho):
+        """Testa que produtos, preço e estoque sobrevivem ao reabrir o banco"""
+        loja = LojaSQLite(caminho)
+        loja.cadastrar_produtos_em_lote([(1, "Notebook", 3000.0, 5), (2, "Mouse", 50.0, 10)])
+        loja.buscar_produto(1).definir_estoque(7)
+        loja.estoque.alterar_preco(2, 45.0)
+        assert loja.estoque.reservar(2, 4) is True
+        assert loja.estoque.reservar(2, 100) is False
+        loja.fechar()
+
+        reaberta = LojaSQLite(caminho)
+        assert reaberta.buscar_produto(1).estoque == 7
+        assert reaberta.buscar_produto(2).preco == 45.0
+        assert reaberta.buscar_produto(2).estoque == 6
+        assert [p.id for p in reaberta.estoque.listar_produtos()] == [1, 2]
+        reaberta.fechar()
+
+    def test_reservar_itens_grava_estoque(self, caminho):
+        """Testa que a reserva de vários itens é gravada no banco"""
+        loja = LojaSQLite(caminho)
+        loja.cadastrar_produtos_em_lote([(1, "Notebook", 3000.0, 5), (2, "Mouse", 50.0, 10)])
+        assert loja.estoque.reservar_itens([(1, 2), (2, 3)]) is True
+        loja.fechar()
+
+        reaberta = LojaSQLite(caminho)
+        assert reaberta.buscar_produto(1).estoque == 3
+        assert reaberta.buscar_produto(2).estoque == 7
+        reaberta.fechar()
+
+    def test_reservar_itens_nao_vende_acima_do_estoque_entre_lojas(self, caminho):
+        """Testa que duas lojas no mesmo banco não vendem o mesmo estoque duas vezes"""
+        loja = LojaSQLite(caminho)
+        loja.cadastrar_produto(1, "Notebook", 3000.0, 5)
+        outra = LojaSQLite(caminho)
+        assert outra.buscar_produto(1).estoque == 5
+
+        assert loja.estoque.reservar_itens([(1, 5)]) is True
+        assert outra.estoque.reservar_itens([(1, 5)]) is False
+        assert outra.estoque.reservar(1, 1) is False
+        assert outra.buscar_produto(1).estoque == 5
+        assert loja.banco.valor("SELECT estoque FROM produtos WHERE id = 1") == 0
+        loja.fechar()
+        outra.fechar()
+
+    def test_reservar_itens_tudo_ou_nada_no_banco(self, caminho):
+        """Testa que uma reserva sem estoque em uma linha não grava nenhuma"""
+        loja = LojaSQLite(caminho)
+        loja.cadastrar_produtos_em_lote([(1, "Notebook", 3000.0, 5), (2, "Mouse", 50.0, 10)])
+        outra = LojaSQLite(caminho)
+        assert outra.estoque.reservar(2, 9) is True
+
+        assert loja.estoque.reservar_itens([(1, 2), (2, 3)]) is False
+        assert loja.banco.consultar("SELECT estoque FROM produtos ORDER BY id") == [(5,), (1,)]
+        assert outra.estoque.reservar_itens([(1, 2), (2, 1)]) is True
+        assert [outra.buscar_produto(i).estoque for i in (1, 2)] == [3, 0]
+        loja.fechar()
+        outra.fechar()
+
+    def test_pedidos_e_clientes_persistem(self, caminho):
+        """Testa que pedidos, itens, status e compras sobrevivem ao reabrir"""
+        loja = LojaSQLite(caminho)
+        notebook = loja.cadastrar_produto(1, "Notebook", 3000.0, 5)
+        mouse = loja.cadastrar_produto(2, "Mouse", 50.0, 10)
+        cliente = loja.cadastrar_cliente(1, "Maria Eduarda", "maria@email.com")
+        pedido = loja.criar_pedido(1)
+        pedido.adicionar_item(notebook, 1)
+        pedido.adicionar_item(mouse, 3)
+        pedido.remover_item(2, 1)
+        pedido.confirmar_pedido()
+        cliente.adicionar_compra(pedido)
+        loja.fechar()
+
+        reaberta = LojaSQLite(caminho)
+        cliente = reaberta.buscar_cliente(1)
+        pedido = reaberta.buscar_pedido(1)
+
+        assert cliente.email == "maria@email.com"
+        assert cliente.obter_total_gasto() == 3100.0
+        assert cliente.historico == [pedido]
+        assert pedido.status == "confirmado"
+        assert pedido.total == 3100.0
+        assert [(i.produto.id, i.quantidade) for i in pedido.itens] == [(1, 1), (2, 2)]
+        assert pedido.itens[0].produto is reaberta.buscar_produto(1)
+        assert reaberta.criar_pedido(1).id == 2
+        reaberta.fechar()
+
+    def test_remover_produto(self, caminho):
+        """Testa a remoção de produto do banco"""
+        loja = LojaSQLite(caminho)
+        loja.cadastrar_produto(1, "Notebook", 3000.0)
+        loja.estoque.remover_produto(1)
+
+        assert loja.buscar_produto(1) is None
+        assert len(loja.produtos) == 0
+        loja.fechar()
+
+    def test_cache_limitado_mantem_identidade(self, caminho):
+        """Testa que produtos em uso mantêm a identidade além do cache"""
+        loja = LojaSQLite(caminho, tamanho_cache=2)
+        loja.cadastrar_produtos_em_lote((i + 1, f"Produto {i + 1}", 1.0, 1) for i in range(10))
+        primeiro = loja.buscar_produto(1)
+        for i in range(2, 11):
+            loja.buscar_produto(i)
+
+        assert len(loja.produtos._recentes) == 2
+        assert loja.buscar_produto(1) is primeiro
+        loja.fechar()
+
+    def test_reajustar_precos(self, caminho):
+        """Testa o reajuste de preços no banco e nos produtos carregados"""
+        loja = LojaSQLite(caminho)
+        produto = loja.cadastrar_produto(1, "Mouse", 100.0)
+        loja.estoque.reajustar_precos(10)
+        loja.fechar()
+
+        assert produto.preco == pytest.approx(110.0)
+        reaberta = LojaSQLite(caminho)
+        assert reaberta.buscar_produto(1).preco == pytest.approx(110.0)
+        reaberta.fechar()
+
+    def test_reservas_concorrentes_sem_venda_excedente(self, caminho):
+        """Testa reservas de várias threads, cada uma com sua conexão"""
+        loja = LojaSQLite(caminho)
+        loja.cadastrar_produto(1, "Mouse", 50.0, 100)
+        sucessos = []
+        conexoes = []
+
+        def reservar():
+            conexoes.append(loja.banco.conexao())
+            sucessos.append(sum(loja.estoque.reservar(1, 1) for _ in range(30)))
+
+        threads = [threading.Thread(target=reservar) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(sucessos) == 100
+        assert loja.banco.valor("SELECT estoque FROM produtos WHERE id = 1") == 0
+        assert len({id(conexao) for conexao in conexoes}) == 8
+        loja.fechar()
+
+    def test_conexoes_fechadas_ao_fim_das_threads(self, caminho):
+        """Testa que a conexão de cada thread é fechada quando a thread termina"""
+        loja = LojaSQLite(caminho)
+        loja.cadastrar_produto(1, "Mouse", 50.0, 1000)
+
+        for _ in range(10):
+            threads = [threading.Thread(target=loja.estoque.reservar, args=(1, 1)) for _ in range(50)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert loja.buscar_produto(1).estoque == 500
+        assert loja.banco.conexoes_abertas() == 1
+        loja.fechar()
+
+    def test_pedidos_de_lojas_no_mesmo_banco(self, caminho):
+        """Testa que duas lojas no mesmo banco não repetem ids de pedido"""
+        loja = LojaSQLite(caminho)
+        loja.cadastrar_cliente(1, "João", "joao@email.com")
+        outra = LojaSQLite(caminho)
+
+        ids = [loja.criar_pedido(1).id, outra.criar_pedido(1).id, loja.criar_pedido(1).id]
+
+        assert ids == [1, 2, 3]
+        assert outra.buscar_pedido(3).cliente_id == 1
+        loja.fechar()
+        outra.fechar()
+
+    def test_cadastro_em_lote_com_id_repetido(self, caminho):
+        """Testa que ids repetidos no lote ou já cadastrados são recusados sem gravar nada"""
+        loja = LojaSQLite(caminho)
+        loja.cadastrar_produto(1, "Notebook", 3000.0, 5)
+
+        with pytest.raises(ValueError):
+            loja.cadastrar_produtos_em_lote([(2, "Mouse", 50.0, 10), (2, "Teclado", 150.0, 3)])
+        with pytest.raises(ValueError):
+            loja.cadastrar_produtos_em_lote([(3, "Mouse", 50.0, 10), (1, "Outro", 1.0, 0)])
+        assert [p.id for p in loja.estoque.listar_produtos()] == [1]
+        assert loja.buscar_produto(1).nome == "Notebook"
+        loja.fechar()
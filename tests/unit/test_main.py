@@ -0,0 +1,19 @@
+from src.loja_online import main as modulo_main
+from src.loja_online.loja import Loja
+
+
+class TestMain:
+    def test_partida_a_quente_preserva_dados(self, tmp_path, monkeypatch):
+        """Testa que execuções com snapshot não recadastram os dados de exemplo"""
+        caminho = str(tmp_path / "loja.snapshot")
+        monkeypatch.setenv("LOJA_SNAPSHOT", caminho)
+        monkeypatch.delenv("LOJA_ESTOQUE_COMPARTILHADO", raising=False)
+
+        for _ in range(3):
+            modulo_main.main()
+
+        loja = Loja.carregar_snapshot(caminho)
+        cliente = loja.buscar_cliente(1)
+        assert sorted(loja.pedidos) == [1]
+        assert [pedido.id for pedido in cliente.obter_historico()] == [1]
+        assert loja.buscar_produto(1).estoque == 10
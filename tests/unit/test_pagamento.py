@@ -1,4 +1,7 @@
+import asyncio
+
 import pytest
+from src.loja_online.gateway_pagamento import GatewaySimulado
 from src.loja_online.pagamento import Pagamento
 
 
@@ -45,3 +48,29 @@ class TestPagamento:
         assert pagamento_cartao.metodo == "cartao"
         assert pagamento_boleto.metodo == "boleto"
         assert pagamento_pix.metodo == "pix"
+
+    def test_pagamento_sem_dict_por_instancia(self):
+        """Testa que o pagamento usa __slots__ em vez de __dict__"""
+        pagamento = Pagamento(1, 100.0, "cartao")
+        assert not hasattr(pagamento, "__dict__")
+
+    def test_processar_pagamento_com_gateway(self):
+        """Testa o processamento aprovado e recusado por um gateway"""
+        pagamento = Pagamento(1, 100.0, "cartao")
+        assert pagamento.processar_pagamento(GatewaySimulado()) is True
+        assert pagamento.status == "processado"
+
+        recusado = Pagamento(2, 100.0, "cartao")
+        assert recusado.processar_pagamento(GatewaySimulado(taxa_recusa=1.0)) is False
+        assert recusado.status == "recusado"
+
+    def test_processar_pagamento_async(self):
+        """Testa o processamento assíncrono pelo gateway"""
+        pagamento = Pagamento(1, 100.0, "cartao")
+        assert asyncio.run(pagamento.processar_pagamento_async(GatewaySimulado(latencia=0.001)))
+        assert pagamento.status == "processado"
+
+    def test_gateway_recusa_valor_invalido(self):
+        """Testa que o gateway simulado recusa cobranças sem valor"""
+        pagamento = Pagamento(1, 0.0, "cartao")
+        assert pagamento.processar_pagamento(GatewaySimulado()) is False
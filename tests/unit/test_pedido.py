@@ -1,5 +1,5 @@
 import pytest
-from src.loja_online.pedido import Pedido
+from src.loja_online.pedido import ItemPedido, Pedido
 from src.loja_online.produto import Produto
 
 
@@ -59,3 +59,82 @@ class TestPedido:
 
         assert len(pedido.itens) == 3
         assert pedido.total == 3250.0
+
+    def test_item_pedido_acesso_por_atributo_e_chave(self):
+        """Testa que o item do pedido aceita acesso por atributo e por chave"""
+        pedido = Pedido(1, 100)
+        produto = Produto(1, "Notebook", 3000.0)
+        pedido.adicionar_item(produto, 2)
+
+        item = pedido.itens[0]
+        assert isinstance(item, ItemPedido)
+        assert item.produto is item["produto"]
+        assert item.quantidade == item["quantidade"] == 2
+
+    def test_item_pedido_chave_invalida(self):
+        """Testa que chaves desconhecidas do item geram KeyError"""
+        item = ItemPedido(Produto(1, "Notebook", 3000.0), 1)
+        with pytest.raises(KeyError):
+            item["preco"]
+
+    def test_pedido_sem_dict_por_instancia(self):
+        """Testa que pedido e item usam __slots__ em vez de __dict__"""
+        pedido = Pedido(1, 100)
+        assert not hasattr(pedido, "__dict__")
+        assert not hasattr(ItemPedido(None, 1), "__dict__")
+
+    def test_adicionar_mesmo_produto_agrupa_linha(self):
+        """Testa que o mesmo produto adicionado duas vezes vira uma só linha"""
+        pedido = Pedido(1, 100)
+        produto = Produto(1, "Notebook", 3000.0)
+
+        pedido.adicionar_item(produto, 1)
+        pedido.adicionar_item(produto, 2)
+
+        assert len(pedido.itens) == 1
+        assert pedido.itens[0].quantidade == 3
+        assert pedido.total == 9000.0
+
+    def test_remover_item(self):
+        """Testa a remoção de uma linha inteira do pedido"""
+        pedido = Pedido(1, 100)
+        pedido.adicionar_item(Produto(1, "Notebook", 3000.0), 1)
+        pedido.adicionar_item(Produto(2, "Mouse", 50.0), 2)
+
+        assert pedido.remover_item(1) is True
+        assert len(pedido.itens) == 1
+        assert pedido.total == 100.0
+
+    def test_remover_parte_da_quantidade(self):
+        """Testa a remoção de parte da quantidade de uma linha"""
+        pedido = Pedido(1, 100)
+        pedido.adicionar_item(Produto(2, "Mouse", 50.0), 3)
+
+        pedido.remover_item(2, 2)
+
+        assert pedido.itens[0].quantidade == 1
+        assert pedido.total == 50.0
+
+    def test_remover_todos_os_itens_zera_total(self):
+        """Testa que o total volta a zero ao esvaziar o pedido"""
+        pedido = Pedido(1, 100)
+        pedido.adicionar_item(Produto(1, "Cabo", 0.1), 3)
+        pedido.remover_item(1)
+
+        assert pedido.itens == []
+        assert pedido.total == 0
+
+    def test_remover_item_inexistente(self):
+        """Testa a remoção de um produto que não está no pedido"""
+        pedido = Pedido(1, 100)
+        assert pedido.remover_item(999) is False
+
+    def test_calcular_total_verifica_total_incremental(self):
+        """Testa que o recálculo completo confere com o total incremental"""
+        pedido = Pedido(1, 100)
+        for produto_id in range(1, 51):
+            pedido.adicionar_item(Produto(produto_id, "Item", 0.5 * produto_id), 2)
+        pedido.remover_item(10)
+        total_incremental = pedido.total
+
+        assert pedido.calcular_total() == pytest.approx(total_incremental)
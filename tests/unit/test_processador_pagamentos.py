@@ -0,0 +1,106 @@
+import threading
+import time
+
+import pytest
+from src.loja_online.gateway_pagamento import FalhaGateway, GatewayPagamento, GatewaySimulado
+from src.loja_online.pagamento import Pagamento
+from src.loja_online.processador_pagamentos import ProcessadorPagamentos
+
+
+def _pagamentos(quantidade, valor=10.0):
+    return [Pagamento(i, valor, "cartao") for i in range(quantidade)]
+
+
+class GatewayFalhaAntes(GatewayPagamento):
+    def __init__(self, falhas):
+        self.falhas = falhas
+        self.lotes = []
+
+    def cobrar_lote(self, pagamentos):
+        self.lotes.append(len(pagamentos))
+        if self.falhas:
+            self.falhas -= 1
+            raise FalhaGateway("indisponível")
+        return [True] * len(pagamentos)
+
+
+class TestProcessadorPagamentos:
+    def test_processa_e_atualiza_status(self):
+        """Testa que os pagamentos processados recebem o status do gateway"""
+        pagamentos = _pagamentos(20) + [Pagamento(99, 0.0, "cartao")]
+        with ProcessadorPagamentos(GatewaySimulado()) as processador:
+            resultados = processador.processar(pagamentos)
+
+        assert resultados == [True] * 20 + [False]
+        assert {p.status for p in pagamentos[:20]} == {"processado"}
+        assert pagamentos[20].status == "recusado"
+
+    def test_agrupa_em_lotes(self):
+        """Testa que pagamentos enfileirados juntos são cobrados em lotes"""
+        gateway = GatewayFalhaAntes(0)
+        with ProcessadorPagamentos(gateway, tamanho_lote=10, trabalhadores=1,
+                                   intervalo=0.05) as processador:
+            processador.processar(_pagamentos(35))
+
+        assert sum(gateway.lotes) == 35
+        assert max(gateway.lotes) == 10
+        assert len(gateway.lotes) < 35
+
+    def test_repete_falhas_transitorias(self):
+        """Testa que falhas transitórias são repetidas até o sucesso"""
+        gateway = GatewayFalhaAntes(2)
+        with ProcessadorPagamentos(gateway, tentativas=3, espera_base=0.001) as processador:
+            assert processador.processar(_pagamentos(1)) == [True]
+
+        assert processador.repeticoes == 2
+
+    def test_desiste_apos_tentativas(self):
+        """Testa que o futuro recebe a falha quando as tentativas se esgotam"""
+        pagamento = Pagamento(1, 10.0, "cartao")
+        with ProcessadorPagamentos(GatewayFalhaAntes(5), tentativas=2,
+                                   espera_base=0.001) as processador:
+            futuro = processador.enviar(pagamento)
+            with pytest.raises(FalhaGateway):
+                futuro.result()
+
+        assert pagamento.status == "pendente"
+
+    def test_espera_limitada_com_jitter(self):
+        """Testa que a espera entre tentativas respeita o limite máximo"""
+        gateway = GatewayFalhaAntes(3)
+        inicio = time.perf_counter()
+        with ProcessadorPagamentos(gateway, tentativas=4, espera_base=10,
+                                   espera_maxima=0.01) as processador:
+            processador.processar(_pagamentos(1))
+
+        assert time.perf_counter() - inicio < 1.0
+
+    def test_contrapressao_limita_lotes_em_andamento(self):
+        """Testa que no máximo `trabalhadores` lotes ficam no gateway ao mesmo tempo"""
+        em_andamento = []
+        maximo = []
+        trava = threading.Lock()
+
+        class GatewayLento(GatewayPagamento):
+            def cobrar_lote(self, pagamentos):
+                with trava:
+                    em_andamento.append(1)
+                    maximo.append(len(em_andamento))
+                time.sleep(0.005)
+                with trava:
+                    em_andamento.pop()
+                return [True] * len(pagamentos)
+
+        with ProcessadorPagamentos(GatewayLento(), tamanho_lote=2, trabalhadores=3,
+                                   limite_pendentes=4) as processador:
+            assert all(processador.processar(_pagamentos(60)))
+
+        assert max(maximo) <= 3
+
+    def test_fechar_processa_pendentes(self):
+        """Testa que fechar o processador conclui os pagamentos já enviados"""
+        processador = ProcessadorPagamentos(GatewaySimulado(latencia=0.001), tamanho_lote=5)
+        futuros = [processador.enviar(p) for p in _pagamentos(12)]
+        processador.fechar()
+
+        assert all(futuro.result(timeout=0) for futuro in futuros)
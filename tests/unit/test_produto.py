@@ -78,3 +78,13 @@ class TestProduto:
         """Testa a verificação de estoque quando está zerado"""
         produto = Produto(1, "Notebook", 3000.0)
         assert produto.tem_estoque_disponivel() is False
+
+    def test_criar_produto_com_estoque_inicial(self):
+        """Testa a criação de um produto já com estoque"""
+        produto = Produto(1, "Notebook", 3000.0, 7)
+        assert produto.estoque == 7
+
+    def test_produto_sem_dict_por_instancia(self):
+        """Testa que o produto usa __slots__ em vez de __dict__"""
+        produto = Produto(1, "Notebook", 3000.0)
+        assert not hasattr(produto, "__dict__")
@@ -0,0 +1,90 @@
+import pytest
+from src.loja_online.promocoes import (
+    MotorPromocoes, PromocaoPercentual, PromocaoLeveXPagueY, PromocaoProgressiva)
+from src.loja_online.carrinho import Carrinho
+from src.loja_online.pedido import Pedido
+from src.loja_online.produto import Produto
+
+
+class TestPromocoes:
+    def test_promocao_percentual(self):
+        """Testa o desconto percentual sobre o subtotal da linha"""
+        promocao = PromocaoPercentual(1, [1], 10)
+        assert promocao.calcular_desconto(100.0, 3) == 30.0
+
+    def test_promocao_leve_x_pague_y(self):
+        """Testa o leve 3 pague 2 aplicado a grupos completos"""
+        promocao = PromocaoLeveXPagueY(1, [1], leve=3, pague=2)
+        assert promocao.calcular_desconto(10.0, 2) == 0
+        assert promocao.calcular_desconto(10.0, 7) == 20.0
+
+    def test_promocao_leve_x_pague_y_invalida(self):
+        """Testa que pague precisa ser menor que leve"""
+        with pytest.raises(ValueError):
+            PromocaoLeveXPagueY(1, [1], leve=2, pague=2)
+
+    def test_promocao_progressiva(self):
+        """Testa que a maior faixa atingida define a porcentagem"""
+        promocao = PromocaoProgressiva(1, [1], [(5, 10), (10, 20)])
+        assert promocao.calcular_desconto(10.0, 4) == 0
+        assert promocao.calcular_desconto(10.0, 5) == 5.0
+        assert promocao.calcular_desconto(10.0, 12) == 24.0
+
+
+class TestMotorPromocoes:
+    def test_desconto_no_carrinho(self):
+        """Testa o total do carrinho com promoções aplicadas por produto"""
+        motor = MotorPromocoes()
+        motor.adicionar(PromocaoPercentual(1, [1], 10))
+        motor.adicionar(PromocaoLeveXPagueY(2, [2], leve=2, pague=1))
+        carrinho = Carrinho()
+        carrinho.adicionar_produto(Produto(1, "Notebook", 3000.0), 1)
+        carrinho.adicionar_produto(Produto(2, "Mouse", 50.0), 2)
+        carrinho.adicionar_produto(Produto(3, "Teclado", 150.0), 1)
+
+        assert motor.calcular_desconto(carrinho) == 350.0
+        assert motor.calcular_total(carrinho) == 2900.0
+
+    def test_desconto_no_pedido(self):
+        """Testa o total do pedido com promoção progressiva"""
+        motor = MotorPromocoes()
+        motor.adicionar(PromocaoProgressiva(1, [1], [(2, 5), (4, 10)]))
+        pedido = Pedido(1, 1)
+        pedido.adicionar_item(Produto(1, "Cabo", 20.0), 4)
+
+        assert motor.calcular_total(pedido) == 72.0
+
+    def test_promocoes_nao_se_acumulam(self):
+        """Testa que vale apenas a promoção de maior desconto na linha"""
+        motor = MotorPromocoes()
+        motor.adicionar(PromocaoPercentual(1, [1], 10))
+        motor.adicionar(PromocaoPercentual(2, [1], 25))
+        motor.adicionar(PromocaoLeveXPagueY(3, [1], leve=4, pague=3))
+
+        assert motor.calcular_desconto_item(Produto(1, "Mouse", 100.0), 4) == 100.0
+        assert motor.calcular_desconto_item(Produto(2, "Teclado", 100.0), 4) == 0
+
+    def test_remover_promocao_recompila(self):
+        """Testa que remover uma promoção atualiza a tabela por produto"""
+        motor = MotorPromocoes()
+        motor.adicionar(PromocaoPercentual(1, [1, 2], 10))
+        produto = Produto(1, "Mouse", 100.0)
+        assert motor.calcular_desconto_item(produto, 1) == 10.0
+
+        assert motor.remover(1) is True
+        assert motor.remover(1) is False
+        assert motor.calcular_desconto_item(produto, 1) == 0
+        assert motor.compilar() == {}
+
+    def test_compilar_agrupa_regras_por_produto(self):
+        """Testa a tabela de regras compilada por produto"""
+        motor = MotorPromocoes()
+        percentual = PromocaoPercentual(1, [1, 2], 10)
+        progressiva = PromocaoProgressiva(2, [2], [(3, 15)])
+        motor.adicionar(percentual)
+        motor.adicionar(progressiva)
+
+        tabela = motor.compilar()
+
+        assert tabela[1] == (percentual,)
+        assert set(tabela[2]) == {percentual, progressiva}
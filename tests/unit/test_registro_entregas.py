@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+from src.loja_online.entrega import Entrega
+from src.loja_online.registro_entregas import RegistroEntregas
+
+
+def _registro_com(quantidade):
+    registro = RegistroEntregas()
+    entregas = [Entrega(i, 100 + i, f"Rua {i}") for i in range(quantidade)]
+    registro.adicionar_varias(entregas)
+    return registro, entregas
+
+
+class TestRegistroEntregas:
+    def test_adicionar_e_buscar_por_pedido(self):
+        """Testa o índice de entregas por pedido"""
+        registro, entregas = _registro_com(3)
+
+        assert len(registro) == 3
+        assert registro.buscar_por_pedido(101) is entregas[1]
+        assert registro.buscar_por_pedido(999) is None
+        assert entregas[0] in registro
+
+    def test_pedido_com_duas_entregas(self):
+        """Testa que um pedido não pode ter duas entregas registradas"""
+        registro, _ = _registro_com(1)
+        with pytest.raises(ValueError):
+            registro.adicionar(Entrega(9, 100, "Rua X"))
+        assert len(registro) == 1
+
+    def test_contagens_acompanham_transicoes(self):
+        """Testa que iniciar e confirmar entregas atualizam as contagens"""
+        registro, entregas = _registro_com(4)
+        entregas[0].iniciar_entrega()
+        entregas[1].iniciar_entrega()
+        entregas[1].confirmar_entrega()
+
+        assert registro.contagens() == {"preparando": 2, "em_transito": 1, "entregue": 1}
+        assert registro.listar("em_transito") == [entregas[0]]
+        assert entregas[1].status == "entregue"
+
+    def test_contar_status_desconhecido(self):
+        """Testa a contagem de um status sem entregas"""
+        registro, _ = _registro_com(1)
+        assert registro.contar("extraviada") == 0
+        assert registro.listar("extraviada") == []
+
+    def test_listar_com_limite(self):
+        """Testa a listagem limitada por status"""
+        registro, _ = _registro_com(10)
+        assert len(registro.listar("preparando", limite=3)) == 3
+
+    def test_iniciar_entregas_em_lote(self):
+        """Testa a transição em lote, ignorando entregas de fora do registro"""
+        registro, entregas = _registro_com(5)
+        avulsa = Entrega(99, 999, "Rua Z")
+
+        assert registro.iniciar_entregas(entregas[:3] + [avulsa]) == 3
+        assert registro.contagens() == {"preparando": 2, "em_transito": 3, "entregue": 0}
+        assert {e.status for e in entregas[:3]} == {"em_transito"}
+        assert avulsa.status == "preparando"
+
+        assert registro.confirmar_entregas(entregas) == 5
+        assert registro.contar("entregue") == 5
+
+    def test_transicionar_por_status(self):
+        """Testa a transição de todas ou parte das entregas de um status"""
+        registro, entregas = _registro_com(10)
+
+        assert registro.transicionar("preparando", "em_transito", limite=4) == 4
+        assert registro.contagens() == {"preparando": 6, "em_transito": 4, "entregue": 0}
+        assert registro.transicionar("preparando", "em_transito") == 6
+        assert registro.contar("em_transito") == 10
+        assert {e.status for e in entregas} == {"em_transito"}
+
+    def test_remover(self):
+        """Testa que a entrega removida sai dos índices e volta a mudar status sozinha"""
+        registro, entregas = _registro_com(2)
+
+        assert registro.remover(entregas[0])
+        assert not registro.remover(entregas[0])
+        entregas[0].iniciar_entrega()
+
+        assert entregas[0].status == "em_transito"
+        assert registro.contagens() == {"preparando": 1, "em_transito": 0, "entregue": 0}
+        assert registro.buscar_por_pedido(100) is None
+
+    def test_transicoes_concorrentes(self):
+        """Testa que transições de várias threads mantêm as contagens consistentes"""
+        registro, entregas = _registro_com(4000)
+
+        def avancar(parte):
+            for entrega in parte:
+                entrega.iniciar_entrega()
+                entrega.confirmar_entrega()
+
+        threads = [threading.Thread(target=avancar, args=(entregas[i::8],)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert registro.contagens() == {"preparando": 0, "em_transito": 0, "entregue": 4000}
@@ -0,0 +1,50 @@
+import pytest
+import threading
+from src.loja_online.sequencia import Sequencia
+
+
+class TestSequencia:
+    def test_ids_sequenciais_na_mesma_thread(self):
+        """Testa que uma única thread recebe ids consecutivos a partir de 1"""
+        sequencia = Sequencia()
+        assert [sequencia.proximo() for _ in range(5)] == [1, 2, 3, 4, 5]
+
+    def test_troca_de_bloco(self):
+        """Testa que a sequência continua ao esgotar o bloco da thread"""
+        sequencia = Sequencia(inicio=10, tamanho_bloco=2)
+        assert [sequencia.proximo() for _ in range(5)] == [10, 11, 12, 13, 14]
+
+    def test_threads_recebem_blocos_distintos(self):
+        """Testa que threads diferentes recebem ids de blocos diferentes"""
+        sequencia = Sequencia(tamanho_bloco=10)
+        ids = []
+
+        def gerar():
+            ids.append(sequencia.proximo())
+
+        thread = threading.Thread(target=gerar)
+        thread.start()
+        thread.join()
+        ids.append(sequencia.proximo())
+
+        assert sorted(ids) == [1, 11]
+
+    def test_ids_unicos_com_muitas_threads(self):
+        """Testa a unicidade dos ids gerados por várias threads simultâneas"""
+        sequencia = Sequencia(tamanho_bloco=8)
+        resultados = [[] for _ in range(20)]
+
+        def gerar(indice):
+            for _ in range(500):
+                resultados[indice].append(sequencia.proximo())
+
+        threads = [threading.Thread(target=gerar, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        ids = [i for lista in resultados for i in lista]
+        assert len(ids) == len(set(ids)) == 20 * 500
+        for lista in resultados:
+            assert lista == sorted(lista)
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+from src.loja_online.loja import Loja
+from src.loja_online.serializacao import (CLIENTE, PEDIDO, PRODUTO, CacheRespostas,
+                                          Serializador)
+
+
+@pytest.fixture
+def loja():
+    loja = Loja()
+    loja.cadastrar_produto(1, "Café Orgânico ☕", 19.9, 100)
+    loja.cadastrar_produto(2, "Mouse", 50.0, 3)
+    loja.cadastrar_cliente(1, "Maria", "maria@email.com")
+    return loja
+
+
+class TestSerializador:
+    def test_serializar_produto(self, loja):
+        """Testa o JSON de um produto"""
+        corpo = PRODUTO.codificar(loja.buscar_produto(1))
+        assert json.loads(corpo) == {"id": 1, "nome": "Café Orgânico ☕", "preco": 19.9, "estoque": 100}
+        assert "☕".encode("utf-8") in corpo
+
+    def test_serializar_pedido_com_itens(self, loja):
+        """Testa o JSON de um pedido com itens aninhados"""
+        pedido = loja.criar_pedido(1)
+        pedido.adicionar_item(loja.buscar_produto(2), 2)
+
+        assert json.loads(PEDIDO.codificar(pedido)) == {
+            "id": pedido.id, "cliente_id": 1, "status": "pendente", "total": 100.0,
+            "itens": [{"produto_id": 2, "quantidade": 2, "preco": 50.0}],
+        }
+
+    def test_serializar_cliente(self, loja):
+        """Testa o JSON de um cliente"""
+        assert json.loads(CLIENTE.codificar(loja.buscar_cliente(1))) == {
+            "id": 1, "nome": "Maria", "email": "maria@email.com",
+            "total_gasto": 0, "quantidade_compras": 0,
+        }
+
+    def test_campo_unico(self, loja):
+        """Testa um serializador com um só campo"""
+        assert json.loads(Serializador(["nome"]).codificar(loja.buscar_produto(2))) == {"nome": "Mouse"}
+
+    def test_estado_muda_com_o_objeto(self, loja):
+        """Testa que o estado serializável acompanha alterações do objeto"""
+        produto = loja.buscar_produto(2)
+        estado = PRODUTO.estado(produto)
+        produto.reduzir_estoque(1)
+        assert PRODUTO.estado(produto) != estado
+
+
+class TestCacheRespostas:
+    def test_reaproveita_corpo_sem_alteracao(self, loja):
+        """Testa que um objeto inalterado devolve o mesmo corpo do cache"""
+        cache = CacheRespostas()
+        produto = loja.buscar_produto(1)
+        corpo, etag = cache.obter(("produto", 1), PRODUTO, produto)
+
+        assert cache.obter(("produto", 1), PRODUTO, produto) == (corpo, etag)
+        assert cache.obter(("produto", 1), PRODUTO, produto)[0] is corpo
+
+    def test_recodifica_quando_objeto_muda(self, loja):
+        """Testa que uma nova versão do objeto gera novo corpo e novo ETag"""
+        cache = CacheRespostas()
+        produto = loja.buscar_produto(1)
+        _, etag = cache.obter(("produto", 1), PRODUTO, produto)
+        produto.preco = 21.0
+
+        corpo, nova_etag = cache.obter(("produto", 1), PRODUTO, produto)
+        assert json.loads(corpo)["preco"] == 21.0
+        assert nova_etag != etag
+
+    def test_etag_estavel_para_o_mesmo_conteudo(self, loja):
+        """Testa que caches distintos geram o mesmo ETag para o mesmo conteúdo"""
+        produto = loja.buscar_produto(1)
+        assert CacheRespostas().obter(1, PRODUTO, produto)[1] == \
+            CacheRespostas().obter(1, PRODUTO, produto)[1]
+
+    def test_lista_reaproveita_itens(self, loja):
+        """Testa que listas são montadas com os corpos de cada objeto"""
+        cache = CacheRespostas()
+        produtos = loja.estoque.listar_produtos()
+        corpo, _ = cache.obter_lista("produto", PRODUTO, produtos)
+
+        assert [p["id"] for p in json.loads(corpo)] == [1, 2]
+        assert len(cache) == 2
+
+    def test_limite_de_tamanho(self, loja):
+        """Testa que o cache descarta as entradas menos usadas"""
+        cache = CacheRespostas(tamanho=1)
+        cache.obter(1, PRODUTO, loja.buscar_produto(1))
+        cache.obter(2, PRODUTO, loja.buscar_produto(2))
+
+        assert len(cache) == 1
+
+    def test_invalidar(self, loja):
+        """Testa a remoção explícita de uma entrada"""
+        cache = CacheRespostas()
+        cache.obter(1, PRODUTO, loja.buscar_produto(1))
+        cache.invalidar(1)
+        cache.invalidar(1)
+
+        assert len(cache) == 0
@@ -0,0 +1,116 @@
+import pytest
+from src.loja_online import snapshot
+from src.loja_online.catalogo_colunar import CatalogoColunar
+from src.loja_online.loja import Loja
+
+
+def _loja_de_exemplo():
+    loja = Loja()
+    loja.cadastrar_produto(1, "Notebook", 3000.0).definir_estoque(5)
+    loja.cadastrar_produto(2, "Café Orgânico ☕", 19.9).definir_estoque(100)
+    loja.cadastrar_produto(3, "", 0.5)
+    cliente = loja.cadastrar_cliente(1, "Maria Eduarda", "maria@email.com")
+    loja.cadastrar_cliente(2, "João", "joao@email.com")
+
+    pedido = loja.criar_pedido(1)
+    pedido.adicionar_item(loja.buscar_produto(1), 1)
+    pedido.adicionar_item(loja.buscar_produto(2), 3)
+    pedido.confirmar_pedido()
+    cliente.adicionar_compra(pedido)
+
+    cancelado = loja.criar_pedido(1)
+    cancelado.adicionar_item(loja.buscar_produto(2), 1)
+    cliente.adicionar_compra(cancelado)
+    cancelado.cancelar_pedido()
+
+    loja.criar_pedido(2)
+    return loja
+
+
+class TestSnapshot:
+    def test_salvar_e_carregar_produtos(self, tmp_path):
+        """Testa que produtos e estoque sobrevivem ao snapshot"""
+        caminho = tmp_path / "loja.snap"
+        _loja_de_exemplo().salvar_snapshot(caminho)
+
+        loja = Loja.carregar_snapshot(caminho)
+
+        assert [(p.id, p.nome, p.preco, p.estoque) for p in loja.estoque.listar_produtos()] == [
+            (1, "Notebook", 3000.0, 5),
+            (2, "Café Orgânico ☕", 19.9, 100),
+            (3, "", 0.5, 0),
+        ]
+
+    def test_salvar_e_carregar_clientes_e_pedidos(self, tmp_path):
+        """Testa que clientes, pedidos e históricos sobrevivem ao snapshot"""
+        caminho = tmp_path / "loja.snap"
+        _loja_de_exemplo().salvar_snapshot(caminho)
+
+        loja = Loja.carregar_snapshot(caminho)
+        cliente = loja.buscar_cliente(1)
+        pedido = loja.pedidos[1]
+
+        assert cliente.email == "maria@email.com"
+        assert [compra.id for compra in cliente.historico] == [1, 2]
+        assert cliente.obter_total_gasto() == pytest.approx(3059.7)
+        assert cliente.quantidade_compras == 1
+        assert pedido.status == "confirmado"
+        assert pedido.total == pytest.approx(3059.7)
+        assert pedido.itens[1].produto is loja.buscar_produto(2)
+        assert pedido.itens[1].quantidade == 3
+        assert loja.pedidos[2].status == "cancelado"
+        assert loja.pedidos[3].itens == []
+
+    def test_ids_de_pedido_continuam_apos_carregar(self, tmp_path):
+        """Testa que novos pedidos não reutilizam ids do snapshot"""
+        caminho = tmp_path / "loja.snap"
+        _loja_de_exemplo().salvar_snapshot(caminho)
+
+        loja = Loja.carregar_snapshot(caminho)
+
+        assert loja.criar_pedido(1).id == 4
+
+    def test_carregar_em_catalogo_colunar(self, tmp_path):
+        """Testa o carregamento do snapshot em um catálogo colunar"""
+        caminho = tmp_path / "loja.snap"
+        _loja_de_exemplo().salvar_snapshot(caminho)
+
+        loja = Loja.carregar_snapshot(caminho, CatalogoColunar())
+
+        assert isinstance(loja.produtos, CatalogoColunar)
+        assert loja.buscar_produto(2).estoque == 100
+
+    def test_snapshot_em_varios_blocos(self, tmp_path, monkeypatch):
+        """Testa snapshots maiores que um bloco de escrita"""
+        monkeypatch.setattr(snapshot, "TAMANHO_BLOCO", 7)
+        loja = Loja()
+        loja.cadastrar_produtos_em_lote((i + 1, f"Produto {i + 1}", float(i), i) for i in range(50))
+        for i in range(20):
+            loja.cadastrar_cliente(i + 1, f"Cliente {i + 1}", f"c{i}@email.com")
+            loja.criar_pedido(i + 1).adicionar_item(loja.buscar_produto(i + 1), i + 1)
+        caminho = tmp_path / "loja.snap"
+        loja.salvar_snapshot(caminho)
+
+        carregada = Loja.carregar_snapshot(caminho)
+
+        assert len(carregada.produtos) == 50
+        assert carregada.buscar_produto(50).nome == "Produto 50"
+        assert len(carregada.clientes) == 20
+        assert carregada.pedidos[20].total == 19.0 * 20
+
+    def test_sobrescreve_snapshot_sem_arquivo_temporario(self, tmp_path):
+        """Testa que salvar substitui o arquivo anterior por inteiro"""
+        caminho = tmp_path / "loja.snap"
+        _loja_de_exemplo().salvar_snapshot(caminho)
+        Loja().salvar_snapshot(caminho)
+
+        assert len(Loja.carregar_snapshot(caminho).produtos) == 0
+        assert [p.name for p in tmp_path.iterdir()] == ["loja.snap"]
+
+    def test_arquivo_invalido(self, tmp_path):
+        """Testa o erro ao carregar um arquivo que não é um snapshot"""
+        caminho = tmp_path / "loja.snap"
+        caminho.write_bytes(b"nao e um snapshot")
+
+        with pytest.raises(ValueError):
+            Loja.carregar_snapshot(caminho)
@@ -0,0 +1,19 @@
+import pytest
+from src.loja_online.entrega import Entrega
+from src.loja_online.transportadora import Transportadora, TransportadoraSimulada
+
+
+class TestTransportadora:
+    def test_interface_exige_despachar(self):
+        """Testa que a interface base não implementa o despacho"""
+        with pytest.raises(NotImplementedError):
+            Transportadora().despachar("013", [Entrega(1, 1, "Rua A, 1")])
+
+    def test_simulada_conta_chamadas_e_entregas(self):
+        """Testa que a transportadora simulada conta chamadas e entregas coletadas"""
+        transportadora = TransportadoraSimulada()
+        transportadora.despachar("013", [Entrega(i, i, "Rua A, 1") for i in range(3)])
+        transportadora.despachar("200", [Entrega(9, 9, "Rua B, 2")])
+
+        assert transportadora.chamadas == 2
+        assert transportadora.despachadas == 4
@@ -0,0 +1,105 @@
+import errno
+import threading
+import zlib
+
+import pytest
+from src.loja_online import travas as modulo_travas
+from src.loja_online.travas import TravasEntreProcessos, TravasListradas
+
+
+class TestTravasListradas:
+    def test_mesma_chave_mesma_trava(self):
+        """Testa que a mesma chave sempre usa a mesma trava"""
+        travas = TravasListradas(16)
+        assert travas.trava(42) is travas.trava(42)
+
+    def test_chaves_vizinhas_travas_distintas(self):
+        """Testa que ids sequenciais caem em listras diferentes"""
+        travas = TravasListradas(16)
+        assert travas.trava(1) is not travas.trava(2)
+
+    def test_indice_dentro_do_intervalo(self):
+        """Testa que o índice da listra fica dentro da quantidade de travas"""
+        travas = TravasListradas(16)
+        for chave in range(100):
+            assert 0 <= travas.indice(chave) < 16
+
+    def test_trava_reentrante(self):
+        """Testa que a mesma thread pode adquirir a trava mais de uma vez"""
+        travas = TravasListradas(4)
+        with travas.trava(1):
+            with travas.trava(1):
+                assert True
+
+    def test_travas_ordenadas_sem_repeticao(self):
+        """Testa que travas de várias chaves vêm ordenadas e sem duplicatas"""
+        travas = TravasListradas(4)
+        ordenadas = travas.travas_ordenadas([5, 1, 9, 2])
+
+        assert len(ordenadas) == 2
+        assert ordenadas == [travas.trava(1), travas.trava(2)]
+
+
+class TestTravasEntreProcessos:
+    def test_indice_estavel_para_textos(self, tmp_path):
+        """Testa que o índice de chaves textuais não depende do hash do processo"""
+        travas = TravasEntreProcessos(str(tmp_path / "travas"), 16)
+        assert travas.indice("abc") == zlib.crc32(b"abc") % 16
+        assert travas.indice(17) == 1
+        travas.fechar()
+
+    def test_trava_reentrante(self, tmp_path):
+        """Testa que a mesma thread pode adquirir a trava entre processos mais de uma vez"""
+        travas = TravasEntreProcessos(str(tmp_path / "travas"), 4)
+        with travas.trava(1):
+            with travas.trava(1):
+                assert True
+        travas.fechar()
+
+    def test_trava_global_fora_das_listras(self, tmp_path):
+        """Testa que a trava global não coincide com nenhuma listra"""
+        travas = TravasEntreProcessos(str(tmp_path / "travas"), 4)
+        assert all(travas.trava(chave) is not travas.trava_global for chave in range(8))
+        travas.fechar()
+
+    def test_falha_no_fcntl_libera_a_trava_local(self, tmp_path, monkeypatch):
+        """Testa que uma falha ao travar o arquivo não deixa a trava do processo presa"""
+        travas = TravasEntreProcessos(str(tmp_path / "travas"), 4)
+
+        def falhar(*argumentos):
+            raise OSError(errno.EDEADLK, "Resource deadlock avoided")
+
+        with monkeypatch.context() as contexto:
+            contexto.setattr(modulo_travas.fcntl, "lockf", falhar)
+            with pytest.raises(OSError):
+                travas.trava(1).acquire()
+
+        adquiridas = []
+        thread = threading.Thread(target=lambda: adquiridas.append(travas.trava(2).acquire() or True))
+        thread.start()
+        thread.join(timeout=5)
+        assert adquiridas == [True]
+        travas.fechar()
+
+    def test_uma_thread_por_processo_nas_listras(self, tmp_path):
+        """Testa que listras diferentes se excluem entre threads do mesmo processo"""
+        travas = TravasEntreProcessos(str(tmp_path / "travas"), 4)
+        liberar = threading.Event()
+        adquiridas = []
+
+        def segurar():
+            with travas.trava(1):
+                liberar.wait()
+
+        dona = threading.Thread(target=segurar)
+        dona.start()
+        outra = threading.Thread(target=lambda: adquiridas.append(travas.trava(2).acquire() or True))
+        outra.start()
+        outra.join(timeout=0.2)
+        assert adquiridas == []
+
+        liberar.set()
+        dona.join()
+        outra.join(timeout=5)
+        assert adquiridas == [True]
+        travas.fechar()
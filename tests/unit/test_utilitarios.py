@@ -1,9 +1,31 @@
 import pytest
+from src.loja_online import utilitarios
 from src.loja_online.utilitarios import Utilitarios
 
 
+@pytest.fixture(params=["numpy", "python"])
+def caminho_descontos(request, monkeypatch):
+    if request.param == "numpy" and utilitarios.np is None:
+        pytest.skip("NumPy não instalado")
+    if request.param == "python":
+        monkeypatch.setattr(utilitarios, "np", None)
+    return request.param
+
+
 class TestUtilitarios:
 
+    def test_gerar_id_unico(self):
+        """Testa que ids gerados em sequência são distintos e ordenados"""
+        primeiro = Utilitarios.gerar_id()
+        segundo = Utilitarios.gerar_id()
+        assert primeiro != segundo
+        assert primeiro < segundo
+
+    def test_gerar_ids_em_lote(self):
+        """Testa a geração de ids em lote"""
+        ids = Utilitarios.gerar_ids(100)
+        assert len(set(ids)) == 100
+
     def test_formatar_preco(self):
         """Testa a formatação de preço"""
         preco_formatado = Utilitarios.formatar_preco(1000.50)
@@ -44,3 +66,38 @@ class TestUtilitarios:
         """Testa a aplicação de 100% de desconto"""
         valor_final = Utilitarios.aplicar_desconto(500, 100)
         assert valor_final == 0.0
+
+    def test_calcular_descontos_em_lote(self):
+        """Testa o cálculo de descontos para vários preços e porcentagens"""
+        descontos = Utilitarios.calcular_descontos([1000, 500, 19.99], [10, 0, 15])
+        assert descontos == [100.0, 0.0, 3.0]
+
+    def test_aplicar_descontos_porcentagem_unica(self):
+        """Testa a aplicação da mesma porcentagem a vários preços"""
+        precos = Utilitarios.aplicar_descontos([1000, 500, 0.1], 20)
+        assert precos == [800.0, 400.0, 0.08]
+
+    def test_aplicar_descontos_em_centavos(self):
+        """Testa que os descontos em lote não acumulam erro de ponto flutuante"""
+        precos = Utilitarios.aplicar_descontos([0.1] * 3 + [33.33], [33.3, 10, 50, 33.33])
+        assert precos == [0.07, 0.09, 0.05, 22.22]
+
+    def test_aplicar_descontos_completo(self):
+        """Testa a aplicação de 100% de desconto em lote"""
+        assert Utilitarios.aplicar_descontos([500, 12.34], 100) == [0.0, 0.0]
+
+    def test_descontos_tamanhos_diferentes(self):
+        """Testa o erro quando preços e porcentagens têm tamanhos diferentes"""
+        with pytest.raises(ValueError):
+            Utilitarios.aplicar_descontos([100, 200], [10, 20, 30])
+
+    def test_descontos_sem_difusao_de_porcentagens(self, caminho_descontos):
+        """Testa que uma lista com uma única porcentagem não é repetida para todos os preços"""
+        with pytest.raises(ValueError):
+            Utilitarios.aplicar_descontos([10.0, 19.99], [10])
+
+    def test_descontos_com_geradores(self, caminho_descontos):
+        """Testa que preços e porcentagens podem vir de geradores"""
+        precos = Utilitarios.aplicar_descontos((preco for preco in [10.0, 19.99]), (p for p in [10, 15]))
+        assert precos == [9.0, 16.99]
+        assert Utilitarios.calcular_descontos((preco for preco in [10.0, 19.99]), 10) == [1.0, 2.0]